@@ -3,7 +3,11 @@
 # MP-3000 LV1 GUI (22–30 GHz)
 # ------------------------------------------------------------
 # What this app does:
-#   1) Preprocess: converts messy *_lv1.xlsx or *_lv1.csv -> *_lv1_clean.xlsx
+#   1) Preprocess: converts messy *_lv1.xlsx or *_lv1.csv -> *_lv1_clean.parquet
+#      (optional *_lv1_clean.xlsx export for spreadsheet users)
+#      - first file only, or every file in the folder (cleaned in
+#        parallel, unchanged files reused from the clean cache),
+#        browsable day by day
 #   2) Plot controls using CLEAN data
 #   3) Optional: Add synthetic RFI source (plot only)
 #      - Source classes:
@@ -18,6 +22,8 @@
 # Notes:
 #   - Your LV1 "TB" behaves like received power -> RFI is added (sums).
 #   - The synthetic RFI is only applied to the plot, never saved to disk.
+#   - Cleaning and plot preparation run on a worker thread; only the
+#     final canvas draw happens on the Tk thread.
 # ============================================================
 
 from __future__ import annotations
@@ -26,14 +32,21 @@ from __future__ import annotations
 import os
 import re
 import glob
+import json
+import multiprocessing
+import queue
+import threading
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from tkinter import ttk, filedialog, messagebox
-from typing import TYPE_CHECKING, Any, Optional, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeAlias
 
 # Numerical / plotting libraries
 import numpy as np
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 # pandas is optional at import time so the script can show a GUI error
 # instead of crashing immediately if pandas is not installed.
@@ -63,7 +76,11 @@ FREQ_MAX_GHZ = 30.0
 # Tolerance when filtering rows by Az/El direction
 DIRECTION_ATOL_DEG = 1e-3
 
+# Day selector entry that shows every loaded day
+ALL_DAYS = "(all days)"
+
 # Available synthetic RFI classes shown in the GUI
+# (same order as rich_rfi.RFI_SOURCE_CLASSES)
 RFI_SOURCE_OPTIONS = [
     "5G",
     "Radar Systems",
@@ -88,11 +105,6 @@ def require_pandas() -> bool:
     return True
 
 
-def _clip(x: float, lo: float, hi: float) -> float:
-    # Clip a value into a valid numeric range.
-    return float(np.clip(x, lo, hi))
-
-
 def _is_excel_temp_file(path: str) -> bool:
     # Ignore temporary Excel files that start with "~$"
     return os.path.basename(path).startswith("~$")
@@ -120,26 +132,6 @@ def _find_datetime_col(df: DataFrame) -> str:
     raise ValueError("Could not find a Date/Time column in the file.")
 
 
-def _estimate_dt_seconds(dt_series) -> float:
-    # Estimate the median time step between samples in seconds.
-    # This is important for pulse width and repetition modeling.
-    try:
-        t = pd.to_datetime(dt_series, errors="coerce") if pd is not None else dt_series
-        t = np.asarray(t)
-        if len(t) < 2:
-            return 1.0
-        tsec = (t - t[0]) / np.timedelta64(1, "s")
-        tsec = np.asarray(tsec, dtype=float)
-        d = np.diff(tsec)
-        d = d[np.isfinite(d)]
-        if d.size == 0:
-            return 1.0
-        med = float(np.nanmedian(d))
-        return med if (np.isfinite(med) and med > 0) else 1.0
-    except Exception:
-        return 1.0
-
-
 def _safe_float(value: str, default: float = 0.0) -> float:
     # Convert GUI text to float safely.
     try:
@@ -148,29 +140,6 @@ def _safe_float(value: str, default: float = 0.0) -> float:
         return default
 
 
-def _ang_diff_deg(a: float, b: float) -> float:
-    # Return the smallest angular difference between two angles in degrees.
-    d = abs(a - b) % 360.0
-    return min(d, 360.0 - d)
-
-
-def _angular_coupling(
-    pointing_az_deg: float,
-    pointing_el_deg: float,
-    source_az_deg: float,
-    source_el_deg: float,
-    sigma_deg: float
-) -> float:
-    # Compute how strongly the RFI source couples into the radiometer
-    # based on angular mismatch between radiometer pointing and source direction.
-    # Smaller sigma -> more directional source.
-    sigma_deg = max(0.5, float(sigma_deg))
-    d_az = _ang_diff_deg(pointing_az_deg, source_az_deg)
-    d_el = abs(pointing_el_deg - source_el_deg)
-    d2 = d_az**2 + d_el**2
-    return float(np.exp(-0.5 * d2 / (sigma_deg**2)))
-
-
 # ============================================================
 # 3) FILE DISCOVERY + CLEANING
 # ============================================================
@@ -212,6 +181,51 @@ def find_first_radiometer_file(data_dir: str) -> str:
     raise FileNotFoundError("No .xlsx or .csv files found in the selected folder.")
 
 
+def _clean_artifact_ext() -> str:
+    # Clean files are stored as Parquet (fast binary, keeps dtypes).
+    # Without pyarrow, fall back to pandas' own pickle format.
+    try:
+        import pyarrow  # noqa: F401
+        return ".parquet"
+    except ImportError:
+        return ".pkl"
+
+
+def _finish_clean_df(df: DataFrame) -> DataFrame:
+    # Final step shared by every way of getting clean data:
+    # sort by time and renumber rows.
+    df = df.sort_values("Date/Time", kind="stable")
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+def save_clean_df(df: DataFrame, path: str) -> None:
+    # Write a clean dataframe; the format comes from the file extension.
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        df.to_parquet(path, index=False)
+    elif ext == ".pkl":
+        df.to_pickle(path)
+    elif ext == ".xlsx":
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Unsupported clean file type: {ext}")
+
+
+def load_clean_file(path: str) -> DataFrame:
+    # Load a clean file written by save_clean_df (Parquet / pickle),
+    # or an older clean Excel file.
+    if pd is None:
+        raise ImportError("pandas is required to load clean files.")
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        return _finish_clean_df(pd.read_parquet(path))
+    if ext == ".pkl":
+        return _finish_clean_df(pd.read_pickle(path))
+    return load_clean_xlsx(path)
+
+
 def load_clean_xlsx(path: str) -> DataFrame:
     # Load an already-clean Excel file and convert all non-time columns to numeric.
     if pd is None:
@@ -230,9 +244,7 @@ def load_clean_xlsx(path: str) -> DataFrame:
         if col != "Date/Time":
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    df.sort_values("Date/Time", inplace=True)
-    df.reset_index(drop=True, inplace=True)
-    return df
+    return _finish_clean_df(df)
 
 
 def extract_channels_from_clean(df: DataFrame) -> tuple[list[str], np.ndarray]:
@@ -295,13 +307,12 @@ def _read_lv1_table_any(input_path: str, header_guess: int) -> DataFrame:
     return _normalize_cols(df)
 
 
-def clean_lv1_to_clean_xlsx(
+def clean_lv1_to_df(
     input_path: str,
-    output_xlsx: str,
     fmin: float = FREQ_MIN_GHZ,
     fmax: float = FREQ_MAX_GHZ
-) -> None:
-    # Convert a raw LV1 file into a clean Excel file.
+) -> DataFrame:
+    # Convert a raw LV1 file into a clean dataframe (kept in memory).
     #
     # Main steps:
     #   1) read the original file
@@ -388,474 +399,685 @@ def clean_lv1_to_clean_xlsx(
     chan_names = list(rename_map.values())
     out = out.dropna(subset=chan_names, how="all")
 
-    # Save output as clean Excel file.
-    out.to_excel(output_xlsx, index=False)
+    return _finish_clean_df(out)
+
+
+def clean_lv1_to_clean_xlsx(
+    input_path: str,
+    output_xlsx: str,
+    fmin: float = FREQ_MIN_GHZ,
+    fmax: float = FREQ_MAX_GHZ
+) -> None:
+    # Convert a raw LV1 file into a clean Excel file (optional export).
+    clean_lv1_to_df(input_path, fmin, fmax).to_excel(output_xlsx, index=False)
 
 
-def clean_first_file_only(data_dir: str, out_dir: str) -> tuple[str, str]:
+def clean_first_file_only(
+    data_dir: str,
+    out_dir: str,
+    export_xlsx: bool = False
+) -> tuple[str, str, DataFrame]:
     # Clean only the first file found in the selected data folder.
+    #
+    # Returns the input path, the clean file path and the clean
+    # dataframe itself, so the caller does not need to read it back.
     os.makedirs(out_dir, exist_ok=True)
 
     first = find_first_radiometer_file(data_dir)
     base = os.path.basename(first)
     stem, _ext = os.path.splitext(base)
 
-    out_name = f"{stem}_clean.xlsx"
-    out_path = os.path.join(out_dir, out_name)
+    out_path = os.path.join(out_dir, f"{stem}_clean{_clean_artifact_ext()}")
+
+    clean_df = clean_lv1_to_df(first)
+    save_clean_df(clean_df, out_path)
+
+    # Excel is only an extra copy for people who want a spreadsheet.
+    if export_xlsx:
+        save_clean_df(clean_df, os.path.join(out_dir, f"{stem}_clean.xlsx"))
+
+    return first, out_path, clean_df
+
 
-    clean_lv1_to_clean_xlsx(first, out_path)
-    return first, out_path
+def find_radiometer_files(data_dir: str) -> list[str]:
+    # All usable radiometer files in the folder, sorted by name.
+    # Same preference as find_first_radiometer_file: *_lv1 files if
+    # there are any, otherwise every .xlsx/.csv. When a day exists as
+    # both .xlsx and .csv, the .xlsx is used.
+    if not os.path.isdir(data_dir):
+        raise FileNotFoundError("Selected data folder does not exist.")
+
+    def usable(paths: list[str]) -> list[str]:
+        return [
+            p for p in paths
+            if (not _is_excel_temp_file(p))
+            and (not p.lower().endswith(("_clean.xlsx", "_clean.csv")))
+        ]
+
+    for pattern in ("*_lv1", "*"):
+        by_stem: dict[str, str] = {}
+        for ext in (".csv", ".xlsx"):
+            for p in usable(glob.glob(os.path.join(data_dir, pattern + ext))):
+                by_stem[os.path.splitext(os.path.basename(p))[0]] = p
+        if by_stem:
+            return [by_stem[stem] for stem in sorted(by_stem)]
+
+    raise FileNotFoundError("No .xlsx or .csv files found in the selected folder.")
+
+
+# Per-file clean cache: out_dir/clean_manifest.json remembers the size
+# and mtime of every raw file that was cleaned, so unchanged files are
+# loaded from their clean artifact instead of being cleaned again.
+CLEAN_MANIFEST = "clean_manifest.json"
+
+
+def _load_clean_manifest(out_dir: str) -> dict[str, dict[str, Any]]:
+    path = os.path.join(out_dir, CLEAN_MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_clean_manifest(manifest: dict[str, dict[str, Any]], out_dir: str) -> None:
+    path = os.path.join(out_dir, CLEAN_MANIFEST)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _clean_is_current(in_path: str, manifest: dict[str, dict[str, Any]], out_dir: str) -> bool:
+    entry = manifest.get(os.path.basename(in_path))
+    if entry is None or not os.path.exists(os.path.join(out_dir, entry["clean"])):
+        return False
+    info = os.stat(in_path)
+    return entry["size"] == info.st_size and entry["mtime_ns"] == info.st_mtime_ns
+
+
+def _clean_file_to_cache(in_path: str, out_dir: str, export_xlsx: bool) -> tuple[str, dict[str, Any], DataFrame]:
+    # Clean one raw file and write its artifact (runs in a worker process).
+    stem = os.path.splitext(os.path.basename(in_path))[0]
+    clean_name = f"{stem}_clean{_clean_artifact_ext()}"
+
+    clean_df = clean_lv1_to_df(in_path)
+    save_clean_df(clean_df, os.path.join(out_dir, clean_name))
+    if export_xlsx:
+        save_clean_df(clean_df, os.path.join(out_dir, f"{stem}_clean.xlsx"))
+
+    info = os.stat(in_path)
+    entry = {"clean": clean_name, "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+    return in_path, entry, clean_df
+
+
+def clean_all_files(
+    data_dir: str,
+    out_dir: str,
+    export_xlsx: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+    job: Optional["BackgroundJob"] = None
+) -> tuple[DataFrame, list[dict[str, Any]]]:
+    # Clean every radiometer file in the folder and join them.
+    #
+    # New or changed files are cleaned concurrently in worker
+    # processes; unchanged files come from the clean cache.
+    # Returns one time-sorted dataframe and a report with one entry
+    # per file ({"input", "clean", "cached"}).
+    #
+    # If `job` is cancelled, pending files are dropped and JobCancelled
+    # is raised after each finished file; the manifest is still saved,
+    # so files cleaned so far are reused by the next run.
+    if pd is None:
+        raise ImportError("pandas is required to clean files.")
+    os.makedirs(out_dir, exist_ok=True)
+
+    files = find_radiometer_files(data_dir)
+    manifest = _load_clean_manifest(out_dir)
+
+    frames: dict[str, DataFrame] = {}
+    cached = {p for p in files if _clean_is_current(p, manifest, out_dir)}
+    todo = [p for p in files if p not in cached]
+
+    for p in sorted(cached):
+        frames[p] = load_clean_file(os.path.join(out_dir, manifest[os.path.basename(p)]["clean"]))
+
+    def check_cancelled() -> None:
+        if job is not None:
+            job.check_cancelled()
+
+    def record(in_path: str, entry: dict[str, Any], clean_df: DataFrame) -> None:
+        manifest[os.path.basename(in_path)] = entry
+        frames[in_path] = clean_df
+        if progress is not None:
+            progress(f"cleaned {os.path.basename(in_path)} ({len(frames)}/{len(files)})")
+        check_cancelled()
+
+    try:
+        if workers == 1 or len(todo) <= 1:
+            for p in todo:
+                check_cancelled()
+                record(*_clean_file_to_cache(p, out_dir, export_xlsx))
+        else:
+            # "spawn" so the children never inherit the GUI's threads
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+                futures = [executor.submit(_clean_file_to_cache, p, out_dir, export_xlsx) for p in todo]
+                try:
+                    for future in as_completed(futures):
+                        record(*future.result())
+                except JobCancelled:
+                    # Drop files not started yet; running ones finish
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+    finally:
+        # Keep what was cleaned, even when cancelled
+        _save_clean_manifest(manifest, out_dir)
+
+    report = [
+        {
+            "input": p,
+            "clean": os.path.join(out_dir, manifest[os.path.basename(p)]["clean"]),
+            "cached": p in cached,
+        }
+        for p in files
+    ]
+    clean_df = _finish_clean_df(pd.concat([frames[p] for p in files], ignore_index=True))
+    return clean_df, report
+
+
+def clean_days(df: DataFrame) -> list[str]:
+    # Dates (YYYY-MM-DD) present in a clean dataframe.
+    if "Date/Time" not in df.columns or df.empty:
+        return []
+    days = df["Date/Time"].dropna().dt.normalize().unique()
+    return [pd.Timestamp(d).strftime("%Y-%m-%d") for d in sorted(days)]
 
 
 # ============================================================
 # 4) SOURCE MODEL
 # ============================================================
+# The RFI source model (class table, spectral shapes, time envelopes,
+# coupling) lives in src/models/rich_rfi.py so the batch pipeline can
+# use it without Tk or matplotlib; the GUI only samples one source and
+# applies it to the selected pointing (see apply_rfi_for_plot).
 
-def sample_rfi_source(rng: np.random.Generator, source_class: str) -> dict[str, Any]:
-    # Generate one random synthetic RFI source.
-    #
-    # Each source class uses different parameter ranges:
-    #   - frequency center / bandwidth
-    #   - temporal activity
-    #   - power
-    #   - directionality / distance
-    source_class = source_class.strip()
-
-    # Generic defaults in case a class does not override all values.
-    spectral_shape = "gaussian"
-    modulation_scheme = "continuous"
-    emission_type = "intentional"
-    propagation_path = "line_of_sight"
-    polarization_type = str(rng.choice(["linear-horizontal", "linear-vertical", "circular", "elliptical"]))
-    licensed = True
-    compliance = "unknown"
-
-    center_ghz = 26.0
-    bandwidth_mhz = 100.0
-    duty_cycle = 0.3
-    pulse_width_s = 1.0
-    repetition_rate_hz = 0.5
-    avg_power_K = 200.0
-    peak_power_K = 500.0
-    rfi_az_deg = float(rng.uniform(0.0, 360.0))
-    rfi_el_deg = float(rng.uniform(0.0, 90.0))
-    angular_sigma_deg = 12.0
-    distance_km = 1.0
-    antenna_gain_factor = 1.0
-    polarization_factor = float(_clip(rng.normal(loc=0.72, scale=0.22), 0.08, 1.0))
-
-    # 5G source: wide, structured, OFDM-like, bursty/moderate.
-    if source_class == "5G":
-        spectral_shape = str(rng.choice(["ofdm_like", "flat", "spiky"], p=[0.65, 0.20, 0.15]))
-        modulation_scheme = str(rng.choice(["OFDM", "bursty-OFDM", "QAM-OFDM"], p=[0.45, 0.35, 0.20]))
-        emission_type = str(rng.choice(["intentional", "spurious"], p=[0.85, 0.15]))
-        propagation_path = str(rng.choice(["line_of_sight", "reflected", "scattered"], p=[0.65, 0.25, 0.10]))
-        licensed = True
-        compliance = str(rng.choice(["compliant", "partially-compliant", "unknown"], p=[0.70, 0.20, 0.10]))
-
-        center_ghz = float(_clip(rng.normal(loc=27.8, scale=0.8), 23.0, 29.5))
-        bandwidth_mhz = float(rng.choice([50, 100, 200, 400]))
-        duty_cycle = float(_clip(rng.normal(loc=0.28, scale=0.14), 0.03, 0.95))
-        pulse_width_s = float(_clip(rng.lognormal(mean=np.log(0.8), sigma=0.7), 0.05, 8.0))
-        repetition_rate_hz = float(_clip(rng.normal(loc=0.4, scale=0.22), 0.02, 3.0))
-        avg_power_K = float(_clip(rng.normal(loc=260.0, scale=120.0), 40.0, 1500.0))
-        peak_power_K = float(_clip(avg_power_K * rng.uniform(1.4, 3.5), avg_power_K, 3500.0))
-        angular_sigma_deg = float(_clip(rng.normal(loc=12.0, scale=5.0), 2.0, 40.0))
-        distance_km = float(_clip(rng.lognormal(mean=np.log(1.2), sigma=0.9), 0.05, 25.0))
-        antenna_gain_factor = float(_clip(rng.normal(loc=1.0, scale=0.35), 0.2, 2.2))
-
-    # Radar: narrow / pulsed / high peak power / directional.
-    elif source_class == "Radar Systems":
-        spectral_shape = str(rng.choice(["spiky", "gaussian"], p=[0.65, 0.35]))
-        modulation_scheme = str(rng.choice(["pulsed", "pulse-train", "chirp-like"], p=[0.45, 0.40, 0.15]))
-        emission_type = "intentional"
-        propagation_path = str(rng.choice(["line_of_sight", "reflected"], p=[0.78, 0.22]))
-        licensed = True
-        compliance = str(rng.choice(["compliant", "unknown", "partially-compliant"], p=[0.55, 0.25, 0.20]))
-
-        center_ghz = float(_clip(rng.normal(loc=25.5, scale=2.0), 22.1, 29.8))
-        bandwidth_mhz = float(rng.choice([10, 20, 40, 80, 120]))
-        duty_cycle = float(_clip(rng.normal(loc=0.10, scale=0.08), 0.005, 0.50))
-        pulse_width_s = float(_clip(rng.lognormal(mean=np.log(0.08), sigma=0.9), 0.005, 1.0))
-        repetition_rate_hz = float(_clip(rng.normal(loc=4.0, scale=2.5), 0.2, 20.0))
-        avg_power_K = float(_clip(rng.normal(loc=180.0, scale=100.0), 20.0, 1200.0))
-        peak_power_K = float(_clip(avg_power_K * rng.uniform(4.0, 12.0), avg_power_K, 5000.0))
-        angular_sigma_deg = float(_clip(rng.normal(loc=5.0, scale=2.5), 0.8, 12.0))
-        distance_km = float(_clip(rng.lognormal(mean=np.log(3.0), sigma=0.9), 0.2, 60.0))
-        antenna_gain_factor = float(_clip(rng.normal(loc=1.35, scale=0.45), 0.3, 3.0))
-
-    # Broadcast: more stable, almost continuous, flatter spectrum.
-    elif source_class == "Broadcast Services":
-        spectral_shape = str(rng.choice(["flat", "gaussian"], p=[0.65, 0.35]))
-        modulation_scheme = str(rng.choice(["continuous", "am-like", "fm-like"], p=[0.60, 0.20, 0.20]))
-        emission_type = str(rng.choice(["intentional", "spurious"], p=[0.75, 0.25]))
-        propagation_path = str(rng.choice(["line_of_sight", "reflected", "scattered"], p=[0.50, 0.30, 0.20]))
-        licensed = True
-        compliance = str(rng.choice(["compliant", "partially-compliant", "unknown"], p=[0.65, 0.20, 0.15]))
-
-        center_ghz = float(_clip(rng.normal(loc=24.5, scale=2.2), 22.0, 30.0))
-        bandwidth_mhz = float(rng.choice([6, 8, 20, 40, 80]))
-        duty_cycle = float(_clip(rng.normal(loc=0.85, scale=0.12), 0.20, 1.00))
-        pulse_width_s = float(_clip(rng.lognormal(mean=np.log(2.5), sigma=0.5), 0.2, 15.0))
-        repetition_rate_hz = float(_clip(rng.normal(loc=0.15, scale=0.08), 0.01, 1.0))
-        avg_power_K = float(_clip(rng.normal(loc=140.0, scale=70.0), 15.0, 900.0))
-        peak_power_K = float(_clip(avg_power_K * rng.uniform(1.1, 1.8), avg_power_K, 1800.0))
-        angular_sigma_deg = float(_clip(rng.normal(loc=18.0, scale=6.0), 4.0, 45.0))
-        distance_km = float(_clip(rng.lognormal(mean=np.log(6.0), sigma=1.0), 0.5, 120.0))
-        antenna_gain_factor = float(_clip(rng.normal(loc=0.95, scale=0.25), 0.2, 1.8))
-
-    # ISM: can be bursty / nearby / irregular.
-    elif source_class == "ISM Equipment":
-        spectral_shape = str(rng.choice(["flat", "spiky", "gaussian"], p=[0.45, 0.35, 0.20]))
-        modulation_scheme = str(rng.choice(["continuous", "bursty", "frequency-hopping-like"], p=[0.30, 0.45, 0.25]))
-        emission_type = str(rng.choice(["intentional", "spurious"], p=[0.60, 0.40]))
-        propagation_path = str(rng.choice(["line_of_sight", "reflected", "scattered"], p=[0.45, 0.35, 0.20]))
-        licensed = False
-        compliance = str(rng.choice(["unknown", "partially-compliant", "compliant"], p=[0.45, 0.35, 0.20]))
-
-        center_ghz = float(_clip(rng.normal(loc=24.125, scale=0.35), 22.0, 30.0))
-        bandwidth_mhz = float(rng.choice([20, 40, 80, 100, 200]))
-        duty_cycle = float(_clip(rng.normal(loc=0.50, scale=0.22), 0.05, 1.00))
-        pulse_width_s = float(_clip(rng.lognormal(mean=np.log(0.35), sigma=0.8), 0.02, 6.0))
-        repetition_rate_hz = float(_clip(rng.normal(loc=1.2, scale=0.9), 0.05, 8.0))
-        avg_power_K = float(_clip(rng.normal(loc=240.0, scale=140.0), 20.0, 1800.0))
-        peak_power_K = float(_clip(avg_power_K * rng.uniform(1.5, 4.5), avg_power_K, 3500.0))
-        angular_sigma_deg = float(_clip(rng.normal(loc=16.0, scale=7.0), 3.0, 45.0))
-        distance_km = float(_clip(rng.lognormal(mean=np.log(0.35), sigma=0.8), 0.005, 8.0))
-        antenna_gain_factor = float(_clip(rng.normal(loc=1.1, scale=0.35), 0.2, 2.2))
-
-    # Unintentional emitters: messy, broadband, irregular, switching-like.
-    elif source_class == "Unintentional Emitters":
-        spectral_shape = str(rng.choice(["broadband", "spiky", "gaussian"], p=[0.50, 0.35, 0.15]))
-        modulation_scheme = str(rng.choice(["random-bursty", "switching-noise-like", "continuous"], p=[0.45, 0.40, 0.15]))
-        emission_type = "unintentional"
-        propagation_path = str(rng.choice(["scattered", "reflected", "line_of_sight"], p=[0.45, 0.35, 0.20]))
-        licensed = False
-        compliance = str(rng.choice(["unknown", "non-compliant", "partially-compliant"], p=[0.55, 0.20, 0.25]))
-
-        center_ghz = float(_clip(rng.normal(loc=25.0, scale=2.3), 22.0, 30.0))
-        bandwidth_mhz = float(rng.choice([100, 200, 400, 800, 1500]))
-        duty_cycle = float(_clip(rng.normal(loc=0.35, scale=0.22), 0.02, 0.95))
-        pulse_width_s = float(_clip(rng.lognormal(mean=np.log(0.18), sigma=1.0), 0.005, 4.0))
-        repetition_rate_hz = float(_clip(rng.normal(loc=1.8, scale=1.3), 0.05, 12.0))
-        avg_power_K = float(_clip(rng.normal(loc=120.0, scale=90.0), 5.0, 900.0))
-        peak_power_K = float(_clip(avg_power_K * rng.uniform(1.2, 3.5), avg_power_K, 2200.0))
-        angular_sigma_deg = float(_clip(rng.normal(loc=30.0, scale=10.0), 6.0, 80.0))
-        distance_km = float(_clip(rng.lognormal(mean=np.log(0.12), sigma=0.9), 0.001, 3.0))
-        antenna_gain_factor = float(_clip(rng.normal(loc=0.8, scale=0.25), 0.1, 1.6))
-
-    # Derived parameters
-    bandwidth_ghz = bandwidth_mhz / 1000.0
-    psd_like_K_per_ghz = float(avg_power_K / max(bandwidth_ghz, 1e-6))
-    protected_band_overlap = bool(
-        (23.6 <= center_ghz <= 24.0)
-        or (center_ghz - bandwidth_ghz / 2 < 23.8 < center_ghz + bandwidth_ghz / 2)
-    )
 
-    # Return all source parameters in one dictionary.
-    return {
-        "source_class": source_class,
-        "center_ghz": center_ghz,
-        "bandwidth_mhz": bandwidth_mhz,
-        "bandwidth_ghz": bandwidth_ghz,
-        "spectral_shape": spectral_shape,
-        "duty_cycle": duty_cycle,
-        "pulse_width_s": pulse_width_s,
-        "repetition_rate_hz": repetition_rate_hz,
-        "modulation_scheme": modulation_scheme,
-        "peak_power_K": peak_power_K,
-        "average_power_K": avg_power_K,
-        "psd_like_K_per_ghz": psd_like_K_per_ghz,
-        "rfi_az_deg": rfi_az_deg,
-        "rfi_el_deg": rfi_el_deg,
-        "angular_sigma_deg": angular_sigma_deg,
-        "distance_km": distance_km,
-        "antenna_gain_factor": antenna_gain_factor,
-        "propagation_path": propagation_path,
-        "polarization_type": polarization_type,
-        "polarization_factor": polarization_factor,
-        "emission_type": emission_type,
-        "licensed": licensed,
-        "compliance": compliance,
-        "protected_band_overlap": protected_band_overlap,
-    }
+# ============================================================
+# 5) BACKGROUND JOBS
+# ------------------------------------------------------------
+# Slow work (cleaning files, RFI synthesis, preparing plot data)
+# runs on one worker thread so the Tk window stays responsive.
+#
+#   - Results and progress messages go through a queue that the
+#     UI thread polls with root.after(); callbacks (on_done,
+#     on_error, on_progress) therefore always run on the UI thread.
+#   - Jobs have a name. Submitting a job whose name is already
+#     waiting replaces the waiting one, and cancels a running one,
+#     so rapid repeated clicks collapse into a single run.
+#   - Cancelled jobs never call on_done.
+# ============================================================
+
+class JobCancelled(Exception):
+    # Raised inside a job when it notices it was cancelled.
+    pass
+
+
+class BackgroundJob:
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[["BackgroundJob"], Any],
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[Exception], None]],
+        events: "queue.Queue[tuple[str, BackgroundJob, Any]]"
+    ):
+        self.name = name
+        self.fn = fn
+        self.on_done = on_done
+        self.on_error = on_error
+        self._events = events
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check_cancelled(self) -> None:
+        # Call this between steps of a long job to stop early.
+        if self._cancel.is_set():
+            raise JobCancelled(self.name)
+
+    def progress(self, msg: str) -> None:
+        # Safe to call from the worker thread.
+        self._events.put(("progress", self, msg))
+
+
+class BackgroundRunner:
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        on_progress: Optional[Callable[[str, str], None]] = None,
+        poll_ms: int = 50
+    ):
+        # schedule is root.after (or anything with the same signature).
+        self._schedule = schedule
+        self._on_progress = on_progress
+        self._poll_ms = poll_ms
+
+        self._events: "queue.Queue[tuple[str, BackgroundJob, Any]]" = queue.Queue()
+        self._cond = threading.Condition()
+        self._waiting: dict[str, BackgroundJob] = {}
+        self._order: deque[str] = deque()
+        self._running: Optional[BackgroundJob] = None
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._work, name="gui-worker", daemon=True)
+        self._thread.start()
+        self._schedule(self._poll_ms, self._poll)
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[[BackgroundJob], Any],
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[Exception], None]] = None
+    ) -> BackgroundJob:
+        # Queue fn(job) on the worker thread; the newest job of a name wins.
+        job = BackgroundJob(name, fn, on_done, on_error, self._events)
+        with self._cond:
+            old = self._waiting.get(name)
+            if old is not None:
+                old.cancel()
+            else:
+                self._order.append(name)
+            if self._running is not None and self._running.name == name:
+                self._running.cancel()
+            self._waiting[name] = job
+            self._cond.notify()
+        return job
+
+    def cancel(self, name: Optional[str] = None) -> None:
+        # Cancel waiting/running jobs with this name (or all jobs).
+        with self._cond:
+            for job_name in list(self._waiting):
+                if name is None or job_name == name:
+                    self._waiting.pop(job_name).cancel()
+                    self._order.remove(job_name)
+            if self._running is not None and (name is None or self._running.name == name):
+                self._running.cancel()
+
+    def busy(self) -> bool:
+        with self._cond:
+            return self._running is not None or bool(self._waiting)
+
+    def shutdown(self) -> None:
+        self.cancel()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _work(self) -> None:
+        # Worker thread: run jobs one at a time, in submission order.
+        while True:
+            with self._cond:
+                while not self._order and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                job = self._waiting.pop(self._order.popleft())
+                self._running = job
+
+            try:
+                job.check_cancelled()
+                result = job.fn(job)
+                self._events.put(("done", job, result))
+            except JobCancelled:
+                pass
+            except Exception as e:
+                self._events.put(("error", job, e))
+            finally:
+                with self._cond:
+                    self._running = None
+
+    def _poll(self) -> None:
+        # UI thread: deliver everything the worker produced so far.
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if job.cancelled():
+                continue
+            if kind == "progress":
+                if self._on_progress is not None:
+                    self._on_progress(job.name, payload)
+            elif kind == "done":
+                job.on_done(payload)
+            elif job.on_error is not None:
+                job.on_error(payload)
+
+        if not self._stopped:
+            self._schedule(self._poll_ms, self._poll)
+
+
+# ============================================================
+# 6) PLOT DATA
+# ------------------------------------------------------------
+# Everything needed for a plot is computed here, away from Tk.
+# The GUI reads its widgets on the UI thread, passes plain values
+# in, and only draws the returned arrays.
+# ============================================================
 
+class PlotInfo(Exception):
+    # A "nothing to plot" situation that should be shown as info,
+    # not as an error.
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
 
-def build_frequency_shape(
-    freqs_ghz: np.ndarray,
-    center_ghz: float,
-    bandwidth_ghz: float,
-    spectral_shape: str,
-    rng: np.random.Generator
-) -> np.ndarray:
-    # Build the spectral signature of the RFI source over frequency.
-    freqs_ghz = np.asarray(freqs_ghz, dtype=float)
-    half_bw = max(1e-9, bandwidth_ghz / 2.0)
-    x = (freqs_ghz - center_ghz) / half_bw
-
-    # Smooth bell-shaped spectrum.
-    if spectral_shape == "gaussian":
-        shape = np.exp(-0.5 * (x / 0.75) ** 2)
-
-    # Mostly flat inside the band, weak leakage outside.
-    elif spectral_shape == "flat":
-        shape = np.where(np.abs(x) <= 1.0, 1.0, 0.03 * np.exp(-2.0 * np.abs(x)))
-
-    # Narrow spikes / tones inside the band.
-    elif spectral_shape == "spiky":
-        base = np.where(np.abs(x) <= 1.0, 0.35, 0.0)
-        shape = base.copy()
-        idx = np.where(np.abs(x) <= 1.0)[0]
-        if len(idx) > 0:
-            n_spikes = int(min(len(idx), max(3, len(idx) // 3)))
-            chosen = rng.choice(idx, size=n_spikes, replace=False)
-            shape[chosen] += rng.uniform(0.6, 1.4, size=n_spikes)
-        shape += 0.02 * np.exp(-2.0 * np.abs(x))
-
-    # Broadband messy spectrum.
-    elif spectral_shape == "broadband":
-        shape = np.exp(-0.5 * (x / 1.6) ** 2) + 0.10 * rng.random(len(freqs_ghz))
-
-    # OFDM-like block spectrum with ripple/jitter across bins.
-    else:  # ofdm_like
-        inband = np.abs(x) <= 1.0
-        shape = np.zeros_like(freqs_ghz, dtype=float)
-        idx = np.where(inband)[0]
-        if len(idx) > 0:
-            n_in = len(idx)
-            grid = np.linspace(0.0, 1.0, n_in)
-            roll = 0.3 + 0.7 * (0.5 * (1 + np.cos(np.pi * np.linspace(-1, 1, n_in))))
-            ripple = np.zeros(n_in, dtype=float)
-            n_tones = int(rng.integers(6, 18))
-            for _ in range(n_tones):
-                k = float(rng.uniform(1.0, 10.0))
-                phase = float(rng.uniform(0.0, 2.0 * np.pi))
-                ripple += np.sin(2.0 * np.pi * k * grid + phase)
-            ripple = ripple / (np.max(np.abs(ripple)) + 1e-12)
-            jitter = rng.normal(0.0, 0.15, size=n_in)
-            band_profile = roll * (1.0 + 0.35 * ripple + jitter)
-            band_profile = np.clip(band_profile, 0.0, None)
-            shape[idx] = band_profile
-
-        shape += 0.02 * np.exp(-0.5 * (x / 1.8) ** 2)
-
-    # Normalize so the max spectral amplitude is 1.
-    shape = np.asarray(shape, dtype=float)
-    maxv = float(np.nanmax(shape)) if shape.size else 0.0
-    if maxv > 0:
-        shape = shape / maxv
-    return shape
-
-
-def build_temporal_envelope(
-    t_len: int,
-    dt_seconds: float,
-    duty_cycle: float,
-    pulse_width_s: float,
-    repetition_rate_hz: float,
-    average_power_K: float,
-    peak_power_K: float,
-    modulation_scheme: str,
-    rng: np.random.Generator
-) -> tuple[np.ndarray, dict[str, float]]:
-    # Build the time behavior of the RFI source.
+
+def _direction_key(values: np.ndarray) -> np.ndarray:
+    # Quantize angles to DIRECTION_ATOL_DEG steps; NaN gets its own key.
+    keys = np.full(values.shape, np.iinfo(np.int64).min, dtype=np.int64)
+    ok = np.isfinite(values)
+    keys[ok] = np.round(values[ok] / DIRECTION_ATOL_DEG).astype(np.int64)
+    return keys
+
+
+class DirectionIndex:
+    # Rows of a clean frame grouped by (Az, El) direction.
     #
-    # This creates pulses / bursts / continuous-like activity depending
-    # on the selected modulation scheme.
-    dt_seconds = max(1e-6, float(dt_seconds))
-    envelope = np.zeros(t_len, dtype=float)
+    # Built once per loaded file: the frame is stably sorted by
+    # quantized direction, so every direction is one contiguous block
+    # (still in time order). Selecting a direction is then a dict
+    # lookup plus a slice of that block, with no copy and no rescan.
+    #
+    # The frame must be sorted by Date/Time (all clean frames are), so
+    # a day inside any selection is found with a binary search.
+    def __init__(self, df: DataFrame):
+        self.df = df
+        n = len(df)
+
+        az = self._angles(df, "Az(deg)")
+        el = self._angles(df, "El(deg)")
+        self.has_az = az is not None
+        self.has_el = el is not None
+        az = az if az is not None else np.zeros(n)
+        el = el if el is not None else np.zeros(n)
+
+        # Values offered in the Az/El combo boxes
+        self.az_values = np.unique(az[np.isfinite(az)]) if self.has_az else np.array([])
+        self.el_values = np.unique(el[np.isfinite(el)]) if self.has_el else np.array([])
+
+        az_key = _direction_key(az)
+        el_key = _direction_key(el)
+
+        # lexsort is stable: rows keep their time order inside a block
+        self.order = np.lexsort((el_key, az_key))
+        self.frame = df.take(self.order)
+        self._az_key = az_key[self.order]
+        self._el_key = el_key[self.order]
+
+        change = np.flatnonzero(
+            (np.diff(self._az_key) != 0) | (np.diff(self._el_key) != 0)
+        ) + 1
+        starts = np.concatenate(([0], change)) if n else np.array([], dtype=int)
+        stops = np.concatenate((change, [n])) if n else np.array([], dtype=int)
+
+        self.slices: dict[tuple[int, int], slice] = {
+            (int(self._az_key[i]), int(self._el_key[i])): slice(int(i), int(j))
+            for i, j in zip(starts, stops)
+        }
+
+    @staticmethod
+    def _angles(df: DataFrame, col: str) -> Optional[np.ndarray]:
+        if col not in df.columns:
+            return None
+        return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+
+    @staticmethod
+    def _parse(text: str, present: bool) -> Optional[int]:
+        # Key of the selected angle, or None for "any value".
+        # A missing column was keyed as all zeros.
+        if not present:
+            return 0
+        if not text or text == "(missing)":
+            return None
+        return int(_direction_key(np.array([float(text)]))[0])
+
+    def select(self, az_text: str, el_text: str, day: str = "") -> DataFrame:
+        # Rows for the selected Az/El (and day, YYYY-MM-DD, if given),
+        # in their original order.
+        return self._restrict_day(self._select_direction(az_text, el_text), day)
+
+    def _select_direction(self, az_text: str, el_text: str) -> DataFrame:
+        az_key = self._parse(az_text, self.has_az)
+        el_key = self._parse(el_text, self.has_el)
+
+        if az_key is not None and el_key is not None:
+            # Both fixed: one contiguous block
+            sl = self.slices.get((az_key, el_key), slice(0, 0))
+            return self.frame.iloc[sl]
+
+        if az_key is None and el_key is None:
+            return self.df
+
+        # Only one angle fixed: gather its blocks, back in original order
+        blocks = [
+            np.arange(sl.start, sl.stop)
+            for (a, e), sl in self.slices.items()
+            if (az_key is None or a == az_key) and (el_key is None or e == el_key)
+        ]
+        if not blocks:
+            return self.frame.iloc[0:0]
+        pos = np.concatenate(blocks)
+        pos = pos[np.argsort(self.order[pos], kind="stable")]
+        return self.frame.iloc[pos]
+
+    @staticmethod
+    def _restrict_day(df: DataFrame, day: str) -> DataFrame:
+        if not day or day == ALL_DAYS or "Date/Time" not in df.columns:
+            return df
+        start = np.datetime64(day, "ns")
+        t = df["Date/Time"].to_numpy(dtype="datetime64[ns]")
+        lo, hi = np.searchsorted(t, [start, start + np.timedelta64(1, "D")])
+        return df.iloc[lo:hi]
 
-    if t_len <= 0:
-        return envelope, {"actual_duty_cycle": 0.0}
 
-    pulse_len = max(1, int(round(pulse_width_s / dt_seconds)))
-    if repetition_rate_hz <= 0:
-        period_len = max(pulse_len + 1, t_len + 1)
-    else:
-        period_len = max(pulse_len, int(round((1.0 / repetition_rate_hz) / dt_seconds)))
-
-    target_on = int(round(duty_cycle * t_len))
-    mod = modulation_scheme.lower()
-
-    # Random bursty/switching style behavior.
-    if any(k in mod for k in ["bursty", "random", "switching"]):
-        on_count = 0
-        attempts = 0
-        while on_count < target_on and attempts < 20000:
-            attempts += 1
-            start = int(rng.integers(0, max(1, t_len - pulse_len)))
-            if not envelope[start:start + pulse_len].any():
-                burst_amp = rng.uniform(average_power_K, peak_power_K)
-                envelope[start:start + pulse_len] = burst_amp
-                on_count += pulse_len
-
-    # More periodic pulse-train / continuous-like behavior.
-    else:
-        phase0 = int(rng.integers(0, max(1, period_len)))
-        for start in range(phase0, t_len, period_len):
-            end = min(t_len, start + pulse_len)
-            burst_amp = rng.uniform(average_power_K, peak_power_K)
-            envelope[start:end] = burst_amp
-
-        current_on = int(np.count_nonzero(envelope > 0))
-        if current_on > target_on and current_on > 0:
-            on_idx = np.where(envelope > 0)[0]
-            keep = max(1, target_on)
-            if keep < len(on_idx):
-                keep_idx = rng.choice(on_idx, size=keep, replace=False)
-                new_env = np.zeros_like(envelope)
-                new_env[keep_idx] = envelope[keep_idx]
-                envelope = new_env
-        elif current_on < target_on:
-            needed = target_on - current_on
-            zero_idx = np.where(envelope == 0)[0]
-            if len(zero_idx) > 0:
-                add_idx = rng.choice(zero_idx, size=min(needed, len(zero_idx)), replace=False)
-                envelope[add_idx] = rng.uniform(average_power_K * 0.7, peak_power_K, size=len(add_idx))
-
-    # Slight smoothing so the signal is less blocky.
-    if t_len >= 3:
-        kernel = np.array([0.2, 0.6, 0.2])
-        envelope = np.convolve(envelope, kernel, mode="same")
-
-    # Slow fading factor to mimic load/beam/power variation over time.
-    slow = np.linspace(0.0, 2.0 * np.pi, t_len)
-    fade = 1.0 + 0.18 * np.sin(2.3 * slow + float(rng.uniform(0.0, 2.0 * np.pi)))
-    envelope *= fade
-
-    # Add small random fluctuations on active segments.
-    active = envelope > 0
-    if np.any(active):
-        envelope[active] += rng.normal(0.0, 0.07 * average_power_K, size=int(np.sum(active)))
-        envelope = np.clip(envelope, 0.0, peak_power_K)
-
-    actual_duty = float(np.mean(envelope > 0))
-    return envelope, {"actual_duty_cycle": actual_duty}
-
-
-def add_rfi_to_df(
-    df_in: DataFrame,
+def apply_rfi_for_plot(
+    df_dir: DataFrame,
     channel_cols: list[str],
     channel_freqs: np.ndarray,
-    source: dict[str, Any],
-    pointing_az_deg: float,
-    pointing_el_deg: float,
-    rng: np.random.Generator
+    source_class: str,
+    az_text: str,
+    el_text: str,
+    seed: Optional[int] = None
 ) -> tuple[DataFrame, dict[str, Any]]:
-    # Apply the synthetic RFI source to the data.
+    # Generate one synthetic source and apply it to a copy of the data.
+    # The seed is stored in the returned metadata so the run can be logged.
     #
-    # Final model:
-    #   RFI(t, f) = time_envelope(t) * freq_shape(f) * total_coupling
-    #
-    # where total_coupling includes:
-    #   - angular mismatch
-    #   - distance attenuation
-    #   - path factor
-    #   - antenna gain
-    #   - polarization factor
-    df = df_in.copy()
-    if "Date/Time" not in df.columns or not channel_cols:
-        return df, source
-
-    dt_seconds = _estimate_dt_seconds(df["Date/Time"])
-    freqs = np.asarray(channel_freqs, dtype=float)
-
-    # Frequency-domain behavior
-    freq_shape = build_frequency_shape(
-        freqs_ghz=freqs,
-        center_ghz=float(source["center_ghz"]),
-        bandwidth_ghz=float(source["bandwidth_ghz"]),
-        spectral_shape=str(source["spectral_shape"]),
+    # The model needs pandas, which is optional at GUI import time, so it
+    # is imported here rather than at the top of the file.
+    from src.models.rich_rfi import add_rfi_to_df, sample_rfi_source
+
+    if seed is None:
+        seed = int(np.random.default_rng().integers(0, 2**31 - 1))
+    rng = np.random.default_rng(seed)
+
+    # Radiometer pointing
+    pointing_az = _safe_float(az_text, 0.0) if az_text != "(missing)" else 0.0
+    pointing_el = _safe_float(el_text, 0.0) if el_text != "(missing)" else 0.0
+
+    source = sample_rfi_source(rng, source_class.strip())
+    df_rfi, meta = add_rfi_to_df(
+        df_in=df_dir,
+        channel_cols=channel_cols,
+        channel_freqs=channel_freqs,
+        source=source,
+        pointing_az_deg=pointing_az,
+        pointing_el_deg=pointing_el,
         rng=rng
     )
-
-    # Time-domain behavior
-    time_env, time_meta = build_temporal_envelope(
-        t_len=len(df),
-        dt_seconds=dt_seconds,
-        duty_cycle=float(source["duty_cycle"]),
-        pulse_width_s=float(source["pulse_width_s"]),
-        repetition_rate_hz=float(source["repetition_rate_hz"]),
-        average_power_K=float(source["average_power_K"]),
-        peak_power_K=float(source["peak_power_K"]),
-        modulation_scheme=str(source["modulation_scheme"]),
-        rng=rng
-    )
-
-    # Angular coupling between source direction and radiometer direction
-    angular_factor = _angular_coupling(
-        pointing_az_deg=pointing_az_deg,
-        pointing_el_deg=pointing_el_deg,
-        source_az_deg=float(source["rfi_az_deg"]),
-        source_el_deg=float(source["rfi_el_deg"]),
-        sigma_deg=float(source["angular_sigma_deg"])
+    meta["seed"] = seed
+    return df_rfi, meta
+
+
+def format_rfi_log(meta: dict[str, Any]) -> str:
+    # Text block describing a generated source for the GUI log.
+    return (
+        f"Add RFI ({meta['source_class']}):\n"
+        f"  seed={meta['seed']}\n"
+        f"  emission_type={meta['emission_type']}\n"
+        f"  modulation={meta['modulation_scheme']}\n"
+        f"  spectral_shape={meta['spectral_shape']}\n"
+        f"  fc={meta['center_ghz']:.3f} GHz\n"
+        f"  BW={meta['bandwidth_mhz']:.0f} MHz ({meta['band_low_ghz']:.3f}–{meta['band_high_ghz']:.3f} GHz)\n"
+        f"  duty(target)={meta['duty_cycle']:.2f}, duty(actual)={meta['actual_duty_cycle']:.2f}\n"
+        f"  pulse_width={meta['pulse_width_s']:.3f} s, repetition_rate={meta['repetition_rate_hz']:.2f} Hz\n"
+        f"  avg_power={meta['average_power_K']:.1f} K, peak_power={meta['peak_power_K']:.1f} K\n"
+        f"  PSD-like={meta['psd_like_K_per_ghz']:.1f} K/GHz\n"
+        f"  source_az={meta['rfi_az_deg']:.1f}°, source_el={meta['rfi_el_deg']:.1f}°\n"
+        f"  pointing_az={meta['pointing_az_deg']:.1f}°, pointing_el={meta['pointing_el_deg']:.1f}°\n"
+        f"  angular_sigma={meta['angular_sigma_deg']:.1f}°, distance={meta['distance_km']:.3f} km\n"
+        f"  propagation={meta['propagation_path']}, antenna_gain_factor={meta['antenna_gain_factor']:.2f}\n"
+        f"  polarization={meta['polarization_type']}, polarization_factor={meta['polarization_factor']:.2f}\n"
+        f"  angular_coupling={meta['angular_coupling']:.3f}, total_coupling={meta['total_coupling']:.3f}\n"
+        f"  licensed={meta['licensed']}, compliance={meta['compliance']}\n"
+        f"  protected_band_overlap={meta['protected_band_overlap']}\n"
+        f"  overlaps_22_30GHz={meta['overlaps_instrument']}\n\n"
     )
 
-    # Distance attenuation
-    distance_km = max(0.001, float(source["distance_km"]))
-    distance_factor = 1.0 / (1.0 + 0.35 * distance_km**1.15)
 
-    # Path-dependent attenuation
-    path_factor_map = {
-        "line_of_sight": 1.00,
-        "reflected": 0.65,
-        "scattered": 0.40,
+def compute_plot_data(
+    index: DirectionIndex,
+    mode: str,
+    channel_cols: list[str],
+    channel_freqs: np.ndarray,
+    freq_col: str,
+    az_text: str,
+    el_text: str,
+    add_rfi: bool,
+    source_class: str,
+    day: str = "",
+    job: Optional[BackgroundJob] = None
+) -> dict[str, Any]:
+    # Select the direction, optionally add RFI, and reduce the data to
+    # the arrays each plot needs. Raises PlotInfo when there is nothing
+    # to draw.
+    df_dir = index.select(az_text, el_text, day)
+    if getattr(df_dir, "empty", False):
+        raise PlotInfo("No data", "No rows found for that Az/El direction.")
+    if job is not None:
+        job.check_cancelled()
+
+    rfi_meta = None
+    if add_rfi and channel_cols:
+        df_dir, rfi_meta = apply_rfi_for_plot(
+            df_dir, channel_cols, channel_freqs, source_class, az_text, el_text
+        )
+        if job is not None:
+            job.check_cancelled()
+
+    data: dict[str, Any] = {
+        "mode": mode,
+        "suffix": f" ({source_class})" if add_rfi else "",
+        "rfi_meta": rfi_meta,
+        "freq_col": freq_col,
     }
-    path_factor = float(path_factor_map.get(str(source["propagation_path"]), 0.6))
-
-    antenna_gain_factor = float(source["antenna_gain_factor"])
-    polarization_factor = float(source["polarization_factor"])
-
-    # Total scaling of the source before adding it to the radiometer data
-    total_coupling = angular_factor * distance_factor * path_factor * antenna_gain_factor * polarization_factor
-
-    center_ghz = float(source["center_ghz"])
-    bw_ghz = float(source["bandwidth_ghz"])
-    harmonic_shape = np.zeros_like(freqs, dtype=float)
-
-    # If the source is spurious, add extra side components / harmonics.
-    if str(source["emission_type"]) == "spurious":
-        harmonic_1 = np.exp(-0.5 * ((freqs - (center_ghz + 0.6 * bw_ghz)) / max(0.04, 0.25 * bw_ghz)) ** 2)
-        harmonic_2 = np.exp(-0.5 * ((freqs - (center_ghz - 0.75 * bw_ghz)) / max(0.04, 0.22 * bw_ghz)) ** 2)
-        harmonic_shape = harmonic_1 + 0.8 * harmonic_2
-        if np.max(harmonic_shape) > 0:
-            harmonic_shape = harmonic_shape / np.max(harmonic_shape)
-
-    full_freq_shape = freq_shape + 0.18 * harmonic_shape
-    if np.max(full_freq_shape) > 0:
-        full_freq_shape = full_freq_shape / np.max(full_freq_shape)
-
-    # Build the actual RFI matrix to add to the data.
-    rfi_K = (time_env[:, None]) * full_freq_shape[None, :] * total_coupling
-
-    # Add RFI to the selected frequency channels.
-    X = df[channel_cols].to_numpy(float)
-    df.loc[:, channel_cols] = X + rfi_K
-
-    # Useful metadata for logging
-    band_low = center_ghz - bw_ghz / 2.0
-    band_high = center_ghz + bw_ghz / 2.0
-    overlaps_instrument = bool((band_high >= FREQ_MIN_GHZ) and (band_low <= FREQ_MAX_GHZ))
-
-    meta = dict(source)
-    meta.update(time_meta)
-    meta.update({
-        "dt_seconds": dt_seconds,
-        "band_low_ghz": band_low,
-        "band_high_ghz": band_high,
-        "angular_coupling": angular_factor,
-        "distance_factor": distance_factor,
-        "path_factor": path_factor,
-        "total_coupling": total_coupling,
-        "overlaps_instrument": overlaps_instrument,
-        "pointing_az_deg": pointing_az_deg,
-        "pointing_el_deg": pointing_el_deg,
-    })
-    return df, meta
+
+    if mode in ("frequency", "both"):
+        # Frequency plot = average over time for each frequency channel
+        X = df_dir[channel_cols].to_numpy(float)
+        data["freqs"] = np.asarray(channel_freqs, dtype=float)
+        data["freq_mean"] = np.nanmean(X, axis=0)
+
+    if mode in ("time", "both"):
+        # Time plot = one selected frequency channel versus Date/Time
+        # (times as matplotlib date numbers, ready for DecimatedLine)
+        data["times"] = mdates.date2num(df_dir["Date/Time"].to_numpy())
+        data["values"] = df_dir[freq_col].to_numpy(float)
+
+    return data
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_bins: int) -> tuple[np.ndarray, np.ndarray]:
+    # Reduce a long series to the min and max of n_bins consecutive
+    # chunks (in their original order). Drawn as a line, the result looks
+    # the same as the full series at a width of n_bins pixels, including
+    # isolated spikes.
+    n = len(y)
+    if n_bins <= 0 or n <= 2 * n_bins:
+        return x, y
+
+    k = n // n_bins
+    m = k * n_bins
+    chunks = y[:m].reshape(n_bins, k)
+    nan = np.isnan(chunks)
+    lo = np.argmin(np.where(nan, np.inf, chunks), axis=1)
+    hi = np.argmax(np.where(nan, -np.inf, chunks), axis=1)
+
+    base = np.arange(0, m, k)
+    idx = np.column_stack((base + np.minimum(lo, hi), base + np.maximum(lo, hi))).ravel()
+    if m < n:
+        # Leftover samples that did not fill a whole chunk
+        tail = y[m:]
+        tail_idx = m + np.array(sorted({int(np.nanargmin(tail)), int(np.nanargmax(tail))})) \
+            if np.isfinite(tail).any() else np.array([n - 1])
+        idx = np.concatenate((idx, tail_idx))
+
+    return x[idx], y[idx]
+
+
+class DecimatedLine:
+    # A Line2D that only ever holds about two points per pixel.
+    #
+    # The full (sorted) series is kept here; on every x-limit change
+    # the visible part is min/max-decimated to the axes width and
+    # pushed into the existing line with set_data, so redraw cost does
+    # not depend on the length of the series.
+    def __init__(self, ax, x: np.ndarray, y: np.ndarray, **line_kwargs: Any):
+        self.ax = ax
+        (self.line,) = ax.plot([], [], **line_kwargs)
+        self._marker = line_kwargs.get("marker", "")
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        ax.callbacks.connect("xlim_changed", lambda _ax: self.refresh())
+
+    def set_series(self, x: np.ndarray, y: np.ndarray) -> None:
+        # Replace the data and zoom out to show all of it.
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        if self.x.size:
+            lo, hi = float(self.x[0]), float(self.x[-1])
+            if lo == hi:
+                lo, hi = lo - 1e-3, hi + 1e-3
+            self.ax.set_xlim(lo, hi)  # triggers refresh() for the new range
+        else:
+            self.refresh()
+        finite = self.y[np.isfinite(self.y)]
+        if finite.size:
+            pad = 0.05 * (finite.max() - finite.min()) or 1.0
+            self.ax.set_ylim(finite.min() - pad, finite.max() + pad)
+
+    def refresh(self) -> None:
+        # Re-decimate the visible range (one sample of margin each side).
+        x0, x1 = self.ax.get_xlim()
+        i0 = max(int(np.searchsorted(self.x, x0)) - 1, 0)
+        i1 = min(int(np.searchsorted(self.x, x1, side="right")) + 1, self.x.size)
+        width_px = max(int(self.ax.bbox.width), 1)
+
+        x, y = minmax_decimate(self.x[i0:i1], self.y[i0:i1], width_px)
+        self.line.set_data(x, y)
+        # Markers only while every sample is shown
+        self.line.set_marker(self._marker if x.size == i1 - i0 else "")
 
 
 # ============================================================
-# 5) GUI APPLICATION
+# 7) GUI APPLICATION
 # ============================================================
 
 class MP3000App:
@@ -883,13 +1105,27 @@ class MP3000App:
         self.add_rfi = tk.BooleanVar(value=False)
         self.rfi_source_type = tk.StringVar(value="5G")
 
+        self.export_xlsx = tk.BooleanVar(value=False)
+        self.all_files = tk.BooleanVar(value=False)
+        self.day_choice = tk.StringVar(value=ALL_DAYS)
+
         # Internal data containers
         self.clean_df: Optional[DataFrame] = None
+        self.clean_index: Optional[DirectionIndex] = None
         self.clean_cols: list[str] = []
         self.clean_freqs: np.ndarray = np.array([])
 
+        # Plot objects reused between redraws (see _build_plot_axes)
+        self._plot_layout: Optional[str] = None
+        self._freq_line = None
+        self._time_line: Optional[DecimatedLine] = None
+
+        # Worker thread for cleaning and plot preparation
+        self.runner = BackgroundRunner(self.root.after, on_progress=self._on_job_progress)
+
         # Build all GUI widgets
         self._build_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self) -> None:
         # Left panel: controls
@@ -915,9 +1151,11 @@ class MP3000App:
         # Preprocess button
         ttk.Button(
             controls,
-            text="Preprocess (clean FIRST file only)",
+            text="Preprocess (clean data folder)",
             command=self.preprocess
         ).pack(pady=6)
+        ttk.Checkbutton(controls, text="All files in folder (not just the first)", variable=self.all_files).pack(anchor="w")
+        ttk.Checkbutton(controls, text="Also export clean .xlsx", variable=self.export_xlsx).pack(anchor="w")
 
         ttk.Separator(controls, orient="horizontal").pack(fill="x", pady=8)
 
@@ -939,6 +1177,16 @@ class MP3000App:
         self.el_combo = ttk.Combobox(controls, textvariable=self.el_choice, width=22, state="readonly")
         self.el_combo.pack()
 
+        # Day browser (useful when several files were cleaned)
+        ttk.Label(controls, text="Day:").pack(pady=(6, 2))
+        day_row = ttk.Frame(controls)
+        day_row.pack()
+        ttk.Button(day_row, text="◀", width=3, command=lambda: self._step_day(-1)).grid(row=0, column=0)
+        self.day_combo = ttk.Combobox(day_row, textvariable=self.day_choice, width=14, state="readonly", values=[ALL_DAYS])
+        self.day_combo.grid(row=0, column=1, padx=2)
+        self.day_combo.bind("<<ComboboxSelected>>", lambda _e: self.plot_selected())
+        ttk.Button(day_row, text="▶", width=3, command=lambda: self._step_day(1)).grid(row=0, column=2)
+
         # Frequency selector for time plot
         ttk.Label(controls, text="Freq (GHz) for Time plot:").pack(pady=(8, 2))
         self.freq_combo = ttk.Combobox(controls, textvariable=self.freq_choice, width=22, state="readonly")
@@ -961,7 +1209,8 @@ class MP3000App:
         self.rfi_source_combo.pack()
 
         # Plot button
-        ttk.Button(controls, text="Plot (selected mode)", command=self.plot_selected).pack(pady=10)
+        ttk.Button(controls, text="Plot (selected mode)", command=self.plot_selected).pack(pady=(10, 2))
+        ttk.Button(controls, text="Cancel", command=self.cancel_jobs).pack(pady=(2, 10))
 
         ttk.Separator(controls, orient="horizontal").pack(fill="x", pady=8)
 
@@ -982,6 +1231,8 @@ class MP3000App:
 
         self.fig, ax = plt.subplots(1, 1, figsize=(9.5, 6.0))
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        # Toolbar for zoom/pan; time plots re-decimate to the new range
+        NavigationToolbar2Tk(self.canvas, plot_frame).pack(side="bottom", fill="x")
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
         ax.set_title("Plot will appear here")
         ax.grid(True)
@@ -1014,12 +1265,10 @@ class MP3000App:
             return
 
         df = self.clean_df
+        index = self.clean_index
 
-        az_values = sorted(df["Az(deg)"].dropna().unique().tolist()) if "Az(deg)" in df.columns else []
-        el_values = sorted(df["El(deg)"].dropna().unique().tolist()) if "El(deg)" in df.columns else []
-
-        az_str = [f"{v:.6g}" for v in az_values] if az_values else ["(missing)"]
-        el_str = [f"{v:.6g}" for v in el_values] if el_values else ["(missing)"]
+        az_str = [f"{v:.6g}" for v in index.az_values] if index.az_values.size else ["(missing)"]
+        el_str = [f"{v:.6g}" for v in index.el_values] if index.el_values.size else ["(missing)"]
 
         self.az_combo["values"] = az_str
         self.el_combo["values"] = el_str
@@ -1036,185 +1285,194 @@ class MP3000App:
         if self.clean_cols and (self.freq_choice.get() not in self.clean_cols):
             self.freq_choice.set(self.clean_cols[0])
 
-    def _filter_by_direction(self, df: DataFrame) -> DataFrame:
-        # Keep only rows that match the selected Az/El.
-        if pd is None:
-            return df
-        out = df.copy()
-
-        if "Az(deg)" in out.columns and self.az_choice.get() and self.az_choice.get() != "(missing)":
-            az = float(self.az_choice.get())
-            az_col = pd.to_numeric(out["Az(deg)"], errors="coerce").to_numpy()
-            mask = np.isfinite(az_col) & np.isclose(az_col, az, rtol=0, atol=DIRECTION_ATOL_DEG)
-            out = out.loc[mask]
-
-        if "El(deg)" in out.columns and self.el_choice.get() and self.el_choice.get() != "(missing)":
-            el = float(self.el_choice.get())
-            el_col = pd.to_numeric(out["El(deg)"], errors="coerce").to_numpy()
-            mask = np.isfinite(el_col) & np.isclose(el_col, el, rtol=0, atol=DIRECTION_ATOL_DEG)
-            out = out.loc[mask]
-
-        return out
-
-    def _apply_optional_rfi_for_plot(self, df_dir: DataFrame) -> DataFrame:
-        # If the user enabled "Add RFI", generate one synthetic source
-        # and apply it only to the plotted dataframe copy.
-        if not self.add_rfi.get():
-            return df_dir
-        if not self.clean_cols:
-            return df_dir
-
-        # Create a seed so the exact generated source can be logged.
-        seed_rng = np.random.default_rng()
-        seed_used = int(seed_rng.integers(0, 2**31 - 1))
-        rng = np.random.default_rng(seed_used)
-
-        # Read the selected radiometer pointing
-        pointing_az = _safe_float(self.az_choice.get(), 0.0) if self.az_choice.get() != "(missing)" else 0.0
-        pointing_el = _safe_float(self.el_choice.get(), 0.0) if self.el_choice.get() != "(missing)" else 0.0
-
-        # Sample a synthetic source according to the chosen source class
-        source_class = self.rfi_source_type.get().strip()
-        source = sample_rfi_source(rng, source_class)
-
-        # Apply RFI to the filtered data copy
-        df_rfi, meta = add_rfi_to_df(
-            df_in=df_dir,
-            channel_cols=self.clean_cols,
-            channel_freqs=self.clean_freqs,
-            source=source,
-            pointing_az_deg=pointing_az,
-            pointing_el_deg=pointing_el,
-            rng=rng
-        )
-
-        # Write all generated source info in the log
-        self._log_add(
-            f"Add RFI ({meta['source_class']}):\n"
-            f"  seed={seed_used}\n"
-            f"  emission_type={meta['emission_type']}\n"
-            f"  modulation={meta['modulation_scheme']}\n"
-            f"  spectral_shape={meta['spectral_shape']}\n"
-            f"  fc={meta['center_ghz']:.3f} GHz\n"
-            f"  BW={meta['bandwidth_mhz']:.0f} MHz ({meta['band_low_ghz']:.3f}–{meta['band_high_ghz']:.3f} GHz)\n"
-            f"  duty(target)={meta['duty_cycle']:.2f}, duty(actual)={meta['actual_duty_cycle']:.2f}\n"
-            f"  pulse_width={meta['pulse_width_s']:.3f} s, repetition_rate={meta['repetition_rate_hz']:.2f} Hz\n"
-            f"  avg_power={meta['average_power_K']:.1f} K, peak_power={meta['peak_power_K']:.1f} K\n"
-            f"  PSD-like={meta['psd_like_K_per_ghz']:.1f} K/GHz\n"
-            f"  source_az={meta['rfi_az_deg']:.1f}°, source_el={meta['rfi_el_deg']:.1f}°\n"
-            f"  pointing_az={meta['pointing_az_deg']:.1f}°, pointing_el={meta['pointing_el_deg']:.1f}°\n"
-            f"  angular_sigma={meta['angular_sigma_deg']:.1f}°, distance={meta['distance_km']:.3f} km\n"
-            f"  propagation={meta['propagation_path']}, antenna_gain_factor={meta['antenna_gain_factor']:.2f}\n"
-            f"  polarization={meta['polarization_type']}, polarization_factor={meta['polarization_factor']:.2f}\n"
-            f"  angular_coupling={meta['angular_coupling']:.3f}, total_coupling={meta['total_coupling']:.3f}\n"
-            f"  licensed={meta['licensed']}, compliance={meta['compliance']}\n"
-            f"  protected_band_overlap={meta['protected_band_overlap']}\n"
-            f"  overlaps_22_30GHz={meta['overlaps_instrument']}\n\n"
-        )
+        days = [ALL_DAYS] + clean_days(df)
+        self.day_combo["values"] = days
+        if self.day_choice.get() not in days:
+            self.day_choice.set(ALL_DAYS)
 
-        return df_rfi
+    def _step_day(self, step: int) -> None:
+        # Move to the previous/next day and replot.
+        days = list(self.day_combo["values"])
+        if len(days) <= 1:
+            return
+        current = self.day_choice.get()
+        i = days.index(current) if current in days else 0
+        self.day_choice.set(days[(i + step) % len(days)])
+        self.plot_selected()
+
+    def _on_job_progress(self, name: str, msg: str) -> None:
+        # Progress messages from background jobs (UI thread).
+        self._log_add(f"[{name}] {msg}\n")
+
+    def _on_job_error(self, title: str):
+        def show(e: Exception) -> None:
+            if isinstance(e, PlotInfo):
+                messagebox.showinfo(e.title, str(e))
+            else:
+                messagebox.showerror(title, str(e))
+        return show
+
+    def cancel_jobs(self) -> None:
+        # Stop any preprocess/plot work that is still running.
+        if self.runner.busy():
+            self.runner.cancel()
+            self._log_add("Cancelled.\n")
+
+    def _on_close(self) -> None:
+        self.runner.shutdown()
+        self.root.destroy()
 
     def preprocess(self) -> None:
-        # Clean the first raw radiometer file found and auto-load it.
+        # Clean the first raw radiometer file found (or every file, when
+        # "All files" is ticked) and auto-load the result.
+        # The cleaning itself runs on the worker thread.
         if not require_pandas():
             return
 
         data_dir = self.data_dir.get().strip()
         out_dir = self.out_dir.get().strip()
-
-        try:
-            in_path, clean_path = clean_first_file_only(data_dir, out_dir)
-
-            self._log_add(
-                "Preprocess done ✅ (cleaned FIRST file only)\n"
-                f"Input file:\n{in_path}\n"
-                f"Output clean:\n{clean_path}\n\n"
-            )
-
-            self.clean_df = load_clean_xlsx(clean_path)
+        export_xlsx = self.export_xlsx.get()
+        all_files = self.all_files.get()
+
+        def work(job: BackgroundJob):
+            if all_files:
+                job.progress("cleaning all files...")
+                clean_df, report = clean_all_files(
+                    data_dir, out_dir, export_xlsx=export_xlsx, progress=job.progress, job=job
+                )
+                n_cached = sum(r["cached"] for r in report)
+                summary = (
+                    f"Preprocess done ✅ ({len(report)} files, "
+                    f"{len(report) - n_cached} cleaned, {n_cached} from cache)\n"
+                    f"Output folder:\n{out_dir}\n\n"
+                )
+            else:
+                job.progress("cleaning first file...")
+                in_path, clean_path, clean_df = clean_first_file_only(data_dir, out_dir, export_xlsx=export_xlsx)
+                summary = (
+                    "Preprocess done ✅ (cleaned FIRST file only)\n"
+                    f"Input file:\n{in_path}\n"
+                    f"Output clean:\n{clean_path}\n\n"
+                )
+            job.check_cancelled()
+            # Group rows by direction once, so each plot is a slice
+            return summary, clean_df, DirectionIndex(clean_df)
+
+        def done(result) -> None:
+            summary, clean_df, index = result
+            self._log_add(summary)
+
+            # Use the cleaned dataframe directly (no reload from disk)
+            self.clean_df = clean_df
+            self.clean_index = index
             self._populate_direction_and_freq_controls()
             self.plot_selected()
 
-        except Exception as e:
-            messagebox.showerror("Preprocess error", str(e))
+        # A new preprocess makes any pending plot of the old data useless
+        self.runner.cancel("plot")
+        self.runner.submit("preprocess", work, done, self._on_job_error("Preprocess error"))
 
     def plot_selected(self) -> None:
         # Main plotting function.
         #
         # Steps:
-        #   1) verify clean data exists
-        #   2) filter by Az/El
-        #   3) optionally add synthetic RFI
-        #   4) draw frequency / time / both plots
+        #   1) verify clean data exists (UI thread)
+        #   2) filter by Az/El and optionally add RFI (worker thread)
+        #   3) draw frequency / time / both plots (UI thread)
+        #
+        # Clicking again while a plot is being prepared replaces it.
         if self.clean_df is None:
-            messagebox.showinfo("No clean data", "Run Preprocess first to create/load *_clean.xlsx.")
-            return
-
-        df_dir = self._filter_by_direction(self.clean_df)
-
-        if getattr(df_dir, "empty", False):
-            messagebox.showinfo("No data", "No rows found for that Az/El direction.")
+            messagebox.showinfo("No clean data", "Run Preprocess first to create/load clean data.")
             return
 
         if not self.clean_cols:
             messagebox.showinfo("No channels", "No 22–30 GHz channels found in this clean file.")
             return
 
-        df_plot = self._apply_optional_rfi_for_plot(df_dir)
-
         mode = self.plot_mode.get().strip().lower()
-        self.fig.clf()
+        if mode not in ("frequency", "time", "both"):
+            messagebox.showerror("Mode error", "plot_mode must be 'frequency', 'time', or 'both'.")
+            return
 
-        suffix = ""
-        if self.add_rfi.get():
-            suffix = f" ({self.rfi_source_type.get()})"
+        fcol = self.freq_choice.get().strip()
+        if mode in ("time", "both") and fcol not in self.clean_df.columns:
+            messagebox.showerror("Missing column", f"Frequency column not found: {fcol}")
+            return
 
-        def draw_frequency(ax):
-            # Frequency plot = average over time for each frequency channel
-            X = df_plot[self.clean_cols].to_numpy(float)
-            y = np.nanmean(X, axis=0)
-            ax.plot(self.clean_freqs, y, marker="o")
-            ax.set_title("Frequency plot — mean over time" + suffix)
-            ax.set_xlabel("Frequency (GHz)")
-            ax.set_ylabel("Brightness Temperature (K)")
-            ax.grid(True)
-
-        def draw_time(ax) -> bool:
-            # Time plot = one selected frequency channel versus Date/Time
-            fcol = self.freq_choice.get().strip()
-            if fcol not in df_plot.columns:
-                messagebox.showerror("Missing column", f"Frequency column not found: {fcol}")
-                return False
-            t = df_plot["Date/Time"]
-            y = df_plot[fcol].to_numpy(float)
-            ax.plot(t, y, marker="o", linewidth=1.5)
-            ax.set_title(f"Time plot — {fcol} GHz" + suffix)
-            ax.set_xlabel("Time")
-            ax.set_ylabel("Brightness Temperature (K)")
-            ax.grid(True)
-            return True
+        # Snapshot everything the worker needs; it must not touch Tk vars
+        index = self.clean_index
+        cols = list(self.clean_cols)
+        freqs = self.clean_freqs.copy()
+        az_text = self.az_choice.get()
+        el_text = self.el_choice.get()
+        add_rfi = self.add_rfi.get()
+        source_class = self.rfi_source_type.get()
+        day = self.day_choice.get()
+
+        def work(job: BackgroundJob) -> dict[str, Any]:
+            return compute_plot_data(
+                index, mode, cols, freqs, fcol, az_text, el_text, add_rfi, source_class, day=day, job=job
+            )
+
+        self.runner.submit("plot", work, self._draw_plot, self._on_job_error("Plot error"))
+
+    def _build_plot_axes(self, mode: str) -> None:
+        # Create the axes and lines for a plot mode. They are reused by
+        # later redraws in the same mode (only their data changes).
+        self.fig.clf()
+        self._freq_line = None
+        self._time_line = None
 
         if mode == "frequency":
-            ax = self.fig.add_subplot(111)
-            draw_frequency(ax)
+            freq_ax, time_ax = self.fig.add_subplot(111), None
         elif mode == "time":
-            ax = self.fig.add_subplot(111)
-            if not draw_time(ax):
-                return
-            self.fig.autofmt_xdate()
-        elif mode == "both":
-            ax1 = self.fig.add_subplot(211)
-            draw_frequency(ax1)
-            ax2 = self.fig.add_subplot(212)
-            if not draw_time(ax2):
-                return
-            self.fig.autofmt_xdate()
+            freq_ax, time_ax = None, self.fig.add_subplot(111)
         else:
-            messagebox.showerror("Mode error", "plot_mode must be 'frequency', 'time', or 'both'.")
-            return
+            freq_ax, time_ax = self.fig.add_subplot(211), self.fig.add_subplot(212)
+
+        if freq_ax is not None:
+            (self._freq_line,) = freq_ax.plot([], [], marker="o")
+            freq_ax.set_xlabel("Frequency (GHz)")
+            freq_ax.set_ylabel("Brightness Temperature (K)")
+            freq_ax.grid(True)
+
+        if time_ax is not None:
+            self._time_line = DecimatedLine(time_ax, [], [], marker="o", linewidth=1.5)
+            time_ax.xaxis_date()
+            time_ax.set_xlabel("Time")
+            time_ax.set_ylabel("Brightness Temperature (K)")
+            time_ax.grid(True)
+            self.fig.autofmt_xdate()
 
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._plot_layout = mode
+
+    def _draw_plot(self, data: dict[str, Any]) -> None:
+        # Draw precomputed plot data (UI thread).
+        if data["rfi_meta"] is not None:
+            # Write all generated source info in the log
+            self._log_add(format_rfi_log(data["rfi_meta"]))
+
+        mode = data["mode"]
+        suffix = data["suffix"]
+        new_layout = mode != self._plot_layout
+        if new_layout:
+            self._build_plot_axes(mode)
+
+        if self._freq_line is not None:
+            ax = self._freq_line.axes
+            self._freq_line.set_data(data["freqs"], data["freq_mean"])
+            ax.set_title("Frequency plot — mean over time" + suffix)
+            ax.relim()
+            ax.autoscale_view()
+
+        if self._time_line is not None:
+            # Decimated to the axes width; re-decimated on zoom/pan
+            self._time_line.ax.set_title(f"Time plot — {data['freq_col']} GHz" + suffix)
+            self._time_line.set_series(data["times"], data["values"])
+
+        if new_layout:
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
 
     def save_plot(self) -> None:
         # Save the currently displayed matplotlib figure as PNG.
@@ -1234,7 +1492,7 @@ class MP3000App:
 
 
 # ============================================================
-# 6) MAIN
+# 8) MAIN
 # ============================================================
 
 if __name__ == "__main__":
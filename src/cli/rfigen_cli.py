@@ -1,17 +1,102 @@
 # Minimal imports
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from src.config.config_loader import load_config
 from src.config.config_parser import parse_and_validate_config, ConfigValidationError
-from src.models.RTTOV_radiometry_gen import main as generate_synthetic_data
-from src.models.radiometry import generate_synthetic_dataset
-from src.models.signal_mixer import generate_rfi_sources, mix_signals
+from src.models.RTTOV_radiometry_gen import generate_level1_dataframe
+from src.models.radiometry import SyntheticRadiometerGenerator
+from src.models.template_cache import load_cached_template
+from src.models.rich_rfi import RichSourceTable, add_rich_rfi_to_dataframe, sample_rfi_sources
+from src.models.signal_mixer import add_rfi_to_dataframe, generate_rfi_table
 from src.export.export_data import save_data
 import sys
 import pandas as pd
 import numpy as np
 
+# Per-process state shared by every dataset a worker builds
+_WORKER_STATE = {}
+
+
+def _init_worker(template, sources, noise_std, rttov_cfg=None):
+    _WORKER_STATE["template"] = template
+    _WORKER_STATE["sources"] = sources
+    _WORKER_STATE["noise_std"] = noise_std
+    _WORKER_STATE["rttov_cfg"] = rttov_cfg
+
+
+def _build_dataset(seed_seq):
+    # Each dataset owns its SeedSequence child, so the output does not
+    # depend on which process builds it or in which order.
+    noise_seq, rfi_seq = seed_seq.spawn(2)
+    if _WORKER_STATE["rttov_cfg"] is not None:
+        # RTTOV-like model, simulated in memory
+        clean = generate_level1_dataframe(_WORKER_STATE["rttov_cfg"], noise_seq)
+    else:
+        generator = SyntheticRadiometerGenerator(
+            template_data=_WORKER_STATE["template"],
+            noise_std=_WORKER_STATE["noise_std"],
+            seed=int(noise_seq.generate_state(1)[0]),
+        )
+        clean = next(generator.iter_dataframes(1))
+    sources = _WORKER_STATE["sources"]
+    # rfi.model: rich sources come as a RichSourceTable
+    add_rfi = add_rich_rfi_to_dataframe if isinstance(sources, RichSourceTable) else add_rfi_to_dataframe
+    contaminated, infos = add_rfi(clean.copy(), sources, np.random.default_rng(rfi_seq))
+    return clean, contaminated, infos
+
+
+def iter_datasets(template, sources, n_datasets, noise_std, seed_seq, workers=1, rttov_cfg=None):
+    """Yield (clean, contaminated, infos) for each dataset, in dataset order.
+
+    Clean data comes from noisy copies of `template`, or, when `rttov_cfg`
+    (the radiometry.rttov config section) is given, from the RTTOV-like
+    model run in memory. With workers > 1 the datasets are built in a
+    process pool; at most 2 * workers results are in flight, so memory
+    does not grow with n_datasets. Output is bit-identical for any
+    number of workers.
+    """
+    dataset_seqs = seed_seq.spawn(n_datasets)
+
+    if workers <= 1:
+        _init_worker(template, sources, noise_std, rttov_cfg)
+        for seq in dataset_seqs:
+            yield _build_dataset(seq)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(template, sources, noise_std, rttov_cfg),
+    ) as executor:
+        pending = deque()
+        for seq in dataset_seqs:
+            pending.append(executor.submit(_build_dataset, seq))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def export_dataset(index, clean, contaminated, infos, export_cfg):
+    """Write one dataset according to the export section of the config."""
+    directory = Path(export_cfg.get("directory", "outputs/"))
+    filenames = export_cfg.get("filenames", {})
+    written = []
+    if export_cfg.get("save_clean", True):
+        name = f"{filenames.get('clean', 'clean')}_{index:04d}.csv"
+        written.append(save_data(clean, directory / name))
+    if export_cfg.get("save_contaminated", True):
+        name = f"{filenames.get('contaminated', 'contaminated')}_{index:04d}.csv"
+        written.append(save_data(contaminated, directory / name))
+    if export_cfg.get("save_metadata", True):
+        name = f"{filenames.get('metadata', 'metadata')}_{index:04d}.json"
+        written.append(save_data(infos, directory / name))
+    return written
+
+
 # Direct pipeline execution
-def run_pipeline(config_path):
+def run_pipeline(config_path, workers=None):
     # 1. Load, parse, and validate config
     resolved_config_path = Path(config_path).resolve()
     raw_config = load_config(resolved_config_path)
@@ -23,37 +108,71 @@ def run_pipeline(config_path):
     print("1. Config loaded successfully!✅")
     
     # 2. Generate synthetic radiometric data
-    print(f"Seed: {config.get('run', {}).get('seed')}")
+    run_cfg = config.get("run", {})
+    workers = workers if workers is not None else run_cfg.get("workers", 1)
+    root_seq = np.random.SeedSequence(run_cfg.get("seed", 42))
+    sources_seq, datasets_seq = root_seq.spawn(2)
+    print(f"Seed: {run_cfg.get('seed')}")
     print(config.get("radiometry", {}))
-    if config.get("radiometry", {}).get("use_rttov", False):
+    radio_cfg = config.get("radiometry", {})
+    if radio_cfg.get("use_rttov", False):
+        # Each dataset is simulated in memory from its own seed
         print("Generating synthetic data using RTTOV...")
-        data = generate_synthetic_data(config)
+        rttov_cfg = radio_cfg.get("rttov", {})
+        data = None
+    elif radio_cfg.get("base_level1_path"):
+        # Memory-mapped template: workers receive only the cache location
+        # and share one copy of the TB matrix through the page cache
+        rttov_cfg = None
+        template_path = Path(radio_cfg["base_level1_path"])
+        if not template_path.is_file():
+            print(f"Template file not found: {template_path}")
+            raise SystemExit(1)
+        data = load_cached_template(template_path, radio_cfg.get("template_cache_dir"))
+        print(f"Template: {template_path} ({len(data)} records, cached in {data.tb_path.parent})")
     else:
-        data = generate_synthetic_dataset(
-            n_dataframes=config.get("run", {}).get("n_datasets", 10),
-            noise_std=config.get("radiometry", {}).get("noise_std_k", 2.0),
-            seed=config.get("run", {}).get("seed", 42),
-            output_dir=config.get("export", {}).get("directory", "outputs/"),
-        )
+        rttov_cfg = None
+        data = SyntheticRadiometerGenerator.create_default_template()
+        print(f"Data sample:\n{data.head()}")
     print("2. Synthetic radiometric data generated successfully!✅")
-    print(f"Data sample:\n{data[0].head() if isinstance(data, list) and len(data) > 0 else data.head() if isinstance(data, pd.DataFrame) else data}")
 
     # 3. Generate RFI sources
-    rng = np.random.default_rng(config.get("run", {}).get("seed", 42))
-    n_sources = config.get("rfi", {}).get("n_sources", 5)
-    source_classes = config.get("rfi", {}).get("source_classes", ["satellite", "aircraft", "ground"])
-    sources = generate_rfi_sources(n_sources, source_classes, rng)
-    print(f"3. Generated {len(sources)} RFI sources successfully!✅")
-
-    # 4. Combine radiometric data and RFI sources
-    mixed_data, rfi_infos = mix_signals(data, sources, rng)
-    print("4. RFI signals mixed into radiometric data successfully!✅")
-    print(f"Mixed data sample:\n{mixed_data[0].head() if isinstance(mixed_data, list) and len(mixed_data) > 0 else mixed_data.head() if isinstance(mixed_data, pd.DataFrame) else mixed_data}")
-
-    # 5. Export data and metadata
-    # save_data(mixed_data, config.get('export', {}).get('directory', 'outputs/'))
-    print("5. Data export placeholder (implement save_data)")
-    return mixed_data, rfi_infos
+    rng = np.random.default_rng(sources_seq)
+    rfi_cfg = config.get("rfi", {})
+    n_sources = rfi_cfg.get("n_sources", 5)
+    source_classes = rfi_cfg.get("source_classes")
+    if rfi_cfg.get("model", "simple") == "rich":
+        # Per-class physics of the GUI model, all classes equally likely
+        class_weights = {c: 1.0 for c in source_classes} if source_classes else None
+        sources = sample_rfi_sources(rng, n_sources, class_weights=class_weights)
+    else:
+        sources = generate_rfi_table(n_sources, source_classes or ["satellite", "aircraft", "ground"], rng)
+    print(f"3. Generated {len(sources)} {rfi_cfg.get('model', 'simple')} RFI sources successfully!✅")
+
+    # 4. Combine radiometric data and RFI sources, exporting each dataset
+    #    (data and metadata) as soon as it is built
+    export_cfg = config.get("export", {})
+    print(f"Building {run_cfg.get('n_datasets', 10)} datasets with {workers} worker(s)...")
+    datasets = iter_datasets(
+        template=data,
+        sources=sources,
+        n_datasets=run_cfg.get("n_datasets", 10),
+        noise_std=radio_cfg.get("noise_std_k", 2.0),
+        seed_seq=datasets_seq,
+        workers=workers,
+        rttov_cfg=rttov_cfg,
+    )
+
+    written_paths = []
+    rfi_infos = []
+    for index, (clean, contaminated, infos) in enumerate(datasets):
+        written_paths.extend(export_dataset(index, clean, contaminated, infos, export_cfg))
+        rfi_infos.append(infos)
+    print(
+        f"4. Mixed RFI into {len(rfi_infos)} datasets and exported {len(written_paths)} files "
+        f"to {export_cfg.get('directory')}✅"
+    )
+    return written_paths, rfi_infos
 
 def main():
     if len(sys.argv) < 2:
@@ -61,14 +180,24 @@ def main():
         print("Example: python -m src.cli.rfigen_cli --config src/config/examples/base_config.yaml")
         sys.exit(1)
     
+    workers = None
+    if '--workers' in sys.argv:
+        workers_index = sys.argv.index('--workers') + 1
+        try:
+            workers = int(sys.argv[workers_index])
+        except (IndexError, ValueError):
+            print("Error: --workers flag requires a positive integer.")
+            sys.exit(1)
+        if workers <= 0:
+            print("Error: --workers flag requires a positive integer.")
+            sys.exit(1)
+
     if '--config' in sys.argv:
         config_index = sys.argv.index('--config') + 1
         if config_index < len(sys.argv):
             config_path = sys.argv[config_index]
             print(f"Using configuration file: {config_path}")
-            data = run_pipeline(config_path)
-            # print("Generated data:")
-            # print(data.head() if isinstance(data, pd.DataFrame) else data)
+            run_pipeline(config_path, workers=workers)
         else:
             print("Error: --config flag provided but no path specified.")
             sys.exit(1)
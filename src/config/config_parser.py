@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from datetime import datetime
 from typing import Any, Dict, List
 
 
@@ -13,16 +14,49 @@ DEFAULTS: Dict[str, Any] = {
         "seed": 12345,
         "n_datasets": 5,
         "n_records_per_dataset": 1000,
+        "workers": 1,
     },
     "radiometry": {
         "use_rttov": False,
+        "base_level1_path": None,
+        "template_cache_dir": ".rfigen_cache/templates",
         "noise_std_k": 0.5,
+        "rttov": {
+            "hours": 1.0,
+            "step_seconds": 60,
+            "start_utc": "2023-04-04T00:00:00",
+            "scan_positions": [
+                [0.0, 20.0],
+                [0.0, 90.0],
+                [0.0, 160.0],
+                [45.0, 20.0],
+                [45.0, 160.0],
+                [90.0, 20.0],
+                [90.0, 160.0],
+                [135.0, 20.0],
+                [135.0, 160.0],
+            ],
+            "channels_ghz": None,
+        },
     },
     "composition": {
         "inject_rfi": True,
     },
+    "rfi": {
+        "model": "simple",
+        "n_sources": 5,
+        "source_classes": None,
+    },
     "export": {
         "directory": "outputs/",
+        "save_clean": True,
+        "save_contaminated": True,
+        "save_metadata": True,
+        "filenames": {
+            "clean": "clean",
+            "contaminated": "contaminated",
+            "metadata": "metadata",
+        },
     },
     "interfaces": {
         "cli": {"enabled": True},
@@ -42,6 +76,18 @@ ALLOWED_RFI_TYPES = {
 
 ALLOWED_MODULATION_TYPES = {"none", "amplitude", "frequency", "phase"}
 
+ALLOWED_RFI_MODELS = {"simple", "rich"}
+
+# Source classes of the rich model (src/models/rich_rfi.py builds its
+# class table from this tuple, so config parsing needs no NumPy/pandas)
+RICH_RFI_SOURCE_CLASSES = (
+    "5G",
+    "Radar Systems",
+    "Broadcast Services",
+    "ISM Equipment",
+    "Unintentional Emitters",
+)
+
 
 class ConfigValidationError(Exception):
     """Raised when config validation fails."""
@@ -54,6 +100,7 @@ def parse_and_validate_config(raw_config: Dict[str, Any]) -> Dict[str, Any]:
     _validate_run(config.get("run", {}))
     _validate_radiometry(config.get("radiometry", {}))
     _validate_composition(config.get("composition", {}))
+    _validate_rfi(config.get("rfi", {}))
     _validate_export(config.get("export", {}))
     _validate_rfi_sources(config.get("rfi_sources", []))
 
@@ -74,20 +121,74 @@ def _validate_run(run_cfg: Dict[str, Any]) -> None:
         raise ConfigValidationError("run.n_datasets must be a positive integer.")
     if not isinstance(run_cfg.get("n_records_per_dataset"), int) or run_cfg.get("n_records_per_dataset", 0) <= 0:
         raise ConfigValidationError("run.n_records_per_dataset must be a positive integer.")
+    if not isinstance(run_cfg.get("workers"), int) or run_cfg.get("workers", 0) <= 0:
+        raise ConfigValidationError("run.workers must be a positive integer.")
 
 def _validate_radiometry(radio_cfg: Dict[str, Any]) -> None:
     if not isinstance(radio_cfg.get("use_rttov"), bool):
         raise ConfigValidationError("radiometry.use_rttov must be a boolean.")
     if not isinstance(radio_cfg.get("noise_std_k"), (int, float)) or radio_cfg.get("noise_std_k", 0) < 0:
         raise ConfigValidationError("radiometry.noise_std_k must be a non-negative number.")
+    path = radio_cfg.get("base_level1_path")
+    if path is not None and (not isinstance(path, str) or not path.strip()):
+        raise ConfigValidationError("radiometry.base_level1_path must be null or a non-empty string.")
+    if not isinstance(radio_cfg.get("template_cache_dir"), str) or not radio_cfg["template_cache_dir"].strip():
+        raise ConfigValidationError("radiometry.template_cache_dir must be a non-empty string.")
+    _validate_rttov(radio_cfg.get("rttov", {}))
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _validate_rttov(rttov_cfg: Dict[str, Any]) -> None:
+    if not isinstance(rttov_cfg, dict):
+        raise ConfigValidationError("radiometry.rttov must be a dictionary.")
+    if not _is_number(rttov_cfg.get("hours")) or rttov_cfg["hours"] <= 0:
+        raise ConfigValidationError("radiometry.rttov.hours must be a positive number.")
+    if not isinstance(rttov_cfg.get("step_seconds"), int) or rttov_cfg["step_seconds"] <= 0:
+        raise ConfigValidationError("radiometry.rttov.step_seconds must be a positive integer.")
+    try:
+        datetime.strptime(rttov_cfg.get("start_utc"), "%Y-%m-%dT%H:%M:%S")
+    except (TypeError, ValueError) as exc:
+        raise ConfigValidationError("radiometry.rttov.start_utc must be a YYYY-mm-ddTHH:MM:SS string.") from exc
+    positions = rttov_cfg.get("scan_positions")
+    if not isinstance(positions, list) or not positions or not all(
+        isinstance(p, (list, tuple)) and len(p) == 2 and all(_is_number(v) for v in p) for p in positions
+    ):
+        raise ConfigValidationError("radiometry.rttov.scan_positions must be a non-empty list of [azimuth, elevation] pairs.")
+    channels = rttov_cfg.get("channels_ghz")
+    if channels is not None and (
+        not isinstance(channels, list) or not channels or not all(_is_number(c) and c > 0 for c in channels)
+    ):
+        raise ConfigValidationError("radiometry.rttov.channels_ghz must be null or a non-empty list of positive numbers.")
 
 def _validate_composition(comp_cfg: Dict[str, Any]) -> None:
     if not isinstance(comp_cfg.get("inject_rfi"), bool):
         raise ConfigValidationError("composition.inject_rfi must be a boolean.")
 
+def _validate_rfi(rfi_cfg: Dict[str, Any]) -> None:
+    if rfi_cfg.get("model") not in ALLOWED_RFI_MODELS:
+        raise ConfigValidationError(f"rfi.model must be one of {sorted(ALLOWED_RFI_MODELS)}.")
+    n_sources = rfi_cfg.get("n_sources")
+    if not isinstance(n_sources, int) or isinstance(n_sources, bool) or n_sources <= 0:
+        raise ConfigValidationError("rfi.n_sources must be a positive integer.")
+    classes = rfi_cfg.get("source_classes")
+    if classes is not None and (
+        not isinstance(classes, list) or not classes or not all(isinstance(c, str) and c.strip() for c in classes)
+    ):
+        raise ConfigValidationError("rfi.source_classes must be null or a non-empty list of strings.")
+    if rfi_cfg["model"] == "rich" and classes is not None:
+        unknown = sorted(set(classes) - set(RICH_RFI_SOURCE_CLASSES))
+        if unknown:
+            raise ConfigValidationError(
+                f"rfi.source_classes {unknown} are not rich-model classes; use {list(RICH_RFI_SOURCE_CLASSES)}."
+            )
+
 def _validate_export(export_cfg: Dict[str, Any]) -> None:
     if not isinstance(export_cfg.get("directory"), str) or not export_cfg.get("directory", "").strip():
         raise ConfigValidationError("export.directory must be a non-empty string.")
+    for key in ("save_clean", "save_contaminated", "save_metadata"):
+        if not isinstance(export_cfg.get(key), bool):
+            raise ConfigValidationError(f"export.{key} must be a boolean.")
 
 def _validate_rfi_sources(rfi_sources: List[Dict[str, Any]]) -> None:
     if not isinstance(rfi_sources, list):
@@ -5,8 +5,12 @@
 # ============================================================
 
 import os
+import sys
 import glob
+import json
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 
 
@@ -14,13 +18,14 @@ import pandas as pd
 # 1. Ruta de la carpeta donde están los CSV
 # ------------------------------------------------------------
 CARPETA_DATOS = "src/data/datos_radiometro"
+CARPETA_PROCESADOS = "src/data/datos_radiometro_procesados"
 
 
 # ------------------------------------------------------------
 # 2. Buscar todos los archivos CSV del radiómetro
 # ------------------------------------------------------------
-def buscar_archivos():
-    patron = os.path.join(CARPETA_DATOS, "*_lv1.csv")
+def buscar_archivos(carpeta=CARPETA_DATOS):
+    patron = os.path.join(carpeta, "*_lv1.csv")
     archivos = glob.glob(patron)
     archivos.sort()
     return archivos
@@ -67,57 +72,107 @@ def mostrar_fechas(biblioteca):
 
 
 # ------------------------------------------------------------
-# 6. Detectar encabezado correcto en los CSV del radiómetro
+# 6. Leer los encabezados en una sola pasada
+#    El archivo crudo trae una línea de encabezado por tipo de
+#    registro (Record,Date/Time,10,... / 40 / 50 / 80) y después
+#    la data, donde cada fila dice su tipo (41 = meteo, 51 = TB).
+#    Se lee línea por línea hasta la primera fila de datos y se
+#    devuelve su posición en bytes, sin cargar el archivo entero.
+# ------------------------------------------------------------
+def leer_encabezados(f):
+    encabezados = {}
+
+    for linea in iter(f.readline, b""):
+        texto = linea.decode("utf-8", errors="replace").strip()
+
+        if texto.startswith("Record,Date/Time,"):
+            columnas = [x.strip() for x in texto.split(",")]
+            encabezados[int(columnas[2])] = columnas
+
+        elif texto and texto[0].isdigit():
+            return encabezados, f.tell() - len(linea)
+
+    return encabezados, None
+
+
+# ------------------------------------------------------------
+# 7. Detectar encabezado correcto en los CSV del radiómetro
 #    Busca la línea: Record,Date/Time,50,...
 # ------------------------------------------------------------
 def obtener_header_real(ruta):
-    with open(ruta, "r", encoding="utf-8", errors="replace") as f:
-        lineas = f.readlines()
+    with open(ruta, "rb") as f:
+        encabezados, _ = leer_encabezados(f)
 
-    for linea in lineas:
-        if linea.startswith("Record,Date/Time,50,"):
-            return [x.strip() for x in linea.strip().split(",")]
+    return encabezados.get(50)
+
+
+# ------------------------------------------------------------
+# 8. Detectar dónde empieza la data numérica real
+#    Devuelve el número de línea (como antes)
+# ------------------------------------------------------------
+def detectar_inicio_datos(ruta):
+    with open(ruta, "rb") as f:
+        for i, linea in enumerate(f):
+            texto = linea.decode("utf-8", errors="replace").strip()
+            if texto and texto[0].isdigit():
+                return i
 
     return None
 
 
 # ------------------------------------------------------------
-# 7. Detectar dónde empieza la data numérica real
+# 9. Leer el archivo una sola vez y separarlo por tipo
+#    Devuelve un diccionario: tipo de encabezado -> DataFrame
+#    (10, 40, 50, 80). Las filas 41 van a la tabla 40, las 51
+#    a la 50, etc., con los nombres de su encabezado.
 # ------------------------------------------------------------
-def detectar_inicio_datos(ruta):
-    with open(ruta, "r", encoding="utf-8", errors="replace") as f:
-        lineas = f.readlines()
+def separar_por_tipo(ruta):
+    with open(ruta, "rb") as f:
+        encabezados, inicio = leer_encabezados(f)
 
-    for i, linea in enumerate(lineas):
-        texto = linea.strip()
-        if texto and texto[0].isdigit():
-            return i
+        if not encabezados:
+            raise ValueError("No se encontró el encabezado correcto en el archivo.")
 
-    return None
+        if inicio is None:
+            raise ValueError("No se encontró el inicio de la data en el archivo.")
+
+        # El mismo buffer abierto pasa directo al lector de pandas
+        f.seek(inicio)
+        ancho = max(len(columnas) for columnas in encabezados.values())
+        datos = pd.read_csv(
+            f,
+            header=None,
+            names=range(ancho),
+            encoding="utf-8",
+            encoding_errors="replace",
+        )
+
+    grupo = datos[2] // 10 * 10
+    tablas = {}
+
+    for tipo, columnas in encabezados.items():
+        filas = datos[grupo == tipo]
+        if filas.empty:
+            continue
+        tabla = filas.iloc[:, :len(columnas)]
+        tabla.columns = columnas
+        tablas[tipo] = tabla
+
+    return tablas
 
 
 # ------------------------------------------------------------
-# 8. Cargar el CSV seleccionado sin error
+# 10. Cargar el CSV seleccionado sin error
+#     Solo las filas de TB del cielo (tipo 50)
 # ------------------------------------------------------------
 def cargar_csv_radiometro(ruta):
-    header = obtener_header_real(ruta)
-    inicio = detectar_inicio_datos(ruta)
+    tablas = separar_por_tipo(ruta)
 
-    if header is None:
+    if 50 not in tablas:
         raise ValueError("No se encontró el encabezado correcto en el archivo.")
 
-    if inicio is None:
-        raise ValueError("No se encontró el inicio de la data en el archivo.")
+    df = tablas[50].dropna()
 
-    df = pd.read_csv(
-        ruta,
-        skiprows=inicio,
-        header=None,
-        names=header
-    )
-
-    df = df.dropna()
-    
     # Keep only columns up to 'Ch  30.000'
     if 'Ch  30.000' in df.columns:
         cutoff_idx = df.columns.get_loc('Ch  30.000')
@@ -127,9 +182,230 @@ def cargar_csv_radiometro(ruta):
 
 
 # ------------------------------------------------------------
-# 9. Programa principal
+# 11. Separar por tipo y dejar cada tabla con sus tipos
+#     Date/Time pasa a datetime, las columnas numéricas a número
+#     y cada tabla queda ordenada por tiempo con índice nuevo.
+#     ejemplo:
+#     tablas = demultiplexar(ruta)
+#     tablas[40] -> meteo (Tamb, Rh, Pres, Tir, Rain)
+#     tablas[50] -> TB del cielo por Az/El
+# ------------------------------------------------------------
+FORMATO_FECHA = "%m/%d/%y %H:%M:%S"
+
+COLUMNAS_METEO = ["Tamb(K)", "Rh(%)", "Pres(mb)", "Tir(K)", "Rain"]
+
+# Contadores y banderas que deben quedar como enteros
+COLUMNAS_ENTERAS = ["Record", "Rain", "DataQuality", "ID"]
+
+
+def tipar_tabla(tabla):
+    tabla = tabla.copy()
+    tabla["Date/Time"] = pd.to_datetime(tabla["Date/Time"].str.strip(), format=FORMATO_FECHA)
+
+    # La tercera columna es el tipo de registro (41, 51, ...)
+    enteras = COLUMNAS_ENTERAS + [tabla.columns[2]]
+
+    for columna in tabla.columns.drop("Date/Time"):
+        valores = pd.to_numeric(tabla[columna], errors="coerce")
+        if columna in enteras and valores.notna().all():
+            valores = valores.astype("int64")
+        tabla[columna] = valores
+
+    return tabla.sort_values("Date/Time", kind="stable").reset_index(drop=True)
+
+
+def demultiplexar(ruta):
+    return {tipo: tipar_tabla(tabla) for tipo, tabla in separar_por_tipo(ruta).items()}
+
+
+# ------------------------------------------------------------
+# 12. Unir la meteo a cada fila de TB por tiempo
+#     Cada fila 50 recibe la medición 40 más cercana en el
+#     tiempo (dentro de la tolerancia; si no hay, queda NaN).
+# ------------------------------------------------------------
+def unir_meteo(tb, meteo, tolerancia="5min", direccion="nearest"):
+    columnas = ["Date/Time"] + [c for c in COLUMNAS_METEO if c in meteo.columns]
+
+    return pd.merge_asof(
+        tb,
+        meteo[columnas],
+        on="Date/Time",
+        direction=direccion,
+        tolerance=pd.Timedelta(tolerancia),
+    )
+
+
+def cargar_con_meteo(ruta, tolerancia="5min"):
+    tablas = demultiplexar(ruta)
+
+    if 50 not in tablas:
+        raise ValueError("No se encontró el encabezado correcto en el archivo.")
+
+    if 40 not in tablas:
+        return tablas[50]
+
+    return unir_meteo(tablas[50], tablas[40], tolerancia)
+
+
+# ------------------------------------------------------------
+# 13. Procesar un archivo y guardarlo en la carpeta de salida
+#     formato "csv" (texto, como siempre) o "parquet" (almacén
+#     columnar de src/data/processed_store.py, un archivo por
+#     fecha con los canales en float32).
+#     Devuelve un resumen con filas y tiempo para el reporte
+# ------------------------------------------------------------
+FORMATOS = ("csv", "parquet")
+
+
+def ruta_salida(ruta, carpeta_salida=CARPETA_PROCESADOS, formato="csv"):
+    fecha = extraer_fecha(os.path.basename(ruta))
+    return os.path.join(carpeta_salida, f"{fecha}.{formato}")
+
+
+def procesar_archivo(ruta, carpeta_salida=CARPETA_PROCESADOS, formato="csv"):
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no válido: {formato}. Usa uno de {FORMATOS}.")
+
+    inicio = time.perf_counter()
+    info = os.stat(ruta)
+    fecha = extraer_fecha(os.path.basename(ruta))
+    salida = ruta_salida(ruta, carpeta_salida, formato)
+
+    df = cargar_csv_radiometro(ruta)
+    if formato == "parquet":
+        from src.data.processed_store import write_day
+        write_day(df, fecha, carpeta_salida)
+    else:
+        df.to_csv(salida, index=False)
+
+    return {
+        "archivo": os.path.basename(ruta),
+        "fecha": fecha,
+        "salida": salida,
+        "tamano": info.st_size,
+        "mtime_ns": info.st_mtime_ns,
+        "filas": len(df),
+        "segundos": round(time.perf_counter() - inicio, 4),
+    }
+
+
+# ------------------------------------------------------------
+# 14. Manifiesto de archivos ya procesados
+#     nombre del archivo -> tamaño, mtime, filas, salida
+#     Si el archivo no cambió (mismo tamaño y mtime) y su salida
+#     existe, no se vuelve a procesar.
+# ------------------------------------------------------------
+MANIFIESTO = "manifiesto.json"
+
+
+def cargar_manifiesto(carpeta_salida=CARPETA_PROCESADOS):
+    ruta = os.path.join(carpeta_salida, MANIFIESTO)
+    if not os.path.exists(ruta):
+        return {}
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def guardar_manifiesto(manifiesto, carpeta_salida=CARPETA_PROCESADOS):
+    ruta = os.path.join(carpeta_salida, MANIFIESTO)
+    temporal = ruta + ".tmp"
+
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(manifiesto, f, indent=2, sort_keys=True)
+
+    os.replace(temporal, ruta)
+
+
+def ya_procesado(ruta, manifiesto, salida):
+    entrada = manifiesto.get(os.path.basename(ruta))
+    if entrada is None or entrada["salida"] != salida or not os.path.exists(salida):
+        return False
+
+    info = os.stat(ruta)
+    return entrada["tamano"] == info.st_size and entrada["mtime_ns"] == info.st_mtime_ns
+
+
+# ------------------------------------------------------------
+# 15. Ingesta masiva (sin preguntas)
+#     Procesa todos los *_lv1.csv de la carpeta en paralelo,
+#     salta los que ya están en el manifiesto y devuelve un
+#     reporte por archivo (ordenado por fecha).
+# ------------------------------------------------------------
+def ingesta_masiva(carpeta_datos=CARPETA_DATOS, carpeta_salida=CARPETA_PROCESADOS, workers=None, forzar=False, formato="csv"):
+    os.makedirs(carpeta_salida, exist_ok=True)
+    manifiesto = cargar_manifiesto(carpeta_salida)
+
+    pendientes = []
+    reporte = []
+
+    for ruta in buscar_archivos(carpeta_datos):
+        if not forzar and ya_procesado(ruta, manifiesto, ruta_salida(ruta, carpeta_salida, formato)):
+            entrada = manifiesto[os.path.basename(ruta)]
+            reporte.append({**entrada, "archivo": os.path.basename(ruta), "omitido": True})
+        else:
+            pendientes.append(ruta)
+
+    def registrar(ruta, resultado=None, error=None):
+        if error is not None:
+            reporte.append({"archivo": os.path.basename(ruta), "fecha": extraer_fecha(os.path.basename(ruta)), "error": str(error)})
+            return
+        manifiesto[resultado["archivo"]] = {k: v for k, v in resultado.items() if k != "archivo"}
+        reporte.append({**resultado, "omitido": False})
+
+    if workers == 1 or len(pendientes) <= 1:
+        for ruta in pendientes:
+            try:
+                registrar(ruta, procesar_archivo(ruta, carpeta_salida, formato))
+            except Exception as e:
+                registrar(ruta, error=e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futuros = {executor.submit(procesar_archivo, ruta, carpeta_salida, formato): ruta for ruta in pendientes}
+            for futuro in as_completed(futuros):
+                try:
+                    registrar(futuros[futuro], futuro.result())
+                except Exception as e:
+                    registrar(futuros[futuro], error=e)
+
+    guardar_manifiesto(manifiesto, carpeta_salida)
+    reporte.sort(key=lambda r: r["fecha"])
+    return reporte
+
+
+def mostrar_reporte(reporte):
+    print("\nArchivo                          Filas   Segundos  Estado")
+    for r in reporte:
+        if "error" in r:
+            estado = f"error: {r['error']}"
+            print(f"{r['archivo']:<32} {'-':>6} {'-':>10}  {estado}")
+        else:
+            estado = "omitido" if r["omitido"] else "procesado"
+            print(f"{r['archivo']:<32} {r['filas']:>6} {r['segundos']:>10.3f}  {estado}")
+
+
+# ------------------------------------------------------------
+# 16. Programa principal
 # ------------------------------------------------------------
 def main():
+    # Modo no interactivo:
+    # python -m src.data.local_radiometric_import --todos [--workers N] [--parquet] [--forzar]
+    if "--todos" in sys.argv:
+        workers = None
+        if "--workers" in sys.argv:
+            try:
+                workers = int(sys.argv[sys.argv.index("--workers") + 1])
+            except (IndexError, ValueError):
+                print("--workers necesita un número entero positivo.")
+                return
+            if workers <= 0:
+                print("--workers necesita un número entero positivo.")
+                return
+        formato = "parquet" if "--parquet" in sys.argv else "csv"
+        reporte = ingesta_masiva(workers=workers, forzar="--forzar" in sys.argv, formato=formato)
+        mostrar_reporte(reporte)
+        return
+
     biblioteca = construir_biblioteca()
 
     if not biblioteca:
@@ -151,7 +427,7 @@ def main():
 
     try:
         df = cargar_csv_radiometro(ruta_archivo)
-        df.to_csv(f"src/data/datos_radiometro_procesados/{fecha_seleccionada}.csv", index=False)
+        df.to_csv(os.path.join(CARPETA_PROCESADOS, f"{fecha_seleccionada}.csv"), index=False)
     except Exception as e:
         print(f"\nError al leer el archivo: {e}")
         return
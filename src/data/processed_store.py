@@ -0,0 +1,164 @@
+"""Columnar store for processed radiometer days.
+
+One Parquet file per date (``<store_dir>/<YYYY-MM-DD>.parquet``) holding
+the same columns as the processed CSVs, with the ``Ch ...`` channel
+columns stored as float32. Readers load only the dates, channels and
+Az/El directions they ask for instead of re-parsing text.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+
+DEFAULT_STORE_DIR = Path("src/data/datos_radiometro_procesados")
+METADATA_COLUMNS = ["Record", "Date/Time", "50", "Az(deg)", "El(deg)", "TkBB(K)"]
+
+_DATE_FILE = re.compile(r"^(\d{4}-\d{2}-\d{2})\.parquet$")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for the processed-data store. Install it with `pip install pyarrow`."
+        )
+
+
+def channel_column(channel: float | str) -> str:
+    """Column name of a channel given in GHz (or already as a column name)."""
+    if isinstance(channel, str):
+        return channel
+    return f"Ch {channel:7.3f}"
+
+
+def day_path(date: str, store_dir: str | Path = DEFAULT_STORE_DIR) -> Path:
+    return Path(store_dir) / f"{date}.parquet"
+
+
+def write_day(
+    df: pd.DataFrame,
+    date: str,
+    store_dir: str | Path = DEFAULT_STORE_DIR
+) -> Path:
+    """Write one processed day to the store.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Processed day (as returned by `cargar_csv_radiometro`).
+    date : str
+        Partition date, YYYY-MM-DD.
+    store_dir : str or Path
+        Store directory.
+
+    Returns
+    -------
+    Path
+        Path of the written Parquet file.
+    """
+    _require_pyarrow()
+    channel_cols = [col for col in df.columns if col.startswith("Ch ")]
+    df = df.astype({col: np.float32 for col in channel_cols})
+
+    path = day_path(date, store_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+    return path
+
+
+def available_dates(store_dir: str | Path = DEFAULT_STORE_DIR) -> List[str]:
+    """Sorted dates present in the store."""
+    store_dir = Path(store_dir)
+    if not store_dir.is_dir():
+        return []
+    return sorted(
+        match.group(1)
+        for match in (_DATE_FILE.match(path.name) for path in store_dir.iterdir())
+        if match
+    )
+
+
+def read_days(
+    store_dir: str | Path = DEFAULT_STORE_DIR,
+    dates: Iterable[str] | None = None,
+    channels: Sequence[float | str] | None = None,
+    directions: Sequence[Tuple[float, float]] | None = None,
+    columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Load processed days, reading only what is asked for.
+
+    Parameters
+    ----------
+    store_dir : str or Path
+        Store directory.
+    dates : Iterable[str], optional
+        Dates to load (YYYY-MM-DD). All dates by default.
+    channels : Sequence[float or str], optional
+        Channels to load, in GHz or as column names. All by default.
+    directions : Sequence[Tuple[float, float]], optional
+        (azimuth, elevation) pairs to keep. All rows by default.
+    columns : Sequence[str], optional
+        Non-channel columns to load. `METADATA_COLUMNS` by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        Rows of the selected days, in date then file order.
+    """
+    _require_pyarrow()
+    dates = available_dates(store_dir) if dates is None else list(dates)
+    if not dates:
+        raise ValueError(f"No processed days found in {store_dir}.")
+
+    read_columns = None
+    if channels is not None or columns is not None:
+        read_columns = list(METADATA_COLUMNS if columns is None else columns)
+        if channels is not None:
+            read_columns += [channel_column(ch) for ch in channels]
+        else:
+            schema = pq.read_schema(day_path(dates[0], store_dir))
+            read_columns += [name for name in schema.names if name.startswith("Ch ")]
+
+    filters = None
+    if directions is not None:
+        filters = [
+            [("Az(deg)", "=", float(az)), ("El(deg)", "=", float(el))]
+            for az, el in directions
+        ]
+
+    tables = []
+    for date in dates:
+        path = day_path(date, store_dir)
+        if read_columns is not None:
+            # pyarrow reports unknown dotted names ("Ch  58.800") as a
+            # nested-field error, so name the missing columns here
+            stored = set(pq.read_schema(path).names)
+            missing = [name for name in read_columns if name not in stored]
+            if missing:
+                raise ValueError(f"Columns {missing} are not stored for {date} in {store_dir}.")
+        tables.append(pq.read_table(path, columns=read_columns, filters=filters))
+    return pa.concat_tables(tables).to_pandas()
+
+
+def convert_csv_dir(
+    csv_dir: str | Path = DEFAULT_STORE_DIR,
+    store_dir: str | Path = DEFAULT_STORE_DIR
+) -> List[Path]:
+    """Convert processed ``<YYYY-MM-DD>.csv`` files into store partitions."""
+    written = []
+    for csv_path in sorted(Path(csv_dir).glob("*.csv")):
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", csv_path.stem):
+            written.append(write_day(pd.read_csv(csv_path), csv_path.stem, store_dir))
+    return written
@@ -17,6 +17,10 @@ What this script creates:
     elevation_deg, azimuth_deg, tb_k, tamb_c, rh_pct, pressure_hpa, rain_flag
 - Surface meteorology records (record type 41)
 - Sky brightness temperature records (record type 51)
+- Optionally the same data as a compressed NumPy archive (.npz)
+  or a Parquet table (.parquet, needs pandas + pyarrow)
+- Optionally the radiometer's wide layout instead (--layout wide):
+    Record, Date/Time, 50, Az(deg), El(deg), TkBB(K), Ch  22.234, ...
 
 Simplified physical idea behind the model:
 - K-band (22-30 GHz): mainly sensitive to water vapor and cloud liquid water
@@ -32,13 +36,19 @@ Choose a custom output file:
 
 Generate 24 hours with a 30-second time step:
     python mp3000a_level1_sintetico.py --hours 24 --step-seconds 30
+
+Write a Parquet file instead of CSV:
+    python mp3000a_level1_sintetico.py --output mp3000a_lv1.parquet
+
+Write the radiometer's wide layout (one column per channel):
+    python mp3000a_level1_sintetico.py --layout wide
 """
 
 # ==========================================================
 # PART 1 - Imports
 # ----------------------------------------------------------
-# We import only standard Python modules so the script can
-# run without installing extra packages.
+# The scalar model only needs standard Python modules so the
+# script can run without installing extra packages.
 # ==========================================================
 
 import argparse
@@ -49,6 +59,13 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+# NumPy is only needed by the array engine (PART 11). The scalar
+# reference path below keeps working without it.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 # ==========================================================
 # PART 2 - MP-3000A channel definition
@@ -242,18 +259,27 @@ def cloud_emission_term(channel_ghz: float, state: AtmosphereState) -> float:
 #     Tb = trans * T_CMB + (1 - trans) * T_eff + cloud_term + noise
 # ==========================================================
 
-def synthetic_tb(channel_ghz: float, state: AtmosphereState, elevation_deg: float, rng: random.Random) -> float:
+def channel_noise_std(channel_ghz: float) -> float:
+    """Instrument noise standard deviation for one channel (K)."""
+    return 0.18 if channel_ghz < 40.0 else 0.12
+
+
+def clear_sky_tb(channel_ghz: float, state: AtmosphereState, elevation_deg: float) -> float:
+    """Noise-free brightness temperature, before clamping."""
     path_factor = secant_elevation_model(elevation_deg)
     tau = optical_depth(channel_ghz, state, path_factor)
     trans = math.exp(-tau)
     t_eff = effective_temperature_k(channel_ghz, state)
     cloud_term = cloud_emission_term(channel_ghz, state)
 
-    tb = trans * T_CMB_K + (1.0 - trans) * t_eff + cloud_term
+    return trans * T_CMB_K + (1.0 - trans) * t_eff + cloud_term
+
+
+def synthetic_tb(channel_ghz: float, state: AtmosphereState, elevation_deg: float, rng: random.Random) -> float:
+    tb = clear_sky_tb(channel_ghz, state, elevation_deg)
 
     # Small instrument-like random noise.
-    noise_std = 0.18 if channel_ghz < 40.0 else 0.12
-    tb += rng.gauss(0.0, noise_std)
+    tb += rng.gauss(0.0, channel_noise_std(channel_ghz))
 
     return clamp(tb, 2.7, 400.0)
 
@@ -338,7 +364,269 @@ def build_atmosphere_state(met: SurfaceMet, t: datetime, rng: random.Random) ->
 
 
 # ==========================================================
-# PART 11 - CSV writing
+# PART 11 - NumPy array engine
+# ----------------------------------------------------------
+# The functions above compute one value at a time and are kept
+# as the reference implementation.
+#
+# The array engine below evaluates the same model for all
+# time steps, scan positions and channels at once:
+# - meteorology and atmospheric state are arrays over time
+# - channel-only terms are computed once per channel
+# - Tb is a (time, scan position, channel) array
+# - instrument noise is drawn in batches
+#
+# Optical depth and effective temperature are linear in the
+# atmospheric state, so they are written as per-channel
+# coefficients times per-time state values.
+# ==========================================================
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "NumPy is required for the array engine. Install it with `pip install numpy`."
+        )
+
+
+@dataclass
+class SurfaceMetArrays:
+    tamb_c: np.ndarray
+    rh_pct: np.ndarray
+    pressure_hpa: np.ndarray
+    rain_flag: np.ndarray
+
+
+@dataclass
+class AtmosphereArrays:
+    surface_temp_k: np.ndarray
+    vapor_scale: np.ndarray
+    liquid_scale: np.ndarray
+    lapse_rate_k_per_km: np.ndarray
+    inversion_strength_k: np.ndarray
+
+
+@dataclass
+class Level1Arrays:
+    """Simulated Level-1 data as arrays.
+
+    tb_k has shape (n_time, n_scan, n_channel); met and state are
+    arrays over time; scan_positions holds (azimuth, elevation) rows.
+    """
+    times: np.ndarray
+    scan_positions: np.ndarray
+    channels_ghz: np.ndarray
+    met: SurfaceMetArrays
+    state: AtmosphereArrays
+    tb_k: np.ndarray
+
+
+def gaussian_array(x, mu: float, sigma: float):
+    """Array version of gaussian()."""
+    z = (np.asarray(x, dtype=float) - mu) / sigma
+    return np.exp(-0.5 * z * z)
+
+
+def secant_elevation_array(elevation_deg):
+    """Array version of secant_elevation_model()."""
+    zenith_angle_deg = np.clip(90.0 - np.asarray(elevation_deg, dtype=float), 0.0, 75.0)
+    cosz = np.cos(np.radians(zenith_angle_deg))
+    return 1.0 / np.maximum(cosz, 0.25)
+
+
+def channel_coefficients(channels_ghz) -> dict:
+    """
+    Per-channel coefficients of the linear state model.
+
+    optical_depth (zenith) = tau0 + tau_vapor * vapor + tau_liquid * liquid
+    effective_temp = surface_temp + t_offset + t_inversion * inversion
+                     + t_lapse * (lapse_rate - 6.5)
+    cloud_term = cloud_factor * liquid
+    """
+    _require_numpy()
+    f = np.asarray(channels_ghz, dtype=float)
+    k_band = f < 40.0
+
+    water = (
+        1.8 * gaussian_array(f, 22.235, 0.55)
+        + 0.45 * gaussian_array(f, 24.0, 2.2)
+        + 0.06 + 0.015 * (f - 22.0)
+    )
+    oxygen = 0.15 + 2.8 * gaussian_array(f, 57.0, 2.1) + 0.25 * gaussian_array(f, 54.0, 3.0)
+    line_strength = gaussian_array(f, 57.0, 2.7)
+
+    return {
+        "tau0": np.where(k_band, 0.01, 0.01 + oxygen),
+        "tau_vapor": np.where(k_band, water, 0.12),
+        "tau_liquid": np.where(k_band, 0.35, 0.18),
+        "t_offset": np.where(
+            k_band,
+            -(3.5 + 8.0 * gaussian_array(f, 22.235, 0.8)),
+            -(8.0 + 18.0 * line_strength),
+        ),
+        "t_inversion": np.where(k_band, 0.35, 0.55 * (0.5 + line_strength)),
+        "t_lapse": np.where(k_band, 0.0, -2.5 * line_strength),
+        "cloud_factor": np.where(
+            k_band,
+            2.0 + 4.0 * gaussian_array(f, 30.0, 4.0),
+            1.0 + 2.0 * gaussian_array(f, 57.0, 3.0),
+        ),
+        "noise_std": np.where(k_band, 0.18, 0.12),
+    }
+
+
+def clear_sky_tb_array(channels_ghz, state: AtmosphereArrays, elevations_deg):
+    """
+    Noise-free, unclamped Tb for every time, elevation and channel.
+
+    Array version of clear_sky_tb(); returns shape (n_time, n_elev, n_channel).
+    """
+    coef = channel_coefficients(channels_ghz)
+    path = secant_elevation_array(elevations_deg)
+
+    vapor = state.vapor_scale[:, None]
+    liquid = state.liquid_scale[:, None]
+
+    tau_zenith = coef["tau0"] + vapor * coef["tau_vapor"] + liquid * coef["tau_liquid"]
+    t_eff = (
+        state.surface_temp_k[:, None]
+        + coef["t_offset"]
+        + coef["t_inversion"] * state.inversion_strength_k[:, None]
+        + coef["t_lapse"] * (state.lapse_rate_k_per_km[:, None] - 6.5)
+    )
+    cloud = np.where(liquid > 0, coef["cloud_factor"] * liquid, 0.0)
+
+    trans = np.exp(-tau_zenith[:, None, :] * path[None, :, None])
+    return trans * T_CMB_K + (1.0 - trans) * t_eff[:, None, :] + cloud[:, None, :]
+
+
+def hour_of_day_array(times):
+    """Decimal hour of day for an array of datetime64 values."""
+    seconds = (times - times.astype("datetime64[D]")) / np.timedelta64(1, "s")
+    return seconds / 3600.0
+
+
+def build_surface_met_array(hod, rng) -> SurfaceMetArrays:
+    """Array version of build_surface_met(); rng is a numpy Generator."""
+    n = len(hod)
+    diurnal = np.sin(2.0 * np.pi * (hod - 14.0) / 24.0)
+
+    tamb_c = 25.0 + 3.5 * diurnal + rng.normal(0.0, 0.15, n)
+
+    rh_pct = 78.0 - 14.0 * diurnal + rng.normal(0.0, 1.2, n)
+    rh_pct = np.clip(rh_pct, 35.0, 100.0)
+
+    pressure_hpa = 1012.0 + 1.8 * np.sin(2.0 * np.pi * hod / 12.0)
+    pressure_hpa += rng.normal(0.0, 0.25, n)
+
+    rain_flag = ((hod >= 18.0) & (hod <= 19.5) & (rh_pct > 85.0)).astype(int)
+
+    return SurfaceMetArrays(
+        tamb_c=tamb_c,
+        rh_pct=rh_pct,
+        pressure_hpa=pressure_hpa,
+        rain_flag=rain_flag,
+    )
+
+
+def build_atmosphere_state_array(met: SurfaceMetArrays, hod, rng) -> AtmosphereArrays:
+    """Array version of build_atmosphere_state(); rng is a numpy Generator."""
+    n = len(hod)
+
+    surface_temp_k = met.tamb_c + 273.15
+
+    vapor_scale = 0.75 + 0.008 * (met.rh_pct - 50.0)
+    vapor_scale += 0.12 * np.exp(-0.5 * ((hod - 17.0) / 2.5) ** 2)
+    vapor_scale = np.clip(vapor_scale, 0.35, 1.60)
+
+    liquid_draw = rng.uniform(0.0, 1.0, n)
+    liquid_scale = np.where(
+        met.rain_flag == 1,
+        2.8 + 0.7 * liquid_draw,
+        np.where(met.rh_pct > 92.0, 0.35 + 0.15 * liquid_draw, 0.0),
+    )
+
+    lapse_rate = 6.2 + 0.6 * np.sin(2.0 * np.pi * (hod - 9.0) / 24.0)
+    lapse_rate += rng.normal(0.0, 0.08, n)
+
+    morning = (hod >= 2.0) & (hod <= 8.0)
+    inversion_strength = np.where(
+        morning,
+        np.maximum(2.5 + 1.3 * np.cos(2.0 * np.pi * (hod - 5.0) / 6.0), 0.0),
+        0.0,
+    )
+
+    return AtmosphereArrays(
+        surface_temp_k=surface_temp_k,
+        vapor_scale=vapor_scale,
+        liquid_scale=liquid_scale,
+        lapse_rate_k_per_km=lapse_rate,
+        inversion_strength_k=inversion_strength,
+    )
+
+
+def simulate_level1_arrays(
+    start_time: datetime,
+    hours: float,
+    step_seconds: int,
+    scan_positions: list[tuple[float, float]],
+    seed: int,
+    channels_ghz: list[float] = ALL_CHANNELS_GHZ,
+    chunk_steps: int = 4096,
+) -> Level1Arrays:
+    """
+    Simulate Level-1 brightness temperatures with the array engine.
+
+    Covers the same time steps as write_level1_csv(). Tb is computed in
+    chunks of chunk_steps time steps to bound temporary memory.
+    """
+    _require_numpy()
+    if step_seconds <= 0:
+        raise ValueError("step_seconds must be greater than 0")
+
+    rng = np.random.default_rng(seed)
+
+    # Same time steps as the `while current < end_time` loop.
+    total = timedelta(hours=hours)
+    step = timedelta(seconds=step_seconds)
+    n_steps = max(0, -(-total // step))
+
+    start = np.datetime64(start_time.replace(tzinfo=None), "s")
+    times = start + np.arange(n_steps) * np.timedelta64(step_seconds, "s")
+    hod = hour_of_day_array(times)
+
+    met = build_surface_met_array(hod, rng)
+    state = build_atmosphere_state_array(met, hod, rng)
+
+    scan = np.asarray(scan_positions, dtype=float).reshape(-1, 2)
+    channels = np.asarray(channels_ghz, dtype=float)
+    noise_std = channel_coefficients(channels)["noise_std"]
+
+    tb_k = np.empty((n_steps, len(scan), len(channels)), dtype=float)
+    for lo in range(0, n_steps, chunk_steps):
+        hi = min(n_steps, lo + chunk_steps)
+        chunk_state = AtmosphereArrays(
+            surface_temp_k=state.surface_temp_k[lo:hi],
+            vapor_scale=state.vapor_scale[lo:hi],
+            liquid_scale=state.liquid_scale[lo:hi],
+            lapse_rate_k_per_km=state.lapse_rate_k_per_km[lo:hi],
+            inversion_strength_k=state.inversion_strength_k[lo:hi],
+        )
+        tb = clear_sky_tb_array(channels, chunk_state, scan[:, 1])
+        tb += rng.standard_normal(tb.shape) * noise_std
+        np.clip(tb, 2.7, 400.0, out=tb_k[lo:hi])
+
+    return Level1Arrays(
+        times=times,
+        scan_positions=scan,
+        channels_ghz=channels,
+        met=met,
+        state=state,
+        tb_k=tb_k,
+    )
+
+
+# ==========================================================
+# PART 12 - CSV writing
 # ----------------------------------------------------------
 # This is where the script creates the final Level-1 style file.
 #
@@ -347,6 +635,22 @@ def build_atmosphere_state(met: SurfaceMet, t: datetime, rng: random.Random) ->
 # - one brightness temperature record (type 51) per channel
 # ==========================================================
 
+LEVEL1_COLUMNS = [
+    "record_no",
+    "datetime_utc",
+    "record_type",
+    "channel_mhz",
+    "frequency_ghz",
+    "elevation_deg",
+    "azimuth_deg",
+    "tb_k",
+    "tamb_c",
+    "rh_pct",
+    "pressure_hpa",
+    "rain_flag",
+]
+
+
 def channel_to_mhz(freq_ghz: float) -> int:
     return int(round(freq_ghz * 1000.0))
 
@@ -370,20 +674,7 @@ def write_level1_csv(
     with output_path.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
 
-        writer.writerow([
-            "record_no",
-            "datetime_utc",
-            "record_type",
-            "channel_mhz",
-            "frequency_ghz",
-            "elevation_deg",
-            "azimuth_deg",
-            "tb_k",
-            "tamb_c",
-            "rh_pct",
-            "pressure_hpa",
-            "rain_flag",
-        ])
+        writer.writerow(LEVEL1_COLUMNS)
 
         while current < end_time:
             met = build_surface_met(current, rng)
@@ -431,7 +722,348 @@ def write_level1_csv(
 
 
 # ==========================================================
-# PART 12 - Command-line arguments
+# PART 13 - Block writers
+# ----------------------------------------------------------
+# write_level1_csv() above issues one csv.writer call per value.
+#
+# The writers below take the output of the array engine and
+# write whole blocks at once:
+# - CSV: each chunk (one hour of records by default) is
+#   formatted into a single string and written in one call,
+#   with the same columns and number formats as above
+# - NPZ: the arrays themselves, compressed
+# - Parquet: the same long table as the CSV (needs pandas + pyarrow)
+# ==========================================================
+
+def write_level1_arrays_csv(output_path: Path, arrays: Level1Arrays, chunk_seconds: int = 3600) -> None:
+    """Write Level1Arrays as a Level-1 CSV, one formatted chunk at a time."""
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+    rows_per_step = 1 + n_scan * n_chan
+
+    # The (channel, direction) part of every Tb row never changes.
+    row_middles = [
+        f"{channel_to_mhz(freq_ghz)},{freq_ghz:.3f},{elevation_deg:.2f},{azimuth_deg:.2f},"
+        for azimuth_deg, elevation_deg in arrays.scan_positions.tolist()
+        for freq_ghz in arrays.channels_ghz.tolist()
+    ]
+
+    if n_time > 1:
+        step_seconds = (arrays.times[1] - arrays.times[0]) / np.timedelta64(1, "s")
+        steps_per_chunk = max(1, int(chunk_seconds // step_seconds))
+    else:
+        steps_per_chunk = 1
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        f.write(",".join(LEVEL1_COLUMNS) + "\r\n")
+
+        for lo in range(0, n_time, steps_per_chunk):
+            hi = min(n_time, lo + steps_per_chunk)
+            times = arrays.times[lo:hi].astype("datetime64[s]").tolist()
+            tamb = arrays.met.tamb_c[lo:hi].tolist()
+            rh = arrays.met.rh_pct[lo:hi].tolist()
+            pressure = arrays.met.pressure_hpa[lo:hi].tolist()
+            rain = arrays.met.rain_flag[lo:hi].tolist()
+            tb_rows = arrays.tb_k[lo:hi].reshape(hi - lo, -1).tolist()
+
+            parts = []
+            for i, t in enumerate(times):
+                record_no = 1 + (lo + i) * rows_per_step
+                dt_str = t.strftime("%m/%d/%Y %H:%M:%S")
+                met_str = f"{round(tamb[i], 3)},{round(rh[i], 3)},{round(pressure[i], 3)},{rain[i]}"
+
+                # Surface met record.
+                parts.append(f"{record_no},{dt_str},41,,,,,,{met_str}\r\n")
+
+                # Brightness temperature records.
+                row_fmt = f"%d,{dt_str},51,%s%.4f,{met_str}\r\n"
+                parts.append("".join(map(
+                    row_fmt.__mod__,
+                    zip(range(record_no + 1, record_no + rows_per_step), row_middles, tb_rows[i]),
+                )))
+
+            f.write("".join(parts))
+
+
+def write_level1_npz(output_path: Path, arrays: Level1Arrays) -> None:
+    """Write Level1Arrays as a compressed NumPy archive."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        output_path,
+        times=arrays.times,
+        scan_positions=arrays.scan_positions,
+        channels_ghz=arrays.channels_ghz,
+        tb_k=arrays.tb_k,
+        tamb_c=arrays.met.tamb_c,
+        rh_pct=arrays.met.rh_pct,
+        pressure_hpa=arrays.met.pressure_hpa,
+        rain_flag=arrays.met.rain_flag,
+    )
+
+
+def level1_long_dataframe(arrays: Level1Arrays):
+    """Level1Arrays as a long pandas DataFrame with the LEVEL1_COLUMNS schema."""
+    import pandas as pd
+
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+    n_tb = n_scan * n_chan
+    rows_per_step = 1 + n_tb
+
+    # Row i * rows_per_step is the met record of time step i.
+    step = np.repeat(np.arange(n_time), rows_per_step)
+    slot = np.tile(np.arange(rows_per_step), n_time)
+    is_tb = slot > 0
+    tb_slot = np.where(is_tb, slot - 1, 0)
+    scan_idx = tb_slot // n_chan
+    chan_idx = tb_slot % n_chan
+
+    def tb_only(values):
+        # Met records leave the Tb columns empty.
+        return np.where(is_tb, values, np.nan)
+
+    channels_mhz = np.rint(arrays.channels_ghz * 1000.0).astype(np.int64)
+    return pd.DataFrame({
+        "record_no": np.arange(1, len(step) + 1),
+        "datetime_utc": arrays.times[step],
+        "record_type": np.where(is_tb, 51, 41),
+        "channel_mhz": pd.arrays.IntegerArray(channels_mhz[chan_idx], mask=~is_tb),
+        "frequency_ghz": tb_only(arrays.channels_ghz[chan_idx]),
+        "elevation_deg": tb_only(arrays.scan_positions[scan_idx, 1]),
+        "azimuth_deg": tb_only(arrays.scan_positions[scan_idx, 0]),
+        "tb_k": tb_only(arrays.tb_k.reshape(n_time, n_tb)[step, tb_slot]),
+        "tamb_c": arrays.met.tamb_c[step],
+        "rh_pct": arrays.met.rh_pct[step],
+        "pressure_hpa": arrays.met.pressure_hpa[step],
+        "rain_flag": arrays.met.rain_flag[step],
+    })
+
+
+def write_level1_parquet(output_path: Path, arrays: Level1Arrays) -> None:
+    """Write Level1Arrays as a Parquet long table (needs pandas + pyarrow)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    level1_long_dataframe(arrays).to_parquet(output_path, index=False)
+
+
+# ==========================================================
+# PART 14 - Wide layout
+# ----------------------------------------------------------
+# The long layout above repeats the met values on every channel
+# row. The radiometer's own files, and everything downstream
+# (signal_mixer, gui_visual), use the wide layout instead: one
+# row per time step and scan direction, one column per channel.
+#
+#   Record, Date/Time, 50, Az(deg), El(deg), TkBB(K), Ch  22.234, ...
+#
+# The "50" column holds the record type of the sky rows (51).
+# TkBB(K) is filled with the ambient temperature in Kelvin,
+# which is what the blackbody target sits at.
+# ==========================================================
+
+WIDE_COLUMNS = ["Record", "Date/Time", "50", "Az(deg)", "El(deg)", "TkBB(K)"]
+WIDE_DATETIME_FORMAT = "%m/%d/%y %H:%M:%S"
+
+
+def channel_column(freq_ghz: float) -> str:
+    return f"Ch {freq_ghz:7.3f}"
+
+
+@dataclass
+class Level1WideArrays:
+    """Level-1 data in the wide layout.
+
+    All arrays have one entry per row (n_time * n_scan rows, time-major);
+    tb_k has shape (n_rows, n_channel).
+    """
+    record: np.ndarray
+    times: np.ndarray
+    azimuth_deg: np.ndarray
+    elevation_deg: np.ndarray
+    tkbb_k: np.ndarray
+    channels_ghz: np.ndarray
+    tb_k: np.ndarray
+
+    @property
+    def columns(self) -> list[str]:
+        return WIDE_COLUMNS + [channel_column(f) for f in self.channels_ghz.tolist()]
+
+
+def level1_wide_arrays(arrays: Level1Arrays) -> Level1WideArrays:
+    """Reshape Level1Arrays into the wide layout without copying Tb."""
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+    n_rows = n_time * n_scan
+
+    return Level1WideArrays(
+        record=np.arange(1, n_rows + 1),
+        times=np.repeat(arrays.times, n_scan),
+        azimuth_deg=np.tile(arrays.scan_positions[:, 0], n_time),
+        elevation_deg=np.tile(arrays.scan_positions[:, 1], n_time),
+        tkbb_k=np.repeat(arrays.met.tamb_c + 273.15, n_scan),
+        channels_ghz=arrays.channels_ghz,
+        tb_k=arrays.tb_k.reshape(n_rows, n_chan),
+    )
+
+
+def level1_wide_dataframe(arrays: Level1Arrays):
+    """Level1Arrays as a wide pandas DataFrame, ready for signal_mixer.mix_signals()."""
+    import pandas as pd
+
+    wide = level1_wide_arrays(arrays)
+    header = pd.DataFrame({
+        "Record": wide.record,
+        "Date/Time": pd.to_datetime(wide.times).strftime(WIDE_DATETIME_FORMAT),
+        "50": np.full(len(wide.record), 51),
+        "Az(deg)": wide.azimuth_deg,
+        "El(deg)": wide.elevation_deg,
+        "TkBB(K)": wide.tkbb_k,
+    })
+    channels = pd.DataFrame(wide.tb_k, columns=wide.columns[len(WIDE_COLUMNS):])
+    return pd.concat([header, channels], axis=1)
+
+
+def write_level1_wide_csv(output_path: Path, arrays: Level1Arrays, chunk_seconds: int = 3600) -> None:
+    """Write Level1Arrays as a wide CSV, one formatted chunk at a time."""
+    wide = level1_wide_arrays(arrays)
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+
+    if n_time > 1:
+        step_seconds = (arrays.times[1] - arrays.times[0]) / np.timedelta64(1, "s")
+        steps_per_chunk = max(1, int(chunk_seconds // step_seconds))
+    else:
+        steps_per_chunk = 1
+
+    tb_fmt = ",".join(["%.4f"] * n_chan)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        f.write(",".join(wide.columns) + "\r\n")
+
+        for lo in range(0, n_time, steps_per_chunk):
+            hi = min(n_time, lo + steps_per_chunk)
+            times = arrays.times[lo:hi].astype("datetime64[s]").tolist()
+            rows = np.column_stack([
+                wide.record[lo * n_scan:hi * n_scan],
+                wide.azimuth_deg[lo * n_scan:hi * n_scan],
+                wide.elevation_deg[lo * n_scan:hi * n_scan],
+                wide.tkbb_k[lo * n_scan:hi * n_scan],
+                wide.tb_k[lo * n_scan:hi * n_scan],
+            ]).tolist()
+
+            parts = []
+            for i, t in enumerate(times):
+                row_fmt = f"%d,{t.strftime(WIDE_DATETIME_FORMAT)},51,%.2f,%.2f,%.2f,{tb_fmt}\r\n"
+                parts.append("".join(map(row_fmt.__mod__, map(tuple, rows[i * n_scan:(i + 1) * n_scan]))))
+
+            f.write("".join(parts))
+
+
+def write_level1_wide_npz(output_path: Path, arrays: Level1Arrays) -> None:
+    """Write Level1Arrays in the wide layout as a compressed NumPy archive."""
+    wide = level1_wide_arrays(arrays)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        output_path,
+        record=wide.record,
+        times=wide.times,
+        azimuth_deg=wide.azimuth_deg,
+        elevation_deg=wide.elevation_deg,
+        tkbb_k=wide.tkbb_k,
+        channels_ghz=wide.channels_ghz,
+        tb_k=wide.tb_k,
+    )
+
+
+def write_level1_wide_parquet(output_path: Path, arrays: Level1Arrays) -> None:
+    """Write Level1Arrays as a wide Parquet table (needs pandas + pyarrow)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    level1_wide_dataframe(arrays).to_parquet(output_path, index=False)
+
+
+LEVEL1_WRITERS = {
+    "long": {
+        "csv": write_level1_arrays_csv,
+        "npz": write_level1_npz,
+        "parquet": write_level1_parquet,
+    },
+    "wide": {
+        "csv": write_level1_wide_csv,
+        "npz": write_level1_wide_npz,
+        "parquet": write_level1_wide_parquet,
+    },
+}
+
+
+def write_level1(output_path: Path, arrays: Level1Arrays, fmt: str = "", layout: str = "long") -> None:
+    """Write Level1Arrays in the given format, or the one implied by the file suffix."""
+    if layout not in LEVEL1_WRITERS:
+        raise ValueError(f"Unsupported layout: {layout}. Expected one of: {sorted(LEVEL1_WRITERS)}")
+    writers = LEVEL1_WRITERS[layout]
+    fmt = (fmt or output_path.suffix.lstrip(".") or "csv").lower()
+    if fmt not in writers:
+        raise ValueError(f"Unsupported output format: {fmt}. Expected one of: {sorted(writers)}")
+    writers[fmt](output_path, arrays)
+
+
+# ==========================================================
+# PART 15 - In-memory generation API
+# ----------------------------------------------------------
+# Other modules (e.g. the RFIGen pipeline) call the model
+# directly instead of running the script and reading its CSV
+# back. The settings come from a plain dict, typically the
+# radiometry.rttov section of an RFIGen config:
+#
+#   hours, step_seconds, scan_positions, start_utc, channels_ghz
+# ==========================================================
+
+# Default scan pattern: the 9 requested Az-El directions.
+# Format: (azimuth_deg, elevation_deg)
+DEFAULT_SCAN_POSITIONS = [
+    (0.0, 20.0),
+    (0.0, 90.0),
+    (0.0, 160.0),
+    (45.0, 20.0),
+    (45.0, 160.0),
+    (90.0, 20.0),
+    (90.0, 160.0),
+    (135.0, 20.0),
+    (135.0, 160.0),
+]
+
+START_UTC_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def parse_start_utc(text: str) -> datetime:
+    return datetime.strptime(text, START_UTC_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def simulate_level1_from_config(rttov_cfg: dict, seed) -> Level1Arrays:
+    """
+    Run simulate_level1_arrays() with settings from a config dict.
+
+    seed may be an int or a numpy SeedSequence. Missing keys fall back
+    to 1 hour at 60 s, DEFAULT_SCAN_POSITIONS and all channels.
+    """
+    start_utc = rttov_cfg.get("start_utc")
+    channels_ghz = rttov_cfg.get("channels_ghz")
+
+    return simulate_level1_arrays(
+        start_time=parse_start_utc(start_utc) if start_utc else datetime.now(timezone.utc).replace(microsecond=0),
+        hours=rttov_cfg.get("hours", 1.0),
+        step_seconds=rttov_cfg.get("step_seconds", 60),
+        scan_positions=[tuple(p) for p in rttov_cfg.get("scan_positions") or DEFAULT_SCAN_POSITIONS],
+        seed=seed,
+        channels_ghz=channels_ghz or ALL_CHANNELS_GHZ,
+    )
+
+
+def generate_level1_dataframe(rttov_cfg: dict, seed):
+    """Wide Level-1 DataFrame from a config dict, ready for signal_mixer."""
+    return level1_wide_dataframe(simulate_level1_from_config(rttov_cfg, seed))
+
+
+# ==========================================================
+# PART 16 - Command-line arguments
 # ----------------------------------------------------------
 # This section lets the user control the script from the terminal.
 #
@@ -441,12 +1073,14 @@ def write_level1_csv(
 # - time step
 # - random seed
 # - start time
+# - output format (csv, npz or parquet)
+# - layout (long or wide)
 #
-# The scan directions are now defined inside main() using the
-# 9 requested Az-El directions.
+# The scan directions are DEFAULT_SCAN_POSITIONS, the 9
+# requested Az-El directions.
 # ==========================================================
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate synthetic MP-3000A Level-1 style data."
     )
@@ -454,7 +1088,21 @@ def parse_args() -> argparse.Namespace:
         "--output",
         type=str,
         default="mp3000a_lv1_sintetico.csv",
-        help="Output CSV path.",
+        help="Output path. The suffix selects the format unless --format is given.",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default="",
+        choices=["", *LEVEL1_WRITERS["long"]],
+        help="Output format: csv, npz or parquet.",
+    )
+    parser.add_argument(
+        "--layout",
+        type=str,
+        default="long",
+        choices=list(LEVEL1_WRITERS),
+        help="long = one row per channel, wide = one row per scan with one column per channel.",
     )
     parser.add_argument(
         "--hours",
@@ -492,19 +1140,19 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="UTC start time in YYYY-mm-ddTHH:MM:SS format. If omitted, current UTC time is used.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 # ==========================================================
-# PART 13 - Main function
+# PART 17 - Main function
 # ----------------------------------------------------------
 # This is the entry point of the script.
 # It reads the user arguments, sets the start time,
-# writes the CSV, and prints a summary.
+# simulates the arrays, writes them, and prints a summary.
 # ==========================================================
 
-def main() -> None:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
 
     if args.step_seconds <= 0:
         raise ValueError("--step-seconds must be greater than 0")
@@ -512,33 +1160,21 @@ def main() -> None:
         raise ValueError("--hours must be greater than 0")
 
     if args.start_utc.strip():
-        start_time = datetime.strptime(args.start_utc, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        start_time = parse_start_utc(args.start_utc)
     else:
         start_time = datetime.now(timezone.utc).replace(microsecond=0)
 
-    # Default scan pattern requested by the user.
-    # Format: (azimuth_deg, elevation_deg)
-    scan_positions = [
-        (0.0, 20.0),
-        (0.0, 90.0),
-        (0.0, 160.0),
-        (45.0, 20.0),
-        (45.0, 160.0),
-        (90.0, 20.0),
-        (90.0, 160.0),
-        (135.0, 20.0),
-        (135.0, 160.0),
-    ]
+    scan_positions = DEFAULT_SCAN_POSITIONS
 
     output_path = Path(args.output)
-    write_level1_csv(
-        output_path=output_path,
+    arrays = simulate_level1_arrays(
         start_time=start_time,
         hours=args.hours,
         step_seconds=args.step_seconds,
         scan_positions=scan_positions,
         seed=args.seed,
     )
+    write_level1(output_path, arrays, args.format, args.layout)
 
     print(f"File created: {output_path.resolve()}")
     print(f"Simulated channels: {len(ALL_CHANNELS_GHZ)}")
@@ -2,19 +2,68 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List
+from typing import Iterator, List
 
 import numpy as np
 import pandas as pd
 
+from .template_cache import CachedTemplate, load_cached_template
+
+
+def _assemble_frame(
+    metadata: pd.DataFrame,
+    columns: List[str],
+    channel_cols: List[str],
+    tb: np.ndarray,
+    tkbb: np.ndarray | None,
+) -> pd.DataFrame:
+    """One dataset as a DataFrame: shared metadata plus its TB (and TkBB) values."""
+    df = metadata.copy()
+    channels = pd.DataFrame(tb, columns=channel_cols, index=df.index)
+    df = pd.concat([df, channels], axis=1)
+    if tkbb is not None:
+        df["TkBB(K)"] = tkbb
+    return df[columns]
+
+
+@dataclass
+class SyntheticTBCube:
+    """A batch of synthetic datasets stored as one TB tensor.
+
+    Non-channel columns are kept once in `metadata` and shared by every
+    dataset; DataFrames are only built on demand by `to_dataframe`.
+    """
+
+    metadata: pd.DataFrame
+    columns: List[str]
+    channel_cols: List[str]
+    tb: np.ndarray
+    tkbb: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.tb.shape[0]
+
+    def to_dataframe(self, i: int) -> pd.DataFrame:
+        """Build dataset i as a DataFrame with the template's column layout."""
+        tkbb = self.tkbb[i] if self.tkbb is not None else None
+        return _assemble_frame(
+            self.metadata, self.columns, self.channel_cols, self.tb[i].astype(float), tkbb
+        )
+
+    def iter_dataframes(self) -> Iterator[pd.DataFrame]:
+        """Yield every dataset in the cube as a DataFrame."""
+        for i in range(len(self)):
+            yield self.to_dataframe(i)
+
 
 class SyntheticRadiometerGenerator:
     """Generate synthetic radiometer observations based on template data."""
 
     def __init__(
         self,
-        template_data: pd.DataFrame | None = None,
+        template_data: pd.DataFrame | CachedTemplate | None = None,
         noise_std: float = 2.0,
         seed: int | None = None,
     ):
@@ -22,8 +71,10 @@ class SyntheticRadiometerGenerator:
 
         Parameters
         ----------
-        template_data : pd.DataFrame, optional
+        template_data : pd.DataFrame or CachedTemplate, optional
             Template dataframe to use as base. If None, creates default template.
+            A `CachedTemplate` (see `load_cached_template`) is used without
+            copying its memory-mapped TB matrix.
         noise_std : float
             Standard deviation of Gaussian noise for TB values.
         seed : int, optional
@@ -46,34 +97,136 @@ class SyntheticRadiometerGenerator:
         list of pd.DataFrame
             List of synthetic dataframes with Gaussian-varied TB values.
         """
+        return list(self.iter_dataframes(n))
+
+    def iter_dataframes(self, n: int) -> Iterator[pd.DataFrame]:
+        """Yield n synthetic dataframes one at a time.
+
+        Produces the same frames as `generate_dataframes`, but only one is
+        alive at a time, so memory stays flat as n grows.
+
+        Parameters
+        ----------
+        n : int
+            Number of dataframes to generate.
+
+        Yields
+        ------
+        pd.DataFrame
+            Synthetic dataframe with Gaussian-varied TB values.
+        """
         if self.template_data is None:
             raise ValueError("Template data not provided. Load a CSV first.")
 
-        dataframes = []
+        template = self.template_data
+
+        if isinstance(template, CachedTemplate):
+            # Build each frame from the memory-mapped matrix, drawing noise
+            # in the same order as below, so the template is never copied
+            def cached_frames() -> Iterator[pd.DataFrame]:
+                for _ in range(n):
+                    noise_per_record = self.rng.normal(0, self.noise_std, len(template))
+                    tkbb = None
+                    if template.tkbb is not None:
+                        tkbb = template.tkbb + self.rng.normal(0, 0.01, len(template))
+                    yield _assemble_frame(
+                        template.metadata,
+                        template.columns,
+                        template.channel_cols,
+                        template.tb + noise_per_record[:, None],
+                        tkbb,
+                    )
+
+            return cached_frames()
+
+        # Identify frequency columns (start with "Ch ")
+        freq_cols = [col for col in template.columns if col.startswith("Ch")]
+
+        def frames() -> Iterator[pd.DataFrame]:
+            for _ in range(n):
+                # Create a copy of the template
+                df_copy = template.copy()
+
+                # Generate one noise value per record (per row) that applies to ALL channels
+                # This maintains the smooth spectral shape while varying between records
+                noise_per_record = self.rng.normal(0, self.noise_std, len(df_copy))
+
+                # Apply the same noise to all frequency channels for each record
+                df_copy[freq_cols] = df_copy[freq_cols].to_numpy() + noise_per_record[:, None]
+
+                # Optionally add small variation to TkBB (very small, ~0.01 K)
+                if "TkBB(K)" in df_copy.columns:
+                    tkbb_noise = self.rng.normal(0, 0.01, len(df_copy))
+                    df_copy["TkBB(K)"] = df_copy["TkBB(K)"] + tkbb_noise
 
-        for i in range(n):
-            # Create a copy of the template
-            df_copy = self.template_data.copy()
+                yield df_copy
 
-            # Identify frequency columns (start with "Ch ")
-            freq_cols = [col for col in df_copy.columns if col.startswith("Ch")]
+        return frames()
 
-            # Generate one noise value per record (per row) that applies to ALL channels
-            # This maintains the smooth spectral shape while varying between records
-            noise_per_record = self.rng.normal(0, self.noise_std, len(df_copy))
-            
-            # Apply the same noise to all frequency channels for each record
-            for freq_col in freq_cols:
-                df_copy[freq_col] = df_copy[freq_col] + noise_per_record
+    def generate_tensor(self, n: int, dtype: type = np.float32) -> SyntheticTBCube:
+        """Generate n synthetic datasets as a single (n, n_rows, n_channels) tensor.
 
-            # Optionally add small variation to TkBB (very small, ~0.01 K)
-            if "TkBB(K)" in df_copy.columns:
-                tkbb_noise = self.rng.normal(0, 0.01, len(df_copy))
-                df_copy["TkBB(K)"] = df_copy["TkBB(K)"] + tkbb_noise
+        All noise is drawn in one call and broadcast over the template
+        channels, instead of copying the template n times. The random
+        stream is consumed in the same order as `generate_dataframes`, so
+        with ``dtype=np.float64`` the cube holds exactly the same values.
 
-            dataframes.append(df_copy)
+        Parameters
+        ----------
+        n : int
+            Number of datasets to generate.
+        dtype : type
+            Floating point type of the TB tensor.
+
+        Returns
+        -------
+        SyntheticTBCube
+            TB tensor plus the shared metadata columns.
+        """
+        if self.template_data is None:
+            raise ValueError("Template data not provided. Load a CSV first.")
 
-        return dataframes
+        template = self.template_data
+        if isinstance(template, CachedTemplate):
+            # Read straight from the memory map
+            freq_cols = template.channel_cols
+            template_tb = template.tb
+            template_tkbb = template.tkbb
+            metadata = template.metadata
+            columns = template.columns
+        else:
+            freq_cols = [col for col in template.columns if col.startswith("Ch")]
+            template_tb = template[freq_cols].to_numpy(dtype=float)
+            template_tkbb = template["TkBB(K)"].to_numpy(dtype=float) if "TkBB(K)" in template.columns else None
+            metadata_cols = [col for col in template.columns if col not in freq_cols and col != "TkBB(K)"]
+            metadata = template[metadata_cols]
+            columns = list(template.columns)
+        has_tkbb = template_tkbb is not None
+        n_rows = len(template)
+
+        # One (noise, TkBB noise) pair of rows per dataset, drawn in the
+        # same order as the per-DataFrame loop
+        draws = self.rng.standard_normal((n, 2 if has_tkbb else 1, n_rows))
+
+        tb = np.empty((n, n_rows, len(freq_cols)), dtype=dtype)
+        np.add(
+            template_tb[None, :, :],
+            (self.noise_std * draws[:, 0])[:, :, None],
+            out=tb,
+            casting="same_kind",
+        )
+
+        tkbb = None
+        if has_tkbb:
+            tkbb = template_tkbb[None, :] + 0.01 * draws[:, 1]
+
+        return SyntheticTBCube(
+            metadata=metadata,
+            columns=columns,
+            channel_cols=freq_cols,
+            tb=tb,
+            tkbb=tkbb,
+        )
 
     @staticmethod
     def load_template(csv_path: str) -> pd.DataFrame:
@@ -82,13 +235,15 @@ class SyntheticRadiometerGenerator:
         Parameters
         ----------
         csv_path : str
-            Path to CSV file.
+            Path to CSV file, or to a processed-store ``.parquet`` day.
 
         Returns
         -------
         pd.DataFrame
             Loaded template data.
         """
+        if str(csv_path).endswith(".parquet"):
+            return pd.read_parquet(csv_path)
         return pd.read_csv(csv_path)
 
     @staticmethod
@@ -154,6 +309,7 @@ def generate_synthetic_dataset(
     noise_std: float = 2.0,
     seed: int = 42,
     output_dir: str = "src/data/datos_radiometro_sinteticos",
+    cache_dir: str | None = None,
 ) -> List[pd.DataFrame]:
     """Generate a dataset of synthetic radiometer dataframes.
 
@@ -169,6 +325,9 @@ def generate_synthetic_dataset(
         Random seed.
     output_dir : str
         Output directory for saving.
+    cache_dir : str, optional
+        If given, load the template through the memory-mapped template
+        cache in this directory.
 
     Returns
     -------
@@ -176,7 +335,9 @@ def generate_synthetic_dataset(
         Generated synthetic dataframes.
     """
     # Load or create template
-    if template_path:
+    if template_path and cache_dir:
+        template = load_cached_template(template_path, cache_dir)
+    elif template_path:
         template = SyntheticRadiometerGenerator.load_template(template_path)
     else:
         template = SyntheticRadiometerGenerator.create_default_template()
@@ -0,0 +1,228 @@
+"""Batched multi-source RFI synthesis.
+
+Builds the summed RFI contribution of many sources with a single
+(time x source) @ (source x freq) contraction instead of accumulating one
+(n_time, n_freq) temporary per source.
+
+The frequency shapes do not depend on the random stream, so the shape
+matrix of a source table on a channel grid is computed once and reused
+for every dataset built from the same template (see
+`cached_frequency_shape_matrix`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .rfi_generator import (
+    MODULATIONS,
+    SPECTRAL_SHAPES,
+    RFISourceTable,
+    time_envelope,
+)
+
+
+def angular_coupling_matrix(
+    pointing_az_deg: np.ndarray,
+    pointing_el_deg: np.ndarray,
+    source_az_deg: np.ndarray,
+    source_el_deg: np.ndarray,
+    sigma_deg: np.ndarray
+) -> np.ndarray:
+    """Vectorized `angular_coupling` for a pointing series against many sources.
+
+    Parameters
+    ----------
+    pointing_az_deg, pointing_el_deg : np.ndarray
+        Radiometer pointing per time step, shape (n_time,).
+    source_az_deg, source_el_deg, sigma_deg : np.ndarray
+        Source direction and beam width, shape (n_sources,).
+
+    Returns
+    -------
+    np.ndarray
+        Coupling matrix of shape (n_sources, n_time).
+    """
+    pointing_az_deg = np.asarray(pointing_az_deg, dtype=float)
+    pointing_el_deg = np.asarray(pointing_el_deg, dtype=float)
+    source_az_deg = np.asarray(source_az_deg, dtype=float).reshape(-1, 1)
+    source_el_deg = np.asarray(source_el_deg, dtype=float).reshape(-1, 1)
+    sigma_deg = np.maximum(0.5, np.asarray(sigma_deg, dtype=float)).reshape(-1, 1)
+
+    dist2 = (pointing_az_deg[None, :] - source_az_deg) ** 2
+    dist2 += (pointing_el_deg[None, :] - source_el_deg) ** 2
+    return np.exp(-dist2 / (2 * sigma_deg**2))
+
+
+def frequency_shape_matrix(
+    freqs_ghz: np.ndarray,
+    center_ghz: np.ndarray,
+    bandwidth_ghz: np.ndarray,
+    spectral_shape_code: np.ndarray
+) -> np.ndarray:
+    """Vectorized `frequency_shape` for many sources.
+
+    `spectral_shape_code` indexes `SPECTRAL_SHAPES`.
+
+    Returns
+    -------
+    np.ndarray
+        Shape matrix of shape (n_sources, n_freq).
+    """
+    freqs_ghz = np.asarray(freqs_ghz, dtype=float)
+    center_ghz = np.asarray(center_ghz, dtype=float).reshape(-1, 1)
+    bandwidth_ghz = np.asarray(bandwidth_ghz, dtype=float).reshape(-1, 1)
+    spectral_shape_code = np.asarray(spectral_shape_code).reshape(-1, 1)
+    gaussian = spectral_shape_code == SPECTRAL_SHAPES.index("gaussian")
+
+    x = (freqs_ghz[None, :] - center_ghz) / (bandwidth_ghz / 2)
+    return np.where(gaussian, np.exp(-x**2), np.where(np.abs(x) <= 1, 1.0, 0.0))
+
+
+# Upper bound on the memory held by cached shape matrices; the least
+# recently used matrices are dropped first
+SHAPE_CACHE_MAX_BYTES = 64 * 2**20
+
+_SHAPE_CACHE: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+
+
+def _array_key(*arrays: np.ndarray) -> str:
+    """Content hash of a few arrays (dtype, shape and values)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+
+def cached_frequency_shape_matrix(
+    freqs_ghz: np.ndarray,
+    sources: RFISourceTable
+) -> np.ndarray:
+    """`frequency_shape_matrix` of a source table, memoized across calls.
+
+    Entries are keyed by (channel-grid hash, source hash), where the
+    source hash covers only what the shapes depend on (center,
+    bandwidth and spectral shape of each source), so tables with the
+    same spectra share one entry. Entries are evicted least recently
+    used once `SHAPE_CACHE_MAX_BYTES` is reached.
+    A matrix larger than the whole budget is computed but not stored.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only shape matrix of shape (n_sources, n_freq).
+    """
+    freqs_ghz = np.asarray(freqs_ghz, dtype=float)
+    key = (
+        _array_key(freqs_ghz),
+        _array_key(sources.center_ghz, sources.bandwidth_ghz, sources.spectral_shape_code),
+    )
+    shapes = _SHAPE_CACHE.get(key)
+    if shapes is not None:
+        _SHAPE_CACHE.move_to_end(key)
+        return shapes
+
+    shapes = frequency_shape_matrix(
+        freqs_ghz,
+        sources.center_ghz, sources.bandwidth_ghz, sources.spectral_shape_code
+    )
+    shapes.setflags(write=False)
+    if shapes.nbytes <= SHAPE_CACHE_MAX_BYTES:
+        _SHAPE_CACHE[key] = shapes
+        while sum(m.nbytes for m in _SHAPE_CACHE.values()) > SHAPE_CACHE_MAX_BYTES:
+            _SHAPE_CACHE.popitem(last=False)
+    return shapes
+
+
+def clear_shape_cache() -> None:
+    """Drop every cached shape matrix."""
+    _SHAPE_CACHE.clear()
+
+
+def time_envelope_matrix(
+    n_samples: int,
+    avg_power: np.ndarray,
+    peak_power: np.ndarray,
+    modulation_code: np.ndarray,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Stack `time_envelope` for many sources.
+
+    `modulation_code` indexes `MODULATIONS`. Random draws are made in
+    source order, so the envelopes match calling `time_envelope` once per
+    source with the same generator.
+
+    Returns
+    -------
+    np.ndarray
+        Envelope matrix of shape (n_sources, n_samples).
+    """
+    avg_power = np.asarray(avg_power, dtype=float)
+    modulation_code = np.asarray(modulation_code)
+
+    envelopes = np.repeat(avg_power[:, None], n_samples, axis=1)
+    continuous = MODULATIONS.index("continuous")
+    for i in np.flatnonzero(modulation_code != continuous):
+        envelopes[i] = time_envelope(
+            n_samples, avg_power[i], peak_power[i], MODULATIONS[modulation_code[i]], rng
+        )
+    return envelopes
+
+
+def synthesize_rfi(
+    freqs_ghz: np.ndarray,
+    pointing_az_deg: np.ndarray,
+    pointing_el_deg: np.ndarray,
+    sources: RFISourceTable,
+    rng: np.random.Generator,
+    return_per_source: bool = False
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Build the summed RFI of all sources in one contraction.
+
+    Parameters
+    ----------
+    freqs_ghz : np.ndarray
+        Channel frequencies, shape (n_freq,).
+    pointing_az_deg, pointing_el_deg : np.ndarray
+        Radiometer pointing per time step, shape (n_time,).
+    sources : RFISourceTable
+        Structure-of-arrays source table.
+    rng : np.random.Generator
+        Random number generator.
+    return_per_source : bool
+        If True, also return the (n_sources, n_time, n_freq) contributions.
+
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, np.ndarray]]
+        Total RFI of shape (n_time, n_freq) and a dict with the
+        "envelopes", "shapes" and "coupling" matrices (plus "per_source"
+        when requested).
+    """
+    n_time = len(pointing_az_deg)
+
+    coupling = angular_coupling_matrix(
+        pointing_az_deg, pointing_el_deg,
+        sources.az_deg, sources.el_deg, sources.sigma_deg
+    )
+    envelopes = time_envelope_matrix(
+        n_time,
+        sources.avg_power_K, sources.peak_power_K, sources.modulation_code,
+        rng
+    )
+    shapes = cached_frequency_shape_matrix(freqs_ghz, sources)
+
+    # (time x source) @ (source x freq)
+    weighted = envelopes * coupling
+    total = weighted.T @ shapes
+
+    details = {"envelopes": envelopes, "shapes": shapes, "coupling": coupling}
+    if return_per_source:
+        details["per_source"] = weighted[:, :, None] * shapes[:, None, :]
+    return total, details
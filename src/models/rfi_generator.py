@@ -5,7 +5,13 @@
 # ============================================================
 
 import numpy as np
-from typing import Any, Tuple
+from dataclasses import dataclass
+from typing import Any, Sequence, Tuple
+
+
+# Categories encoded by the integer code columns of RFISourceTable
+MODULATIONS = ("continuous", "pulsed", "burst")
+SPECTRAL_SHAPES = ("gaussian", "flat")
 
 
 # ============================================================
@@ -53,6 +59,137 @@ def sample_rfi_source(rng: np.random.Generator, source_class: str) -> dict[str,
     return source
 
 
+# ============================================================
+# COLUMNAR SOURCE TABLE
+# ============================================================
+
+@dataclass
+class RFISourceTable:
+    """Structure-of-arrays table of RFI sources.
+
+    Every numeric field is a NumPy array of length n_sources. Categorical
+    fields are stored as integer codes: `source_class` indexes `classes`,
+    `modulation_code` indexes `MODULATIONS` and `spectral_shape_code`
+    indexes `SPECTRAL_SHAPES`.
+    """
+
+    classes: Tuple[str, ...]
+    source_class: np.ndarray
+    center_ghz: np.ndarray
+    bandwidth_ghz: np.ndarray
+    avg_power_K: np.ndarray
+    peak_power_K: np.ndarray
+    az_deg: np.ndarray
+    el_deg: np.ndarray
+    sigma_deg: np.ndarray
+    modulation_code: np.ndarray
+    spectral_shape_code: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.center_ghz)
+
+    @property
+    def modulation(self) -> np.ndarray:
+        """Modulation names, one per source."""
+        return np.asarray(MODULATIONS)[self.modulation_code]
+
+    @property
+    def spectral_shape(self) -> np.ndarray:
+        """Spectral shape names, one per source."""
+        return np.asarray(SPECTRAL_SHAPES)[self.spectral_shape_code]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert to the list-of-dicts layout of `sample_rfi_source`."""
+        class_names = np.asarray(self.classes, dtype=object)[self.source_class]
+        return [
+            {
+                "source_class": source_class,
+                "center_ghz": center_ghz,
+                "bandwidth_ghz": bandwidth_ghz,
+                "avg_power_K": avg_power_K,
+                "peak_power_K": peak_power_K,
+                "az_deg": az_deg,
+                "el_deg": el_deg,
+                "sigma_deg": sigma_deg,
+                "modulation": MODULATIONS[modulation_code],
+                "spectral_shape": SPECTRAL_SHAPES[spectral_shape_code],
+            }
+            for (
+                source_class, center_ghz, bandwidth_ghz, avg_power_K,
+                peak_power_K, az_deg, el_deg, sigma_deg,
+                modulation_code, spectral_shape_code,
+            ) in zip(
+                class_names.tolist(),
+                self.center_ghz.tolist(),
+                self.bandwidth_ghz.tolist(),
+                self.avg_power_K.tolist(),
+                self.peak_power_K.tolist(),
+                self.az_deg.tolist(),
+                self.el_deg.tolist(),
+                self.sigma_deg.tolist(),
+                self.modulation_code.tolist(),
+                self.spectral_shape_code.tolist(),
+            )
+        ]
+
+    @classmethod
+    def from_dicts(cls, sources: Sequence[dict[str, Any]]) -> "RFISourceTable":
+        """Build a table from a list of source dictionaries."""
+        class_names = [str(source["source_class"]) for source in sources]
+        classes = tuple(dict.fromkeys(class_names))
+        class_index = {name: i for i, name in enumerate(classes)}
+
+        def column(name: str) -> np.ndarray:
+            return np.array([source[name] for source in sources], dtype=float)
+
+        return cls(
+            classes=classes,
+            source_class=np.array([class_index[c] for c in class_names], dtype=np.int32),
+            center_ghz=column("center_ghz"),
+            bandwidth_ghz=column("bandwidth_ghz"),
+            avg_power_K=column("avg_power_K"),
+            peak_power_K=column("peak_power_K"),
+            az_deg=column("az_deg"),
+            el_deg=column("el_deg"),
+            sigma_deg=column("sigma_deg"),
+            modulation_code=np.array(
+                [MODULATIONS.index(str(source["modulation"])) for source in sources],
+                dtype=np.int8,
+            ),
+            spectral_shape_code=np.array(
+                [SPECTRAL_SHAPES.index(str(source["spectral_shape"])) for source in sources],
+                dtype=np.int8,
+            ),
+        )
+
+
+def sample_rfi_table(
+    rng: np.random.Generator,
+    n_sources: int,
+    source_classes: Sequence[str]
+) -> RFISourceTable:
+    """Vectorized `sample_rfi_source`: draw n_sources at once.
+
+    Parameter ranges match `sample_rfi_source`; each column is drawn with
+    a single RNG call.
+    """
+    classes = tuple(source_classes) if source_classes else ("unknown",)
+
+    return RFISourceTable(
+        classes=classes,
+        source_class=rng.integers(0, len(classes), size=n_sources, dtype=np.int32),
+        center_ghz=rng.uniform(22, 30, size=n_sources),
+        bandwidth_ghz=rng.uniform(0.05, 1.5, size=n_sources),
+        avg_power_K=rng.uniform(1, 10, size=n_sources),
+        peak_power_K=rng.uniform(10, 50, size=n_sources),
+        az_deg=rng.uniform(0, 360, size=n_sources),
+        el_deg=rng.uniform(0, 90, size=n_sources),
+        sigma_deg=rng.uniform(1, 20, size=n_sources),
+        modulation_code=rng.integers(0, len(MODULATIONS), size=n_sources, dtype=np.int8),
+        spectral_shape_code=rng.integers(0, len(SPECTRAL_SHAPES), size=n_sources, dtype=np.int8),
+    )
+
+
 # ============================================================
 # FREQUENCY SHAPE
 # ============================================================
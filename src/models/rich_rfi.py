@@ -0,0 +1,1005 @@
+"""Physically detailed RFI source model.
+
+Per-class source physics (5G, radar, broadcast, ISM, unintentional
+emitters), spectral shapes with spikes, broadband noise and OFDM-like
+blocks, spurious harmonics, pulse / burst time envelopes, and coupling
+through pointing mismatch, distance, propagation path, antenna gain and
+polarization.
+
+Only NumPy and pandas are needed, so the model can run in headless batch
+jobs as well as behind the GUI (``gui_visual.py``). Select it in the
+pipeline with ``rfi.model: rich``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config.config_parser import RICH_RFI_SOURCE_CLASSES
+
+# Source classes offered by the model (GENERIC_CLASS is only a fallback);
+# defined with the config validation so both use the same names
+RFI_SOURCE_CLASSES = RICH_RFI_SOURCE_CLASSES
+
+# Band observed by the instrument, used for the overlap flag in metadata
+INSTRUMENT_BAND_GHZ = (22.0, 30.0)
+
+# Attenuation per propagation path; unknown paths use PATH_FACTOR_DEFAULT
+PATH_FACTORS = {
+    "line_of_sight": 1.00,
+    "reflected": 0.65,
+    "scattered": 0.40,
+}
+PATH_FACTOR_DEFAULT = 0.6
+
+# Modulations placed as random bursts; everything else is a pulse train
+_BURSTY_KEYWORDS = ("bursty", "random", "switching")
+
+# Layout of Date/Time strings written by the radiometry generators
+_DATETIME_FORMAT = "%m/%d/%y %H:%M:%S"
+
+
+# ============================================================
+# TIME AND ANGLE HELPERS
+# ============================================================
+
+def _to_datetime(values: Any) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return np.asarray(values, dtype="datetime64[ns]")
+    parsed = pd.to_datetime(pd.Series(values), format=_DATETIME_FORMAT, errors="coerce")
+    if parsed.isna().all():
+        parsed = pd.to_datetime(pd.Series(values), format="mixed", errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+def estimate_dt_seconds(dt_series: Any) -> float:
+    """Median time step between samples in seconds (1.0 if unknown).
+
+    Pulse widths and repetition rates are converted to samples with it.
+    """
+    try:
+        t = _to_datetime(dt_series)
+        if len(t) < 2:
+            return 1.0
+        d = np.diff((t - t[0]) / np.timedelta64(1, "s"))
+        d = d[np.isfinite(d)]
+        if d.size == 0:
+            return 1.0
+        med = float(np.nanmedian(d))
+        return med if (np.isfinite(med) and med > 0) else 1.0
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def angular_coupling_matrix(
+    pointing_az_deg: np.ndarray,
+    pointing_el_deg: np.ndarray,
+    source_az_deg: np.ndarray,
+    source_el_deg: np.ndarray,
+    sigma_deg: np.ndarray
+) -> np.ndarray:
+    """Gaussian beam coupling of many sources into a pointing series.
+
+    The azimuth mismatch wraps around 360 degrees; a smaller `sigma_deg`
+    means a more directional source.
+
+    Parameters
+    ----------
+    pointing_az_deg, pointing_el_deg : np.ndarray
+        Radiometer pointing per time step, shape (n_time,).
+    source_az_deg, source_el_deg, sigma_deg : np.ndarray
+        Source direction and angular width, shape (n_sources,).
+
+    Returns
+    -------
+    np.ndarray
+        Coupling matrix of shape (n_sources, n_time).
+    """
+    pointing_az_deg = np.atleast_1d(np.asarray(pointing_az_deg, dtype=float))
+    pointing_el_deg = np.atleast_1d(np.asarray(pointing_el_deg, dtype=float))
+    source_az_deg = np.asarray(source_az_deg, dtype=float).reshape(-1, 1)
+    source_el_deg = np.asarray(source_el_deg, dtype=float).reshape(-1, 1)
+    sigma_deg = np.maximum(0.5, np.asarray(sigma_deg, dtype=float)).reshape(-1, 1)
+
+    d_az = np.abs(pointing_az_deg[None, :] - source_az_deg) % 360.0
+    d_az = np.minimum(d_az, 360.0 - d_az)
+    d_el = pointing_el_deg[None, :] - source_el_deg
+    return np.exp(-0.5 * (d_az**2 + d_el**2) / sigma_deg**2)
+
+
+def static_coupling(
+    distance_km: np.ndarray,
+    propagation_path: np.ndarray,
+    antenna_gain_factor: np.ndarray,
+    polarization_factor: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pointing-independent part of the coupling, per source.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Total factor, distance factor and path factor, each shape
+        (n_sources,).
+    """
+    distance_km = np.maximum(0.001, np.asarray(distance_km, dtype=float))
+    distance_factor = 1.0 / (1.0 + 0.35 * distance_km**1.15)
+    path_factor = np.array(
+        [PATH_FACTORS.get(str(p), PATH_FACTOR_DEFAULT) for p in np.atleast_1d(propagation_path)]
+    )
+    total = (
+        distance_factor
+        * path_factor
+        * np.asarray(antenna_gain_factor, dtype=float)
+        * np.asarray(polarization_factor, dtype=float)
+    )
+    return total, distance_factor, path_factor
+
+
+# ============================================================
+# SOURCE SAMPLING
+# ============================================================
+
+# Per-class source physics, one entry per RFI class.
+#
+#   - categorical attributes: {value: probability}
+#   - "licensed": fixed per class
+#   - "bandwidth_mhz": values drawn with equal probability
+#   - continuous parameters: (distribution, center, spread, low, high)
+#       normal:    N(center, spread) clipped to [low, high]
+#       lognormal: exp(N(log(center), spread)) clipped to [low, high]
+#   - "peak_to_average": (low, high, cap): peak = average * U(low, high),
+#     clipped to [average, cap]
+#
+# GENERIC_CLASS holds the fixed fallback values used for a class name
+# that is not in the table.
+GENERIC_CLASS = "Generic"
+
+RFI_CLASS_TABLE: Dict[str, Dict[str, Any]] = {
+    # 5G source: wide, structured, OFDM-like, bursty/moderate.
+    "5G": {
+        "spectral_shape": {"ofdm_like": 0.65, "flat": 0.20, "spiky": 0.15},
+        "modulation_scheme": {"OFDM": 0.45, "bursty-OFDM": 0.35, "QAM-OFDM": 0.20},
+        "emission_type": {"intentional": 0.85, "spurious": 0.15},
+        "propagation_path": {"line_of_sight": 0.65, "reflected": 0.25, "scattered": 0.10},
+        "compliance": {"compliant": 0.70, "partially-compliant": 0.20, "unknown": 0.10},
+        "licensed": True,
+        "bandwidth_mhz": [50, 100, 200, 400],
+        "center_ghz": ("normal", 27.8, 0.8, 23.0, 29.5),
+        "duty_cycle": ("normal", 0.28, 0.14, 0.03, 0.95),
+        "pulse_width_s": ("lognormal", 0.8, 0.7, 0.05, 8.0),
+        "repetition_rate_hz": ("normal", 0.4, 0.22, 0.02, 3.0),
+        "average_power_K": ("normal", 260.0, 120.0, 40.0, 1500.0),
+        "peak_to_average": (1.4, 3.5, 3500.0),
+        "angular_sigma_deg": ("normal", 12.0, 5.0, 2.0, 40.0),
+        "distance_km": ("lognormal", 1.2, 0.9, 0.05, 25.0),
+        "antenna_gain_factor": ("normal", 1.0, 0.35, 0.2, 2.2),
+    },
+    # Radar: narrow / pulsed / high peak power / directional.
+    "Radar Systems": {
+        "spectral_shape": {"spiky": 0.65, "gaussian": 0.35},
+        "modulation_scheme": {"pulsed": 0.45, "pulse-train": 0.40, "chirp-like": 0.15},
+        "emission_type": {"intentional": 1.0},
+        "propagation_path": {"line_of_sight": 0.78, "reflected": 0.22},
+        "compliance": {"compliant": 0.55, "unknown": 0.25, "partially-compliant": 0.20},
+        "licensed": True,
+        "bandwidth_mhz": [10, 20, 40, 80, 120],
+        "center_ghz": ("normal", 25.5, 2.0, 22.1, 29.8),
+        "duty_cycle": ("normal", 0.10, 0.08, 0.005, 0.50),
+        "pulse_width_s": ("lognormal", 0.08, 0.9, 0.005, 1.0),
+        "repetition_rate_hz": ("normal", 4.0, 2.5, 0.2, 20.0),
+        "average_power_K": ("normal", 180.0, 100.0, 20.0, 1200.0),
+        "peak_to_average": (4.0, 12.0, 5000.0),
+        "angular_sigma_deg": ("normal", 5.0, 2.5, 0.8, 12.0),
+        "distance_km": ("lognormal", 3.0, 0.9, 0.2, 60.0),
+        "antenna_gain_factor": ("normal", 1.35, 0.45, 0.3, 3.0),
+    },
+    # Broadcast: more stable, almost continuous, flatter spectrum.
+    "Broadcast Services": {
+        "spectral_shape": {"flat": 0.65, "gaussian": 0.35},
+        "modulation_scheme": {"continuous": 0.60, "am-like": 0.20, "fm-like": 0.20},
+        "emission_type": {"intentional": 0.75, "spurious": 0.25},
+        "propagation_path": {"line_of_sight": 0.50, "reflected": 0.30, "scattered": 0.20},
+        "compliance": {"compliant": 0.65, "partially-compliant": 0.20, "unknown": 0.15},
+        "licensed": True,
+        "bandwidth_mhz": [6, 8, 20, 40, 80],
+        "center_ghz": ("normal", 24.5, 2.2, 22.0, 30.0),
+        "duty_cycle": ("normal", 0.85, 0.12, 0.20, 1.00),
+        "pulse_width_s": ("lognormal", 2.5, 0.5, 0.2, 15.0),
+        "repetition_rate_hz": ("normal", 0.15, 0.08, 0.01, 1.0),
+        "average_power_K": ("normal", 140.0, 70.0, 15.0, 900.0),
+        "peak_to_average": (1.1, 1.8, 1800.0),
+        "angular_sigma_deg": ("normal", 18.0, 6.0, 4.0, 45.0),
+        "distance_km": ("lognormal", 6.0, 1.0, 0.5, 120.0),
+        "antenna_gain_factor": ("normal", 0.95, 0.25, 0.2, 1.8),
+    },
+    # ISM: can be bursty / nearby / irregular.
+    "ISM Equipment": {
+        "spectral_shape": {"flat": 0.45, "spiky": 0.35, "gaussian": 0.20},
+        "modulation_scheme": {"continuous": 0.30, "bursty": 0.45, "frequency-hopping-like": 0.25},
+        "emission_type": {"intentional": 0.60, "spurious": 0.40},
+        "propagation_path": {"line_of_sight": 0.45, "reflected": 0.35, "scattered": 0.20},
+        "compliance": {"unknown": 0.45, "partially-compliant": 0.35, "compliant": 0.20},
+        "licensed": False,
+        "bandwidth_mhz": [20, 40, 80, 100, 200],
+        "center_ghz": ("normal", 24.125, 0.35, 22.0, 30.0),
+        "duty_cycle": ("normal", 0.50, 0.22, 0.05, 1.00),
+        "pulse_width_s": ("lognormal", 0.35, 0.8, 0.02, 6.0),
+        "repetition_rate_hz": ("normal", 1.2, 0.9, 0.05, 8.0),
+        "average_power_K": ("normal", 240.0, 140.0, 20.0, 1800.0),
+        "peak_to_average": (1.5, 4.5, 3500.0),
+        "angular_sigma_deg": ("normal", 16.0, 7.0, 3.0, 45.0),
+        "distance_km": ("lognormal", 0.35, 0.8, 0.005, 8.0),
+        "antenna_gain_factor": ("normal", 1.1, 0.35, 0.2, 2.2),
+    },
+    # Unintentional emitters: messy, broadband, irregular, switching-like.
+    "Unintentional Emitters": {
+        "spectral_shape": {"broadband": 0.50, "spiky": 0.35, "gaussian": 0.15},
+        "modulation_scheme": {"random-bursty": 0.45, "switching-noise-like": 0.40, "continuous": 0.15},
+        "emission_type": {"unintentional": 1.0},
+        "propagation_path": {"scattered": 0.45, "reflected": 0.35, "line_of_sight": 0.20},
+        "compliance": {"unknown": 0.55, "non-compliant": 0.20, "partially-compliant": 0.25},
+        "licensed": False,
+        "bandwidth_mhz": [100, 200, 400, 800, 1500],
+        "center_ghz": ("normal", 25.0, 2.3, 22.0, 30.0),
+        "duty_cycle": ("normal", 0.35, 0.22, 0.02, 0.95),
+        "pulse_width_s": ("lognormal", 0.18, 1.0, 0.005, 4.0),
+        "repetition_rate_hz": ("normal", 1.8, 1.3, 0.05, 12.0),
+        "average_power_K": ("normal", 120.0, 90.0, 5.0, 900.0),
+        "peak_to_average": (1.2, 3.5, 2200.0),
+        "angular_sigma_deg": ("normal", 30.0, 10.0, 6.0, 80.0),
+        "distance_km": ("lognormal", 0.12, 0.9, 0.001, 3.0),
+        "antenna_gain_factor": ("normal", 0.8, 0.25, 0.1, 1.6),
+    },
+    # Fallback: fixed generic values.
+    GENERIC_CLASS: {
+        "spectral_shape": {"gaussian": 1.0},
+        "modulation_scheme": {"continuous": 1.0},
+        "emission_type": {"intentional": 1.0},
+        "propagation_path": {"line_of_sight": 1.0},
+        "compliance": {"unknown": 1.0},
+        "licensed": True,
+        "bandwidth_mhz": [100],
+        "center_ghz": ("normal", 26.0, 0.0, 26.0, 26.0),
+        "duty_cycle": ("normal", 0.3, 0.0, 0.3, 0.3),
+        "pulse_width_s": ("lognormal", 1.0, 0.0, 1.0, 1.0),
+        "repetition_rate_hz": ("normal", 0.5, 0.0, 0.5, 0.5),
+        "average_power_K": ("normal", 200.0, 0.0, 200.0, 200.0),
+        "peak_to_average": (2.5, 2.5, 500.0),
+        "angular_sigma_deg": ("normal", 12.0, 0.0, 12.0, 12.0),
+        "distance_km": ("lognormal", 1.0, 0.0, 1.0, 1.0),
+        "antenna_gain_factor": ("normal", 1.0, 0.0, 1.0, 1.0),
+    },
+}
+
+# Attributes shared by every class
+POLARIZATION_TYPES = ["linear-horizontal", "linear-vertical", "circular", "elliptical"]
+
+_CATEGORICAL_PARAMS = ["spectral_shape", "modulation_scheme", "emission_type", "propagation_path", "compliance"]
+_CONTINUOUS_PARAMS = [
+    "center_ghz", "duty_cycle", "pulse_width_s", "repetition_rate_hz", "average_power_K",
+    "angular_sigma_deg", "distance_km", "antenna_gain_factor",
+]
+
+
+def _compile_class_table(table: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    # Turn RFI_CLASS_TABLE into arrays indexed by class code, so a batch
+    # of sources can look up its parameters with one fancy index.
+    classes = list(table)
+    compiled: Dict[str, Any] = {"classes": classes}
+
+    for name in _CATEGORICAL_PARAMS:
+        vocab: List[str] = []
+        for spec in table.values():
+            vocab += [v for v in spec[name] if v not in vocab]
+        probs = np.array([[spec[name].get(v, 0.0) for v in vocab] for spec in table.values()])
+        compiled[name] = (vocab, np.cumsum(probs / probs.sum(axis=1, keepdims=True), axis=1))
+
+    for name in _CONTINUOUS_PARAMS:
+        kinds = {spec[name][0] for spec in table.values()}
+        if len(kinds) != 1:
+            raise ValueError(f"{name} must use the same distribution for every class.")
+        rows = np.array([spec[name][1:] for spec in table.values()], dtype=float)
+        center = np.log(rows[:, 0]) if kinds == {"lognormal"} else rows[:, 0]
+        compiled[name] = (kinds.pop(), center, rows[:, 1], rows[:, 2], rows[:, 3])
+
+    widths = [len(spec["bandwidth_mhz"]) for spec in table.values()]
+    bw = np.zeros((len(classes), max(widths)))
+    for i, spec in enumerate(table.values()):
+        bw[i, :widths[i]] = spec["bandwidth_mhz"]
+    compiled["bandwidth_mhz"] = (bw, np.array(widths))
+
+    compiled["peak_to_average"] = np.array([spec["peak_to_average"] for spec in table.values()], dtype=float).T
+    compiled["licensed"] = np.array([spec["licensed"] for spec in table.values()], dtype=bool)
+    return compiled
+
+
+_CLASS_ARRAYS = _compile_class_table(RFI_CLASS_TABLE)
+
+
+class RichSourceTable:
+    """A batch of rich-model RFI sources stored column by column.
+
+    Numeric columns are NumPy arrays of length n_sources. Categorical
+    columns are small integer codes into ``categories[name]``;
+    ``table[name]`` decodes them. ``row(i)`` gives the same dictionary
+    as `sample_rfi_source`.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, List[str]]):
+        self.columns = columns
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        col = self.columns[name]
+        if name in self.categories:
+            return np.asarray(self.categories[name], dtype=object)[col]
+        return col
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Source i as a dictionary of Python scalars."""
+        out: Dict[str, Any] = {}
+        for name, col in self.columns.items():
+            value = col[i]
+            out[name] = self.categories[name][value] if name in self.categories else value.item()
+        return out
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per source, categorical columns as pandas Categoricals."""
+        return pd.DataFrame({
+            name: pd.Categorical.from_codes(col, self.categories[name]) if name in self.categories else col
+            for name, col in self.columns.items()
+        })
+
+
+def _draw_categorical(rng: np.random.Generator, cum_probs: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    # One category code per source from its row of cumulative probabilities.
+    u = rng.random(rows.size)
+    codes = (u[:, None] >= cum_probs[rows]).sum(axis=1)
+    return np.minimum(codes, cum_probs.shape[1] - 1).astype(np.int16)
+
+
+def sample_rfi_sources(
+    rng: np.random.Generator,
+    n: int,
+    class_weights: Optional[Dict[str, float]] = None,
+    source_class: Optional[str] = None
+) -> RichSourceTable:
+    """Draw n RFI sources in one vectorized pass.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Random number generator.
+    n : int
+        Number of sources.
+    class_weights : Dict[str, float], optional
+        Relative probability of each class; classes are drawn from this
+        categorical distribution. All of `RFI_SOURCE_CLASSES` equally
+        likely by default.
+    source_class : str, optional
+        Draw every source from this class instead. Names missing from
+        `RFI_CLASS_TABLE` get the fixed `GENERIC_CLASS` values.
+
+    Returns
+    -------
+    RichSourceTable
+        Columnar table of the n sources.
+    """
+    t = _CLASS_ARRAYS
+    classes = t["classes"]
+
+    if source_class is not None:
+        name = source_class.strip()
+        label = name
+        if name not in RFI_CLASS_TABLE:
+            name = GENERIC_CLASS
+        class_names = [label]
+        rows = np.full(n, classes.index(name), dtype=np.int64)
+        class_codes = np.zeros(n, dtype=np.int16)
+    else:
+        weights = class_weights if class_weights is not None else {c: 1.0 for c in RFI_SOURCE_CLASSES}
+        unknown = set(weights) - set(RFI_CLASS_TABLE)
+        if unknown:
+            raise ValueError(f"Unknown RFI source classes: {sorted(unknown)}")
+        class_names = list(weights)
+        p = np.array([weights[c] for c in class_names], dtype=float)
+        class_codes = _draw_categorical(rng, np.cumsum(p / p.sum())[None, :], np.zeros(n, dtype=np.int64))
+        rows = np.array([classes.index(c) for c in class_names])[class_codes]
+
+    columns: Dict[str, np.ndarray] = {"source_class": class_codes}
+    categories: Dict[str, List[str]] = {"source_class": class_names}
+
+    for name in _CATEGORICAL_PARAMS:
+        vocab, cum_probs = t[name]
+        columns[name] = _draw_categorical(rng, cum_probs, rows)
+        categories[name] = vocab
+
+    values: Dict[str, np.ndarray] = {}
+    for name in _CONTINUOUS_PARAMS:
+        kind, center, spread, lo, hi = t[name]
+        x = center[rows] + spread[rows] * rng.standard_normal(n)
+        if kind == "lognormal":
+            x = np.exp(x)
+        values[name] = np.clip(x, lo[rows], hi[rows])
+
+    bw_table, bw_count = t["bandwidth_mhz"]
+    pick = np.minimum((rng.random(n) * bw_count[rows]).astype(np.int64), bw_count[rows] - 1)
+    bandwidth_mhz = bw_table[rows, pick]
+
+    ratio_lo, ratio_hi, cap = t["peak_to_average"]
+    avg = values["average_power_K"]
+    peak = np.clip(avg * rng.uniform(ratio_lo[rows], ratio_hi[rows]), avg, np.maximum(avg, cap[rows]))
+
+    # Geometry and polarization do not depend on the class
+    rfi_az_deg = rng.uniform(0.0, 360.0, n)
+    rfi_el_deg = rng.uniform(0.0, 90.0, n)
+    columns["polarization_type"] = rng.integers(0, len(POLARIZATION_TYPES), n).astype(np.int16)
+    categories["polarization_type"] = POLARIZATION_TYPES
+    polarization_factor = np.clip(rng.normal(0.72, 0.22, n), 0.08, 1.0)
+
+    # Derived parameters
+    center = values["center_ghz"]
+    bandwidth_ghz = bandwidth_mhz / 1000.0
+    protected_band_overlap = ((23.6 <= center) & (center <= 24.0)) | (
+        (center - bandwidth_ghz / 2 < 23.8) & (23.8 < center + bandwidth_ghz / 2)
+    )
+
+    columns.update({
+        "center_ghz": center,
+        "bandwidth_mhz": bandwidth_mhz,
+        "bandwidth_ghz": bandwidth_ghz,
+        "duty_cycle": values["duty_cycle"],
+        "pulse_width_s": values["pulse_width_s"],
+        "repetition_rate_hz": values["repetition_rate_hz"],
+        "peak_power_K": peak,
+        "average_power_K": avg,
+        "psd_like_K_per_ghz": avg / np.maximum(bandwidth_ghz, 1e-6),
+        "rfi_az_deg": rfi_az_deg,
+        "rfi_el_deg": rfi_el_deg,
+        "angular_sigma_deg": values["angular_sigma_deg"],
+        "distance_km": values["distance_km"],
+        "antenna_gain_factor": values["antenna_gain_factor"],
+        "polarization_factor": polarization_factor,
+        "licensed": t["licensed"][rows],
+        "protected_band_overlap": protected_band_overlap,
+    })
+    return RichSourceTable(columns, categories)
+
+
+def sample_rfi_source(rng: np.random.Generator, source_class: str) -> Dict[str, Any]:
+    """Draw one source of `source_class` as a dictionary.
+
+    Parameter ranges per class are listed in `RFI_CLASS_TABLE`.
+    """
+    return sample_rfi_sources(rng, 1, source_class=source_class).row(0)
+
+
+# ============================================================
+# FREQUENCY SHAPE
+# ============================================================
+
+def build_frequency_shape(
+    freqs_ghz: np.ndarray,
+    center_ghz: float,
+    bandwidth_ghz: float,
+    spectral_shape: str,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Spectral signature of a source over the channel grid, peak 1.
+
+    `spectral_shape` is one of gaussian, flat, spiky, broadband or
+    ofdm_like; spiky, broadband and ofdm_like draw from `rng`.
+    """
+    freqs_ghz = np.asarray(freqs_ghz, dtype=float)
+    half_bw = max(1e-9, bandwidth_ghz / 2.0)
+    x = (freqs_ghz - center_ghz) / half_bw
+
+    # Smooth bell-shaped spectrum.
+    if spectral_shape == "gaussian":
+        shape = np.exp(-0.5 * (x / 0.75) ** 2)
+
+    # Mostly flat inside the band, weak leakage outside.
+    elif spectral_shape == "flat":
+        shape = np.where(np.abs(x) <= 1.0, 1.0, 0.03 * np.exp(-2.0 * np.abs(x)))
+
+    # Narrow spikes / tones inside the band.
+    elif spectral_shape == "spiky":
+        base = np.where(np.abs(x) <= 1.0, 0.35, 0.0)
+        shape = base.copy()
+        idx = np.where(np.abs(x) <= 1.0)[0]
+        if len(idx) > 0:
+            n_spikes = int(min(len(idx), max(3, len(idx) // 3)))
+            chosen = rng.choice(idx, size=n_spikes, replace=False)
+            shape[chosen] += rng.uniform(0.6, 1.4, size=n_spikes)
+        shape += 0.02 * np.exp(-2.0 * np.abs(x))
+
+    # Broadband messy spectrum.
+    elif spectral_shape == "broadband":
+        shape = np.exp(-0.5 * (x / 1.6) ** 2) + 0.10 * rng.random(len(freqs_ghz))
+
+    # OFDM-like block spectrum with ripple/jitter across bins.
+    else:  # ofdm_like
+        inband = np.abs(x) <= 1.0
+        shape = np.zeros_like(freqs_ghz, dtype=float)
+        idx = np.where(inband)[0]
+        if len(idx) > 0:
+            n_in = len(idx)
+            grid = np.linspace(0.0, 1.0, n_in)
+            roll = 0.3 + 0.7 * (0.5 * (1 + np.cos(np.pi * np.linspace(-1, 1, n_in))))
+            ripple = np.zeros(n_in, dtype=float)
+            n_tones = int(rng.integers(6, 18))
+            for _ in range(n_tones):
+                k = float(rng.uniform(1.0, 10.0))
+                phase = float(rng.uniform(0.0, 2.0 * np.pi))
+                ripple += np.sin(2.0 * np.pi * k * grid + phase)
+            ripple = ripple / (np.max(np.abs(ripple)) + 1e-12)
+            jitter = rng.normal(0.0, 0.15, size=n_in)
+            band_profile = roll * (1.0 + 0.35 * ripple + jitter)
+            band_profile = np.clip(band_profile, 0.0, None)
+            shape[idx] = band_profile
+
+        shape += 0.02 * np.exp(-0.5 * (x / 1.8) ** 2)
+
+    # Normalize so the max spectral amplitude is 1.
+    shape = np.asarray(shape, dtype=float)
+    maxv = float(np.nanmax(shape)) if shape.size else 0.0
+    if maxv > 0:
+        shape = shape / maxv
+    return shape
+
+
+def source_frequency_shape(
+    freqs_ghz: np.ndarray,
+    center_ghz: float,
+    bandwidth_ghz: float,
+    spectral_shape: str,
+    emission_type: str,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """`build_frequency_shape` plus spurious side components, peak 1.
+
+    Spurious emitters get two extra harmonics beside the main band.
+    """
+    freqs = np.asarray(freqs_ghz, dtype=float)
+    shape = build_frequency_shape(freqs, center_ghz, bandwidth_ghz, spectral_shape, rng)
+
+    harmonic_shape = np.zeros_like(freqs, dtype=float)
+    if emission_type == "spurious":
+        bw = bandwidth_ghz
+        harmonic_1 = np.exp(-0.5 * ((freqs - (center_ghz + 0.6 * bw)) / max(0.04, 0.25 * bw)) ** 2)
+        harmonic_2 = np.exp(-0.5 * ((freqs - (center_ghz - 0.75 * bw)) / max(0.04, 0.22 * bw)) ** 2)
+        harmonic_shape = harmonic_1 + 0.8 * harmonic_2
+        if np.max(harmonic_shape) > 0:
+            harmonic_shape = harmonic_shape / np.max(harmonic_shape)
+
+    full = shape + 0.18 * harmonic_shape
+    if full.size and np.max(full) > 0:
+        full = full / np.max(full)
+    return full
+
+
+# ============================================================
+# TIME ENVELOPE
+# ============================================================
+
+def _place_bursts(
+    t_len: int,
+    pulse_len: int,
+    n_bursts: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    # Random start indices of n_bursts non-overlapping bursts of
+    # pulse_len samples, with starts in [0, t_len - pulse_len).
+    #
+    # Draw n sorted offsets in the space left after reserving
+    # pulse_len samples per burst, then shift burst i by i * pulse_len.
+    # Consecutive starts are therefore at least pulse_len apart, with
+    # no retries, so the cost is O(n_bursts log n_bursts) whatever the
+    # duty cycle. Asking for more bursts than fit gives as many as fit.
+    n_starts = max(1, t_len - pulse_len)
+    n_fit = (n_starts - 1) // pulse_len + 1
+    n = min(max(0, n_bursts), n_fit)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    free = n_starts - (n - 1) * pulse_len
+    offsets = np.sort(rng.integers(0, free, size=n))
+    return offsets + np.arange(n) * pulse_len
+
+
+def _random_ranks(eligible: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    # Random order of the eligible positions in each row: ranks
+    # 0, 1, 2, ... go to eligible cells in random order, the rest
+    # get ranks past the last eligible one.
+    keys = np.where(eligible, rng.random(eligible.shape), 2.0)
+    order = np.argsort(keys, axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(eligible.shape[1])[None, :], axis=1)
+    return ranks
+
+
+def build_pulse_trains(
+    t_len: int,
+    pulse_len: Any,
+    period_len: Any,
+    target_on: Any,
+    average_power_K: Any,
+    peak_power_K: Any,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Periodic pulse trains for a batch of sources.
+
+    Each row gets a random phase and one random amplitude per pulse,
+    then is trimmed (random on-samples switched off) or padded (random
+    off-samples switched on at 0.7*avg..peak) to exactly `target_on`
+    active samples, as far as `t_len` allows.
+
+    Parameters
+    ----------
+    t_len : int
+        Number of time samples.
+    pulse_len, period_len, target_on : int or array-like
+        Pulse length, pulse period and target active samples, in samples.
+    average_power_K, peak_power_K : float or array-like
+        Amplitude range of the pulses.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        Envelope matrix of shape (n_sources, t_len).
+    """
+    pulse_len, period_len, target_on, avg, peak = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v)) for v in (pulse_len, period_len, target_on, average_power_K, peak_power_K))
+    )
+    pulse_len = pulse_len.astype(np.int64)
+    period_len = np.maximum(1, period_len.astype(np.int64))
+    target_on = target_on.astype(np.int64)
+    avg = avg.astype(float)
+    peak = peak.astype(float)
+    n = pulse_len.size
+
+    # Sample t belongs to pulse k = (t - phase0) // period and is on
+    # while it is within pulse_len samples of that pulse's start.
+    phase0 = rng.integers(0, period_len)
+    rel = np.arange(t_len)[None, :] - phase0[:, None]
+    k = rel // period_len[:, None]
+    on = (rel >= 0) & (rel % period_len[:, None] < pulse_len[:, None])
+
+    n_pulses = max(1, int(k.max(initial=0)) + 1)
+    amps = rng.uniform(avg[:, None], peak[:, None], size=(n, n_pulses))
+    envelope = np.where(on, np.take_along_axis(amps, np.clip(k, 0, n_pulses - 1), axis=1), 0.0)
+
+    # Trim / pad to the target number of active samples
+    active = envelope > 0
+    current_on = active.sum(axis=1)
+    trim = current_on > target_on
+    pad = current_on < target_on
+
+    if trim.any():
+        keep = np.maximum(1, target_on[trim])
+        ranks = _random_ranks(active[trim], rng)
+        rows = envelope[trim]
+        rows[ranks >= keep[:, None]] = 0.0
+        envelope[trim] = rows
+
+    if pad.any():
+        needed = (target_on - current_on)[pad]
+        ranks = _random_ranks(~active[pad], rng)
+        add = ranks < needed[:, None]
+        fill = rng.uniform(0.7 * avg[pad, None], peak[pad, None], size=add.shape)
+        envelope[pad] = np.where(add, fill, envelope[pad])
+
+    return envelope
+
+
+def _finish_envelopes(
+    envelopes: np.ndarray,
+    average_power_K: np.ndarray,
+    peak_power_K: np.ndarray,
+    rng: np.random.Generator
+) -> np.ndarray:
+    # Shared post-processing of raw (n_sources, t_len) envelopes:
+    # slight smoothing so the signal is less blocky, a slow fading
+    # factor (load/beam/power variation) and small fluctuations on
+    # active samples, clipped to the peak power.
+    n, t_len = envelopes.shape
+    if t_len >= 3:
+        padded = np.pad(envelopes, ((0, 0), (1, 1)))
+        envelopes = 0.2 * padded[:, :-2] + 0.6 * padded[:, 1:-1] + 0.2 * padded[:, 2:]
+
+    slow = np.linspace(0.0, 2.0 * np.pi, t_len)
+    phase = rng.uniform(0.0, 2.0 * np.pi, size=n)
+    envelopes = envelopes * (1.0 + 0.18 * np.sin(2.3 * slow[None, :] + phase[:, None]))
+
+    active = envelopes > 0
+    if np.any(active):
+        sigma = np.broadcast_to((0.07 * average_power_K)[:, None], envelopes.shape)
+        envelopes[active] += rng.normal(0.0, 1.0, size=int(active.sum())) * sigma[active]
+        envelopes = np.clip(envelopes, 0.0, peak_power_K[:, None])
+    return envelopes
+
+
+def build_temporal_envelopes(
+    t_len: int,
+    dt_seconds: float,
+    duty_cycle: np.ndarray,
+    pulse_width_s: np.ndarray,
+    repetition_rate_hz: np.ndarray,
+    average_power_K: np.ndarray,
+    peak_power_K: np.ndarray,
+    modulation_scheme: np.ndarray,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Time envelopes of many sources on a shared time axis.
+
+    Bursty, random and switching modulations get non-overlapping random
+    bursts (`_place_bursts`); all others get periodic pulse trains
+    (`build_pulse_trains`, one call for all of them). Both reach
+    ``round(duty_cycle * t_len)`` active samples before smoothing.
+
+    Returns
+    -------
+    np.ndarray
+        Envelope matrix of shape (n_sources, t_len).
+    """
+    duty_cycle = np.atleast_1d(np.asarray(duty_cycle, dtype=float))
+    n = duty_cycle.size
+    avg = np.broadcast_to(np.asarray(average_power_K, dtype=float), (n,))
+    peak = np.broadcast_to(np.asarray(peak_power_K, dtype=float), (n,))
+    envelopes = np.zeros((n, max(0, t_len)), dtype=float)
+    if t_len <= 0 or n == 0:
+        return envelopes
+
+    dt_seconds = max(1e-6, float(dt_seconds))
+    pulse_width_s = np.broadcast_to(np.asarray(pulse_width_s, dtype=float), (n,))
+    repetition_rate_hz = np.broadcast_to(np.asarray(repetition_rate_hz, dtype=float), (n,))
+
+    pulse_len = np.maximum(1, np.round(pulse_width_s / dt_seconds).astype(np.int64))
+    with np.errstate(divide="ignore"):
+        period = np.round((1.0 / repetition_rate_hz) / dt_seconds)
+    period_len = np.where(
+        repetition_rate_hz <= 0,
+        np.maximum(pulse_len + 1, t_len + 1),
+        np.maximum(pulse_len, np.where(np.isfinite(period), period, 0).astype(np.int64)),
+    )
+    target_on = np.round(duty_cycle * t_len).astype(np.int64)
+
+    mods = [str(m).lower() for m in np.atleast_1d(modulation_scheme)]
+    bursty = np.array([any(k in m for k in _BURSTY_KEYWORDS) for m in mods])
+
+    for i in np.flatnonzero(bursty):
+        # Enough bursts to reach the target on-time, placed without overlap
+        p = int(pulse_len[i])
+        starts = _place_bursts(t_len, p, -(-int(target_on[i]) // p), rng)
+        if starts.size:
+            amps = rng.uniform(avg[i], peak[i], size=starts.size)
+            idx = (starts[:, None] + np.arange(p)).ravel()
+            keep = idx < t_len
+            envelopes[i, idx[keep]] = np.repeat(amps, p)[keep]
+
+    periodic = ~bursty
+    if periodic.any():
+        envelopes[periodic] = build_pulse_trains(
+            t_len, pulse_len[periodic], period_len[periodic], target_on[periodic],
+            avg[periodic], peak[periodic], rng
+        )
+
+    return _finish_envelopes(envelopes, avg, peak, rng)
+
+
+def build_temporal_envelope(
+    t_len: int,
+    dt_seconds: float,
+    duty_cycle: float,
+    pulse_width_s: float,
+    repetition_rate_hz: float,
+    average_power_K: float,
+    peak_power_K: float,
+    modulation_scheme: str,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, Dict[str, float]]:
+    """Time envelope of one source (see `build_temporal_envelopes`).
+
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, float]]
+        Envelope of length t_len and ``{"actual_duty_cycle": ...}``.
+    """
+    envelope = build_temporal_envelopes(
+        t_len, dt_seconds, duty_cycle, pulse_width_s, repetition_rate_hz,
+        average_power_K, peak_power_K, [modulation_scheme], rng
+    )[0]
+    actual_duty = float(np.mean(envelope > 0)) if t_len > 0 else 0.0
+    return envelope, {"actual_duty_cycle": actual_duty}
+
+
+# ============================================================
+# APPLYING RFI
+# ============================================================
+
+def add_rfi_to_df(
+    df_in: pd.DataFrame,
+    channel_cols: List[str],
+    channel_freqs: np.ndarray,
+    source: Dict[str, Any],
+    pointing_az_deg: float,
+    pointing_el_deg: float,
+    rng: np.random.Generator
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Add one source to data observed from a single pointing.
+
+    RFI(t, f) = time_envelope(t) * freq_shape(f) * total_coupling, where
+    the coupling combines angular mismatch, distance, propagation path,
+    antenna gain and polarization.
+
+    Parameters
+    ----------
+    df_in : pd.DataFrame
+        Data with a Date/Time column and the channel columns.
+    channel_cols : List[str]
+        Channel columns to contaminate.
+    channel_freqs : np.ndarray
+        Frequency of each channel column, GHz.
+    source : Dict[str, Any]
+        Source from `sample_rfi_source`.
+    pointing_az_deg, pointing_el_deg : float
+        Radiometer pointing for every row.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Dict[str, Any]]
+        Contaminated copy of the data and the source metadata, extended
+        with the coupling terms actually used.
+    """
+    df = df_in.copy()
+    if "Date/Time" not in df.columns or not channel_cols:
+        return df, source
+
+    dt_seconds = estimate_dt_seconds(df["Date/Time"])
+    freqs = np.asarray(channel_freqs, dtype=float)
+    center_ghz = float(source["center_ghz"])
+    bw_ghz = float(source["bandwidth_ghz"])
+
+    full_freq_shape = source_frequency_shape(
+        freqs, center_ghz, bw_ghz, str(source["spectral_shape"]), str(source["emission_type"]), rng
+    )
+    time_env, time_meta = build_temporal_envelope(
+        t_len=len(df),
+        dt_seconds=dt_seconds,
+        duty_cycle=float(source["duty_cycle"]),
+        pulse_width_s=float(source["pulse_width_s"]),
+        repetition_rate_hz=float(source["repetition_rate_hz"]),
+        average_power_K=float(source["average_power_K"]),
+        peak_power_K=float(source["peak_power_K"]),
+        modulation_scheme=str(source["modulation_scheme"]),
+        rng=rng
+    )
+
+    angular_factor = float(angular_coupling_matrix(
+        pointing_az_deg, pointing_el_deg,
+        source["rfi_az_deg"], source["rfi_el_deg"], source["angular_sigma_deg"]
+    )[0, 0])
+    other, distance_factor, path_factor = static_coupling(
+        source["distance_km"], [source["propagation_path"]],
+        source["antenna_gain_factor"], source["polarization_factor"]
+    )
+    total_coupling = angular_factor * float(other[0])
+
+    rfi_K = time_env[:, None] * full_freq_shape[None, :] * total_coupling
+    X = df[channel_cols].to_numpy(float)
+    df.loc[:, channel_cols] = X + rfi_K
+
+    band_low = center_ghz - bw_ghz / 2.0
+    band_high = center_ghz + bw_ghz / 2.0
+    overlaps_instrument = bool((band_high >= INSTRUMENT_BAND_GHZ[0]) and (band_low <= INSTRUMENT_BAND_GHZ[1]))
+
+    meta = dict(source)
+    meta.update(time_meta)
+    meta.update({
+        "dt_seconds": dt_seconds,
+        "band_low_ghz": band_low,
+        "band_high_ghz": band_high,
+        "angular_coupling": angular_factor,
+        "distance_factor": float(np.asarray(distance_factor).ravel()[0]),
+        "path_factor": float(path_factor[0]),
+        "total_coupling": total_coupling,
+        "overlaps_instrument": overlaps_instrument,
+        "pointing_az_deg": pointing_az_deg,
+        "pointing_el_deg": pointing_el_deg,
+    })
+    return df, meta
+
+
+def add_rich_rfi_to_dataframe(
+    df: pd.DataFrame,
+    sources: RichSourceTable,
+    rng: np.random.Generator
+) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """Add every source of a table to one radiometric DataFrame.
+
+    Rich-model counterpart of `signal_mixer.add_rfi_to_dataframe`: each
+    row is coupled through its own Az/El pointing, and the sources are
+    summed in a single (time x source) @ (source x freq) contraction.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Radiometric data with ``Ch ...`` channel columns, Az(deg) and
+        El(deg). Modified in place.
+    sources : RichSourceTable
+        Sources from `sample_rfi_sources`.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, List[Dict[str, Any]]]
+        Updated DataFrame and one info dictionary per source: its
+        parameters plus ``power`` (peak, K), ``avg_coupling`` and
+        ``actual_duty_cycle``.
+    """
+    freq_cols = [col for col in df.columns if col.startswith("Ch ")]
+    if not freq_cols:
+        raise ValueError("No frequency channels found in DataFrame.")
+    freqs_ghz = np.array([float(col.split()[1]) for col in freq_cols])
+
+    n_time = len(df)
+    dt_seconds = estimate_dt_seconds(df["Date/Time"]) if "Date/Time" in df.columns else 1.0
+
+    envelopes = build_temporal_envelopes(
+        n_time,
+        dt_seconds,
+        sources["duty_cycle"],
+        sources["pulse_width_s"],
+        sources["repetition_rate_hz"],
+        sources["average_power_K"],
+        sources["peak_power_K"],
+        sources["modulation_scheme"],
+        rng,
+    )
+    shapes = np.array([
+        source_frequency_shape(freqs_ghz, center, bw, shape, emission, rng)
+        for center, bw, shape, emission in zip(
+            sources["center_ghz"].tolist(),
+            sources["bandwidth_ghz"].tolist(),
+            sources["spectral_shape"],
+            sources["emission_type"],
+        )
+    ]).reshape(len(sources), len(freqs_ghz))
+
+    static, _, _ = static_coupling(
+        sources["distance_km"], sources["propagation_path"],
+        sources["antenna_gain_factor"], sources["polarization_factor"]
+    )
+    coupling = angular_coupling_matrix(
+        df["Az(deg)"].to_numpy(dtype=float),
+        df["El(deg)"].to_numpy(dtype=float),
+        sources["rfi_az_deg"], sources["rfi_el_deg"], sources["angular_sigma_deg"],
+    ) * static[:, None]
+
+    # (time x source) @ (source x freq)
+    rfi_signal = (envelopes * coupling).T @ shapes
+    df[freq_cols] = df[freq_cols].to_numpy(dtype=float) + rfi_signal
+
+    avg_coupling = coupling.mean(axis=1) if n_time else np.zeros(len(sources))
+    actual_duty = (envelopes > 0).mean(axis=1) if n_time else np.zeros(len(sources))
+    infos = []
+    for i in range(len(sources)):
+        info = sources.row(i)
+        info.update({
+            "power": info["peak_power_K"],
+            "avg_coupling": float(avg_coupling[i]),
+            "actual_duty_cycle": float(actual_duty[i]),
+        })
+        infos.append(info)
+    return df, infos
@@ -6,8 +6,10 @@
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Tuple
-from .rfi_generator import sample_rfi_source, add_rfi
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+from .rfi_generator import RFISourceTable, sample_rfi_source, sample_rfi_table, add_rfi
+from .rfi_engine import angular_coupling_matrix, synthesize_rfi
 
 
 def generate_rfi_sources(
@@ -39,9 +41,45 @@ def generate_rfi_sources(
     return sources
 
 
+def generate_rfi_table(
+    n_sources: int,
+    source_classes: List[str],
+    rng: np.random.Generator
+) -> RFISourceTable:
+    """Generate RFI sources as a columnar table in one vectorized draw.
+
+    Parameters
+    ----------
+    n_sources : int
+        Number of RFI sources to generate.
+    source_classes : List[str]
+        List of source classes to choose from.
+    rng : np.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    RFISourceTable
+        Table of n_sources RFI sources.
+    """
+    return sample_rfi_table(rng, n_sources, source_classes)
+
+
+@lru_cache(maxsize=32)
+def _channel_grid(columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Channel columns ("Ch <GHz>") and their frequencies, parsed once per layout.
+
+    Both are shared by every caller, so both are immutable.
+    """
+    freq_cols = tuple(col for col in columns if col.startswith("Ch "))
+    freqs_ghz = np.array([float(col.split()[1]) for col in freq_cols])
+    freqs_ghz.setflags(write=False)
+    return freq_cols, freqs_ghz
+
+
 def add_rfi_to_dataframe(
     df: pd.DataFrame,
-    sources: List[Dict[str, Any]],
+    sources: List[Dict[str, Any]] | RFISourceTable,
     rng: np.random.Generator
 ) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
     """Add RFI signals to a single radiometric DataFrame.
@@ -50,8 +88,8 @@ def add_rfi_to_dataframe(
     ----------
     df : pd.DataFrame
         Radiometric data DataFrame.
-    sources : List[Dict[str, Any]]
-        List of RFI sources.
+    sources : List[Dict[str, Any]] or RFISourceTable
+        List of RFI sources, or the same sources as a columnar table.
     rng : np.random.Generator
         Random number generator.
 
@@ -60,68 +98,46 @@ def add_rfi_to_dataframe(
     Tuple[pd.DataFrame, List[Dict[str, Any]]]
         Updated DataFrame and list of RFI info for each source.
     """
-    # Extract frequency columns
-    freq_cols = [col for col in df.columns if col.startswith("Ch ")]
-    if not freq_cols:
+    # Extract frequency columns and their frequencies (cached per column
+    # layout, shared by every dataset built from one template)
+    channel_cols, freqs_ghz = _channel_grid(tuple(df.columns))
+    if not channel_cols:
         raise ValueError("No frequency channels found in DataFrame.")
-
-    # Extract frequencies
-    freqs_ghz = np.array([float(col.split()[1]) for col in freq_cols])
+    freq_cols = list(channel_cols)  # pandas reads a tuple as a single key
 
     # Extract TB data
     tb_data = df[freq_cols].values.astype(float)  # shape (n_time, n_freq)
 
-    # Extract pointing angles (assume per row, but for simplicity, use first or average)
-    # For proper coupling, we need per-time coupling, but add_rfi assumes fixed.
-    # To fix, compute coupling per time step.
-
-    az_deg = df["Az(deg)"].values
-    el_deg = df["El(deg)"].values
-
-    rfi_infos = []
-
-    for source in sources:
-        # Compute coupling for each time step
-        couplings = []
-        for az, el in zip(az_deg, el_deg):
-            coupling = angular_coupling(
-                az, el,
-                source["az_deg"], source["el_deg"],
-                source["sigma_deg"]
-            )
-            couplings.append(coupling)
-        coupling_array = np.array(couplings)  # shape (n_time,)
-
-        # Modify add_rfi to handle per-time coupling
-        # Instead of fixed coupling, use coupling_array
-
-        # Time + frequency behavior
-        t_env = time_envelope(
-            tb_data.shape[0],
-            source["avg_power_K"],
-            source["peak_power_K"],
-            source["modulation"],
-            rng
+    if not isinstance(sources, RFISourceTable):
+        sources = RFISourceTable.from_dicts(sources)
+
+    # Final RFI model: sum over sources of t_env * f_shape * coupling(t),
+    # built in a single (time x source) @ (source x freq) contraction
+    rfi_signal, details = synthesize_rfi(
+        freqs_ghz,
+        df["Az(deg)"].to_numpy(dtype=float),
+        df["El(deg)"].to_numpy(dtype=float),
+        sources,
+        rng
+    )
+
+    tb_data += rfi_signal
+
+    avg_coupling = details["coupling"].mean(axis=1)
+    rfi_infos = [
+        {
+            "center_ghz": center,
+            "bandwidth_ghz": bandwidth,
+            "power": power,
+            "avg_coupling": coupling,
+        }
+        for center, bandwidth, power, coupling in zip(
+            sources.center_ghz.tolist(),
+            sources.bandwidth_ghz.tolist(),
+            sources.peak_power_K.tolist(),
+            avg_coupling.tolist(),
         )
-
-        f_shape = frequency_shape(
-            freqs_ghz,
-            source["center_ghz"],
-            source["bandwidth_ghz"],
-            source["spectral_shape"]
-        )
-
-        # Final RFI model: t_env (n_time,) * f_shape (n_freq,) * coupling (n_time,)
-        rfi_signal = t_env[:, None] * f_shape[None, :] * coupling_array[:, None]
-
-        tb_data += rfi_signal
-
-        rfi_infos.append({
-            "center_ghz": source["center_ghz"],
-            "bandwidth_ghz": source["bandwidth_ghz"],
-            "power": source["peak_power_K"],
-            "avg_coupling": np.mean(coupling_array)
-        })
+    ]
 
     # Update DataFrame
     df[freq_cols] = tb_data
@@ -131,7 +147,7 @@ def add_rfi_to_dataframe(
 
 def mix_signals(
     data: List[pd.DataFrame] | pd.DataFrame,
-    sources: List[Dict[str, Any]],
+    sources: List[Dict[str, Any]] | RFISourceTable,
     rng: np.random.Generator
 ) -> Tuple[List[pd.DataFrame] | pd.DataFrame, List[List[Dict[str, Any]]]]:
     """Mix RFI signals into radiometric data.
@@ -140,8 +156,8 @@ def mix_signals(
     ----------
     data : List[pd.DataFrame] or pd.DataFrame
         Radiometric data (list of DataFrames or single DataFrame).
-    sources : List[Dict[str, Any]]
-        List of RFI sources.
+    sources : List[Dict[str, Any]] or RFISourceTable
+        List of RFI sources, or the same sources as a columnar table.
     rng : np.random.Generator
         Random number generator.
 
@@ -156,8 +172,7 @@ def mix_signals(
     updated_data = []
     all_infos = []
 
-    for df in data:
-        updated_df, infos = add_rfi_to_dataframe(df.copy(), sources, rng)
+    for _, updated_df, infos in iter_mixed(data, sources, rng):
         updated_data.append(updated_df)
         all_infos.append(infos)
 
@@ -167,6 +182,39 @@ def mix_signals(
         return updated_data, all_infos
 
 
+def iter_mixed(
+    data: Iterable[pd.DataFrame],
+    sources: List[Dict[str, Any]] | RFISourceTable,
+    rng: np.random.Generator
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame, List[Dict[str, Any]]]]:
+    """Mix RFI into a stream of DataFrames, one dataset at a time.
+
+    Consumes `data` lazily (e.g. `SyntheticRadiometerGenerator.iter_dataframes`),
+    so only the current dataset is held in memory.
+
+    Parameters
+    ----------
+    data : Iterable[pd.DataFrame]
+        Radiometric DataFrames.
+    sources : List[Dict[str, Any]] or RFISourceTable
+        List of RFI sources, or the same sources as a columnar table.
+    rng : np.random.Generator
+        Random number generator.
+
+    Yields
+    ------
+    Tuple[pd.DataFrame, pd.DataFrame, List[Dict[str, Any]]]
+        Clean DataFrame, contaminated DataFrame and RFI infos.
+    """
+    # Convert the sources to columns once, not once per DataFrame
+    if not isinstance(sources, RFISourceTable):
+        sources = RFISourceTable.from_dicts(sources)
+
+    for df in data:
+        contaminated, infos = add_rfi_to_dataframe(df.copy(), sources, rng)
+        yield df, contaminated, infos
+
+
 # Helper functions copied from rfi_generator for per-time coupling
 def angular_coupling(
     pointing_az_deg: float,
@@ -0,0 +1,198 @@
+"""On-disk cache of radiometer templates as memory-mapped TB matrices.
+
+A template file (CSV or Parquet) is converted once into
+
+- ``<key>.tb.npy``: the (n_rows, n_channels) TB matrix, float64
+- ``<key>.meta.npz``: the non-channel columns (Record, Date/Time,
+  Az/El, ...) and TkBB as plain arrays
+- ``<key>.meta.json``: the column layout and the dtype of each column
+
+where ``key`` is a hash of the file contents. Later loads open the
+matrix with ``np.load(mmap_mode="r")``, so every process using the
+same template shares the operating system's page cache instead of
+holding its own copy.
+
+Nothing is unpickled from the cache directory. An entry that cannot be
+read back (truncated, or written by an incompatible version) is
+treated as a miss and rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path(".rfigen_cache") / "templates"
+
+# Bump when the cached layout changes so stale entries are ignored
+CACHE_VERSION = 2
+
+
+@dataclass
+class CachedTemplate:
+    """A template whose TB matrix is a read-only memory map.
+
+    Pickling only sends the cache location, so worker processes re-open
+    the same file instead of receiving a copy of the matrix.
+    """
+
+    metadata: pd.DataFrame
+    columns: List[str]
+    channel_cols: List[str]
+    tb: np.ndarray
+    tkbb: np.ndarray | None
+    tb_path: Path
+
+    def __len__(self) -> int:
+        return self.tb.shape[0]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Rebuild the template as a regular (in-memory) DataFrame.
+
+        This copies the whole TB matrix into memory. Generators read `tb`
+        directly instead (see `SyntheticRadiometerGenerator`), so use this
+        only to inspect a template.
+        """
+        df = self.metadata.copy()
+        channels = pd.DataFrame(np.array(self.tb), columns=self.channel_cols, index=df.index)
+        df = pd.concat([df, channels], axis=1)
+        if self.tkbb is not None:
+            df["TkBB(K)"] = self.tkbb
+        return df[self.columns]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["tb"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.tb = np.load(self.tb_path, mmap_mode="r")
+
+
+def template_key(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """Content hash of a template file."""
+    digest = hashlib.sha256(f"rfigen-template-v{CACHE_VERSION}".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def _read_template(path: str | Path) -> pd.DataFrame:
+    if str(path).endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _write_cache(template: pd.DataFrame, tb_path: Path, meta_path: Path, layout_path: Path) -> None:
+    channel_cols = [col for col in template.columns if col.startswith("Ch")]
+    metadata_cols = [col for col in template.columns if col not in channel_cols and col != "TkBB(K)"]
+    has_tkbb = "TkBB(K)" in template.columns
+
+    # Strings are stored as fixed-width unicode, with a mask for missing
+    # values, so the arrays load back without pickle
+    arrays: Dict[str, np.ndarray] = {}
+    for i, col in enumerate(metadata_cols):
+        values = template[col]
+        if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+            arrays[f"col{i}"] = values.fillna("").to_numpy(dtype=str)
+            arrays[f"null{i}"] = values.isna().to_numpy()
+        else:
+            arrays[f"col{i}"] = values.to_numpy()
+    if has_tkbb:
+        arrays["tkbb"] = template["TkBB(K)"].to_numpy(dtype=float)
+
+    layout = {
+        "version": CACHE_VERSION,
+        "columns": list(template.columns),
+        "channel_cols": channel_cols,
+        "metadata_cols": metadata_cols,
+        "dtypes": [str(template[col].dtype) for col in metadata_cols],
+        "has_tkbb": has_tkbb,
+    }
+
+    # Write to temporary names and rename, so a concurrent reader never
+    # sees a half-written entry; the .npy appearing marks it complete.
+    pid = os.getpid()
+    tmp_meta = meta_path.with_name(f"{meta_path.name}.{pid}.tmp")
+    tmp_layout = layout_path.with_name(f"{layout_path.name}.{pid}.tmp")
+    tmp_tb = tb_path.with_name(f"{tb_path.name}.{pid}.tmp")
+    with open(tmp_meta, "wb") as f:
+        np.savez(f, **arrays)
+    with open(tmp_layout, "w", encoding="utf-8") as f:
+        json.dump(layout, f)
+    with open(tmp_tb, "wb") as f:
+        np.save(f, np.ascontiguousarray(template[channel_cols].to_numpy(dtype=float)))
+    os.replace(tmp_meta, meta_path)
+    os.replace(tmp_layout, layout_path)
+    os.replace(tmp_tb, tb_path)
+
+
+def _read_cache(tb_path: Path, meta_path: Path, layout_path: Path) -> CachedTemplate:
+    with open(layout_path, encoding="utf-8") as f:
+        layout = json.load(f)
+    if layout.get("version") != CACHE_VERSION:
+        raise ValueError(f"cache entry version {layout.get('version')} != {CACHE_VERSION}")
+
+    with np.load(meta_path, allow_pickle=False) as arrays:
+        metadata = {}
+        for i, (col, dtype) in enumerate(zip(layout["metadata_cols"], layout["dtypes"])):
+            values = arrays[f"col{i}"]
+            if f"null{i}" in arrays:
+                values = np.where(arrays[f"null{i}"], None, values.astype(object))
+            metadata[col] = pd.Series(values, dtype=dtype)
+        tkbb = arrays["tkbb"] if layout["has_tkbb"] else None
+
+    return CachedTemplate(
+        metadata=pd.DataFrame(metadata, columns=layout["metadata_cols"]),
+        columns=layout["columns"],
+        channel_cols=layout["channel_cols"],
+        tb=np.load(tb_path, mmap_mode="r", allow_pickle=False),
+        tkbb=tkbb,
+        tb_path=tb_path,
+    )
+
+
+def load_cached_template(
+    path: str | Path,
+    cache_dir: str | Path = DEFAULT_CACHE_DIR
+) -> CachedTemplate:
+    """Load a template through the cache, converting it on first use.
+
+    Parameters
+    ----------
+    path : str or Path
+        Template CSV (or processed-store Parquet) file.
+    cache_dir : str or Path
+        Cache directory.
+
+    Returns
+    -------
+    CachedTemplate
+        Template with a memory-mapped TB matrix.
+    """
+    cache_dir = Path(cache_dir).resolve()
+    key = template_key(path)
+    # Absolute, so unpickled copies find the matrix from any directory
+    tb_path = cache_dir / f"{key}.tb.npy"
+    meta_path = cache_dir / f"{key}.meta.npz"
+    layout_path = cache_dir / f"{key}.meta.json"
+
+    if tb_path.exists() and meta_path.exists() and layout_path.exists():
+        try:
+            return _read_cache(tb_path, meta_path, layout_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable entry: treat as a miss and rebuild it below
+            pass
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_cache(_read_template(path), tb_path, meta_path, layout_path)
+    return _read_cache(tb_path, meta_path, layout_path)
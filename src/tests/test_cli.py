@@ -0,0 +1,108 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.cli.rfigen_cli import iter_datasets, run_pipeline
+from src.models.radiometry import SyntheticRadiometerGenerator
+from src.models.template_cache import template_key
+from src.models.signal_mixer import generate_rfi_table
+
+
+def write_config(tmp_path, radiometry=None, rfi=None, **run_overrides):
+    config_path = tmp_path / "config.json"
+    run_cfg = {"seed": 11, "n_datasets": 3}
+    run_cfg.update(run_overrides)
+    config = {
+        "run": run_cfg,
+        "radiometry": radiometry or {},
+        "rfi": rfi or {},
+        "export": {"directory": str(tmp_path / "out"), "save_clean": False},
+    }
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    return config_path
+
+
+def test_run_pipeline_streams_each_dataset_to_disk(tmp_path):
+    written_paths, rfi_infos = run_pipeline(write_config(tmp_path))
+
+    assert len(rfi_infos) == 3
+    assert sorted(path.name for path in written_paths) == [
+        "contaminated_0000.csv",
+        "contaminated_0001.csv",
+        "contaminated_0002.csv",
+        "metadata_0000.json",
+        "metadata_0001.json",
+        "metadata_0002.json",
+    ]
+    metadata = json.loads((tmp_path / "out" / "metadata_0001.json").read_text())
+    assert metadata == rfi_infos[1]
+
+
+def test_iter_datasets_output_does_not_depend_on_worker_count():
+    template = SyntheticRadiometerGenerator.create_default_template()
+    sources = generate_rfi_table(4, ["satellite"], np.random.default_rng(1))
+
+    serial = list(iter_datasets(template, sources, 3, 0.5, np.random.SeedSequence(5), workers=1))
+    parallel = list(iter_datasets(template, sources, 3, 0.5, np.random.SeedSequence(5), workers=2))
+
+    assert len(serial) == len(parallel) == 3
+    for serial_out, parallel_out in zip(serial, parallel):
+        pd.testing.assert_frame_equal(serial_out[0], parallel_out[0])
+        pd.testing.assert_frame_equal(serial_out[1], parallel_out[1])
+        assert serial_out[2] == parallel_out[2]
+
+
+def test_run_pipeline_generates_rttov_datasets_in_memory(tmp_path):
+    radiometry = {
+        "use_rttov": True,
+        "rttov": {
+            "hours": 0.25,
+            "step_seconds": 60,
+            "scan_positions": [[0.0, 20.0], [90.0, 90.0]],
+            "channels_ghz": [22.234, 23.834, 26.234],
+        },
+    }
+
+    written_paths, rfi_infos = run_pipeline(write_config(tmp_path, radiometry=radiometry, n_datasets=2))
+
+    assert len(rfi_infos) == 2
+    first = pd.read_csv(tmp_path / "out" / "contaminated_0000.csv")
+    second = pd.read_csv(tmp_path / "out" / "contaminated_0001.csv")
+    assert list(first.columns[6:]) == ["Ch  22.234", "Ch  23.834", "Ch  26.234"]
+    assert len(first) == 15 * 2
+    assert not np.allclose(first.iloc[:, 6:], second.iloc[:, 6:])
+
+
+def test_run_pipeline_uses_rich_rfi_model_in_worker_processes(tmp_path):
+    rfi = {"model": "rich", "n_sources": 4, "source_classes": ["5G", "Radar Systems"]}
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "parallel").mkdir()
+
+    _, serial_infos = run_pipeline(write_config(tmp_path / "serial", rfi=rfi, workers=1))
+    _, parallel_infos = run_pipeline(write_config(tmp_path / "parallel", rfi=rfi, workers=2))
+
+    assert serial_infos == parallel_infos
+    assert len(serial_infos[0]) == 4
+    assert {info["source_class"] for info in serial_infos[0]} <= {"5G", "Radar Systems"}
+    serial = pd.read_csv(tmp_path / "serial" / "out" / "contaminated_0002.csv")
+    parallel = pd.read_csv(tmp_path / "parallel" / "out" / "contaminated_0002.csv")
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_run_pipeline_shares_cached_template_with_workers(tmp_path):
+    template_path = tmp_path / "template.csv"
+    SyntheticRadiometerGenerator.create_default_template(n_rows=40).to_csv(template_path, index=False)
+    cache_dir = tmp_path / "cache"
+    radiometry = {"base_level1_path": str(template_path), "template_cache_dir": str(cache_dir)}
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "parallel").mkdir()
+
+    run_pipeline(write_config(tmp_path / "serial", radiometry=radiometry, workers=1))
+    run_pipeline(write_config(tmp_path / "parallel", radiometry=radiometry, workers=2))
+
+    assert (cache_dir / f"{template_key(template_path)}.tb.npy").exists()
+    serial = pd.read_csv(tmp_path / "serial" / "out" / "contaminated_0001.csv")
+    parallel = pd.read_csv(tmp_path / "parallel" / "out" / "contaminated_0001.csv")
+    assert len(serial) == 40
+    pd.testing.assert_frame_equal(serial, parallel)
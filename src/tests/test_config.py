@@ -1,4 +1,6 @@
 import json
+import subprocess
+import sys
 
 import pytest
 
@@ -13,6 +15,13 @@ def test_parse_and_validate_config_applies_defaults():
     assert config["run"]["seed"] == 12345
     assert config["composition"]["inject_rfi"] is True
     assert config["rfi_sources"] == []
+    assert config["rfi"] == {"model": "simple", "n_sources": 5, "source_classes": None}
+
+
+def test_parse_and_validate_config_accepts_rich_rfi_classes():
+    config = parse_and_validate_config({"rfi": {"model": "rich", "source_classes": ["5G", "ISM Equipment"]}})
+
+    assert config["rfi"]["source_classes"] == ["5G", "ISM Equipment"]
 
 
 def test_parse_and_validate_config_accepts_valid_rfi_source():
@@ -41,10 +50,20 @@ def test_parse_and_validate_config_accepts_valid_rfi_source():
     [
         {"run": {"seed": "123"}},
         {"run": {"n_datasets": 0}},
+        {"run": {"workers": 0}},
         {"radiometry": {"noise_std_k": -1.0}},
+        {"radiometry": {"rttov": {"step_seconds": 0}}},
+        {"radiometry": {"rttov": {"start_utc": "04/04/2023"}}},
+        {"radiometry": {"rttov": {"scan_positions": [[0.0, 20.0, 1.0]]}}},
+        {"radiometry": {"rttov": {"channels_ghz": []}}},
         {"composition": {"inject_rfi": "yes"}},
         {"export": {"directory": ""}},
+        {"export": {"save_metadata": "yes"}},
         {"rfi_sources": "not-a-list"},
+        {"rfi": {"model": "fancy"}},
+        {"rfi": {"n_sources": 0}},
+        {"rfi": {"source_classes": []}},
+        {"rfi": {"model": "rich", "source_classes": ["satellite", "aircraft", "ground"]}},
     ],
 )
 def test_parse_and_validate_config_rejects_invalid_values(raw_config):
@@ -73,3 +92,13 @@ def test_save_config_writes_json_file(tmp_path):
     assert json.loads(output_path.read_text(encoding="utf-8")) == {
         "project": {"name": "demo"}
     }
+
+
+def test_config_parser_does_not_import_numpy_or_pandas():
+    code = (
+        "import sys, src.config.config_parser; "
+        "print(any(m in sys.modules for m in ('numpy', 'pandas')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,297 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("matplotlib")
+
+import gui_visual
+
+
+RAW_LV1 = (
+    "Record,Date/Time,10,Tamb(K)\n"
+    "Record,Date/Time,40,Tamb(K)\n"
+    "Record,Date/Time,50,Az(deg),El(deg),TkBB(K), Ch  22.000, Ch  23.000, Ch  51.248\n"
+    "2,04/04/23 00:05:22,51,0.00,90.00,306.968,60.065,62.067,112.816\n"
+    "1,04/04/23 00:05:05,51,0.00,19.80,306.972,135.348,138.726,220.119\n"
+    "3,04/04/23 00:05:40,51,45.00,19.80,306.960,148.848,152.626,223.661\n"
+)
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "2023-04-04_00-04-09_lv1.csv").write_text(RAW_LV1, encoding="utf-8")
+    return data_dir
+
+
+def test_clean_lv1_to_df_keeps_band_channels_sorted_by_time(raw_dir):
+    df = gui_visual.clean_lv1_to_df(str(raw_dir / "2023-04-04_00-04-09_lv1.csv"))
+
+    assert list(df.columns) == ["Date/Time", "Az(deg)", "El(deg)", "TkBB(K)", "22.000", "23.000"]
+    assert df["22.000"].tolist() == [135.348, 60.065, 148.848]
+    assert df.index.tolist() == [0, 1, 2]
+
+
+def test_clean_first_file_only_writes_binary_artifact_and_returns_frame(raw_dir, tmp_path):
+    out_dir = tmp_path / "out"
+
+    in_path, clean_path, clean_df = gui_visual.clean_first_file_only(str(raw_dir), str(out_dir))
+
+    assert in_path.endswith("_lv1.csv")
+    assert clean_path.endswith(("_clean.parquet", "_clean.pkl"))
+    assert not list(out_dir.glob("*.xlsx"))
+    pd.testing.assert_frame_equal(gui_visual.load_clean_file(clean_path), clean_df)
+
+
+def test_clean_first_file_only_can_also_export_excel(raw_dir, tmp_path):
+    pytest.importorskip("openpyxl")
+    out_dir = tmp_path / "out"
+
+    _, _, clean_df = gui_visual.clean_first_file_only(str(raw_dir), str(out_dir), export_xlsx=True)
+
+    xlsx = gui_visual.load_clean_file(str(out_dir / "2023-04-04_00-04-09_lv1_clean.xlsx"))
+    pd.testing.assert_frame_equal(xlsx, clean_df, check_dtype=False)
+
+
+class ManualScheduler:
+    """Stands in for root.after: callbacks run only when pumped."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def __call__(self, ms, fn):
+        self.callbacks.append(fn)
+
+    def pump(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for fn in callbacks:
+            fn()
+
+
+def wait_idle(runner):
+    for _ in range(500):
+        if not runner.busy():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("background runner did not finish")
+
+
+@pytest.fixture
+def runner():
+    scheduler = ManualScheduler()
+    progress = []
+    runner = gui_visual.BackgroundRunner(scheduler, on_progress=lambda name, msg: progress.append(msg))
+    runner.scheduler = scheduler
+    runner.progress_messages = progress
+    yield runner
+    runner.shutdown()
+
+
+def test_background_runner_delivers_results_on_poll(runner):
+    results = []
+
+    def work(job):
+        job.progress("halfway")
+        return 42
+
+    runner.submit("plot", work, results.append)
+    wait_idle(runner)
+    assert results == []
+
+    runner.scheduler.pump()
+    assert results == [42]
+    assert runner.progress_messages == ["halfway"]
+
+
+def test_background_runner_coalesces_repeated_submissions(runner):
+    release = threading.Event()
+    started = threading.Event()
+    results = []
+
+    def blocking(job):
+        started.set()
+        release.wait(5)
+        job.check_cancelled()
+        return "first"
+
+    runner.submit("plot", blocking, results.append)
+    started.wait(5)
+    for i in range(5):
+        runner.submit("plot", lambda job, i=i: i, results.append)
+    release.set()
+    wait_idle(runner)
+    runner.scheduler.pump()
+
+    assert results == [4]
+
+
+def test_background_runner_cancel_and_error(runner):
+    errors = []
+    runner.submit("plot", lambda job: 1 / 0, lambda r: None, errors.append)
+    wait_idle(runner)
+    runner.scheduler.pump()
+    assert isinstance(errors[0], ZeroDivisionError)
+
+    release = threading.Event()
+    results = []
+    runner.submit("plot", lambda job: release.wait(5) or "late", results.append)
+    runner.cancel()
+    release.set()
+    wait_idle(runner)
+    runner.scheduler.pump()
+    assert results == []
+
+
+def test_compute_plot_data_filters_direction(raw_dir):
+    df = gui_visual.clean_lv1_to_df(str(raw_dir / "2023-04-04_00-04-09_lv1.csv"))
+    cols, freqs = gui_visual.extract_channels_from_clean(df)
+
+    index = gui_visual.DirectionIndex(df)
+
+    data = gui_visual.compute_plot_data(index, "both", cols, freqs, "22.000", "0", "19.8", False, "5G")
+
+    assert data["freq_mean"].tolist() == [135.348, 138.726]
+    assert data["values"].tolist() == [135.348]
+    with pytest.raises(gui_visual.PlotInfo):
+        gui_visual.compute_plot_data(index, "time", cols, freqs, "22.000", "45", "90", False, "5G")
+
+
+def test_direction_index_slices_match_isclose_filter():
+    rng = np.random.default_rng(0)
+    az = rng.choice([0.0, 45.0, 90.0, np.nan], 200)
+    el = rng.choice([19.8, 90.0, 160.2], 200)
+    df = pd.DataFrame({"Az(deg)": az, "El(deg)": el, "22.000": np.arange(200.0)})
+
+    index = gui_visual.DirectionIndex(df)
+
+    assert index.az_values.tolist() == [0.0, 45.0, 90.0]
+    for a in index.az_values:
+        for e in index.el_values:
+            expected = df[np.isclose(df["Az(deg)"], a, rtol=0, atol=1e-3) & np.isclose(df["El(deg)"], e, rtol=0, atol=1e-3)]
+            pd.testing.assert_frame_equal(index.select(f"{a:.6g}", f"{e:.6g}"), expected)
+
+    only_el = index.select("", "90")
+    pd.testing.assert_frame_equal(only_el, df[df["El(deg)"] == 90.0])
+    assert index.select("10", "90").empty
+
+
+def test_direction_index_without_direction_columns():
+    df = pd.DataFrame({"22.000": [1.0, 2.0, 3.0]})
+
+    index = gui_visual.DirectionIndex(df)
+
+    assert index.az_values.size == 0
+    pd.testing.assert_frame_equal(index.select("(missing)", "(missing)"), df)
+
+
+@pytest.fixture
+def two_day_dir(raw_dir):
+    (raw_dir / "2023-04-05_00-04-09_lv1.csv").write_text(RAW_LV1.replace("04/04/23", "04/05/23"), encoding="utf-8")
+    return raw_dir
+
+
+def test_clean_all_files_joins_days_and_reuses_cache(two_day_dir, tmp_path):
+    out_dir = tmp_path / "out"
+
+    clean_df, report = gui_visual.clean_all_files(str(two_day_dir), str(out_dir), workers=1)
+
+    assert len(clean_df) == 6
+    assert clean_df["Date/Time"].is_monotonic_increasing
+    assert gui_visual.clean_days(clean_df) == ["2023-04-04", "2023-04-05"]
+    assert [r["cached"] for r in report] == [False, False]
+
+    changed = two_day_dir / "2023-04-05_00-04-09_lv1.csv"
+    changed.write_text(RAW_LV1.replace("04/04/23", "04/05/23").replace("60.065", "61.000"), encoding="utf-8")
+
+    again, report = gui_visual.clean_all_files(str(two_day_dir), str(out_dir), workers=1)
+
+    assert [r["cached"] for r in report] == [True, False]
+    assert again["22.000"].tolist()[3:] == [135.348, 61.0, 148.848]
+
+
+def test_clean_all_files_in_worker_processes(two_day_dir, tmp_path):
+    serial, _ = gui_visual.clean_all_files(str(two_day_dir), str(tmp_path / "a"), workers=1)
+    parallel, _ = gui_visual.clean_all_files(str(two_day_dir), str(tmp_path / "b"), workers=2)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+class CancelAfter:
+    # Stand-in for BackgroundJob that is cancelled after n checks
+    def __init__(self, n):
+        self.n = n
+
+    def check_cancelled(self):
+        self.n -= 1
+        if self.n < 0:
+            raise gui_visual.JobCancelled("preprocess")
+
+
+# serial cleaning checks before and after each file, the pool only after
+@pytest.mark.parametrize("workers, checks", [(1, 1), (2, 0)])
+def test_clean_all_files_stops_when_cancelled_and_keeps_finished_files(two_day_dir, tmp_path, workers, checks):
+    out_dir = tmp_path / "out"
+
+    # cancelled right after the first file is cleaned
+    with pytest.raises(gui_visual.JobCancelled):
+        gui_visual.clean_all_files(str(two_day_dir), str(out_dir), workers=workers, job=CancelAfter(checks))
+
+    _, report = gui_visual.clean_all_files(str(two_day_dir), str(out_dir), workers=1)
+    assert sorted(r["cached"] for r in report) == [False, True]
+
+
+def test_direction_index_selects_one_day(two_day_dir, tmp_path):
+    clean_df, _ = gui_visual.clean_all_files(str(two_day_dir), str(tmp_path / "out"), workers=1)
+    index = gui_visual.DirectionIndex(clean_df)
+
+    day = index.select("0", "19.8", "2023-04-05")
+
+    assert day["Date/Time"].dt.strftime("%Y-%m-%d").tolist() == ["2023-04-05"]
+    assert len(index.select("", "", "2023-04-04")) == 3
+    assert len(index.select("", "", gui_visual.ALL_DAYS)) == 6
+
+
+def test_minmax_decimate_keeps_envelope_and_spikes():
+    x = np.arange(10_000.0)
+    y = np.sin(x / 500.0)
+    y[1234] = 50.0
+
+    xd, yd = gui_visual.minmax_decimate(x, y, 100)
+
+    assert len(xd) <= 2 * 100 + 2
+    assert np.all(np.diff(xd) >= 0)
+    assert yd.max() == 50.0 and 1234.0 in xd
+    assert yd.min() == y.min()
+    short_x, short_y = gui_visual.minmax_decimate(x[:50], y[:50], 100)
+    assert len(short_x) == 50
+
+
+def test_decimated_line_redecimates_on_zoom():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(4, 3), dpi=100)
+    line = gui_visual.DecimatedLine(ax, [], [], marker="o")
+    x = np.arange(200_000.0)
+    line.set_series(x, np.cos(x))
+
+    full = line.line.get_xdata()
+    assert len(full) <= 2 * ax.bbox.width + 2
+    assert line.line.get_marker() in ("", "None")
+
+    ax.set_xlim(1000, 1100)
+    zoomed = line.line.get_xdata()
+    assert zoomed[0] >= 999 and zoomed[-1] <= 1101
+    assert line.line.get_marker() == "o"
+    plt.close(fig)
+
+
+def test_rfi_source_options_match_model_classes():
+    from src.models.rich_rfi import RFI_SOURCE_CLASSES
+
+    assert gui_visual.RFI_SOURCE_OPTIONS == list(RFI_SOURCE_CLASSES)
@@ -0,0 +1,131 @@
+import pandas as pd
+import pytest
+
+from src.data import local_radiometric_import as lri
+
+
+LV1_TEXT = (
+    "Record,Date/Time,10,Tamb(K),Rh(%),Pres(mb),Tir(K),Rain,Az(deg),El(deg),TkBB(K), Ch  22.234\n"
+    "Record,Date/Time,40,Tamb(K),Rh(%),Pres(mb),Tir(K),Rain,DataQuality\n"
+    "Record,Date/Time,50,Az(deg),El(deg),TkBB(K), Ch  22.234, Ch  30.000, Ch  51.248\n"
+    "     1,04/04/23 00:04:24,41, 295.0000,  93.8900,1010.2000, 242.3800,0,1\n"
+    "     2,04/04/23 00:05:05,51,  0.00, 19.80,306.972,135.348,138.726,220.119\n"
+    "     3,04/04/23 00:05:22,51,  0.00, 90.00,306.968, 60.065, 62.067,112.816\n"
+    "     4,04/04/23 00:06:22,41, 294.9500,  94.1000,1010.2000, 242.4100,0,1\n"
+    "     5,04/04/23 00:06:44,51, 90.00, 19.80,306.948,135.626,138.484,218.403\n"
+)
+
+
+@pytest.fixture
+def lv1_file(tmp_path):
+    path = tmp_path / "2023-04-04_00-04-09_lv1.csv"
+    path.write_text(LV1_TEXT, encoding="utf-8")
+    return str(path)
+
+
+def test_obtener_header_real_and_detectar_inicio_datos(lv1_file):
+    assert lri.obtener_header_real(lv1_file)[:4] == ["Record", "Date/Time", "50", "Az(deg)"]
+    assert lri.detectar_inicio_datos(lv1_file) == 3
+
+
+def test_separar_por_tipo_splits_records_with_their_headers(lv1_file):
+    tablas = lri.separar_por_tipo(lv1_file)
+
+    assert sorted(tablas) == [40, 50]
+    assert list(tablas[40].columns) == ["Record", "Date/Time", "40", "Tamb(K)", "Rh(%)", "Pres(mb)", "Tir(K)", "Rain", "DataQuality"]
+    assert tablas[40]["Record"].tolist() == [1, 4]
+    assert tablas[50]["Record"].tolist() == [2, 3, 5]
+    assert tablas[50]["Ch  51.248"].tolist() == [220.119, 112.816, 218.403]
+
+
+def test_cargar_csv_radiometro_keeps_sky_rows_up_to_30_ghz(lv1_file):
+    df = lri.cargar_csv_radiometro(lv1_file)
+
+    assert list(df.columns) == ["Record", "Date/Time", "50", "Az(deg)", "El(deg)", "TkBB(K)", "Ch  22.234", "Ch  30.000"]
+    assert df["Record"].tolist() == [2, 3, 5]
+    assert df.index.tolist() == [1, 2, 4]
+    assert df["Az(deg)"].dtype == float
+
+
+def test_cargar_csv_radiometro_rejects_file_without_data(tmp_path):
+    path = tmp_path / "empty_lv1.csv"
+    path.write_text(LV1_TEXT.split("     1,")[0], encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        lri.cargar_csv_radiometro(str(path))
+
+
+def test_demultiplexar_returns_typed_tables(lv1_file):
+    tablas = lri.demultiplexar(lv1_file)
+
+    meteo, tb = tablas[40], tablas[50]
+    assert str(meteo["Date/Time"].dtype).startswith("datetime64")
+    assert meteo["Rain"].dtype == "int64"
+    assert meteo["Tamb(K)"].tolist() == [295.0, 294.95]
+    assert tb["Az(deg)"].dtype == float
+    assert tb.index.tolist() == [0, 1, 2]
+
+
+def test_cargar_con_meteo_joins_nearest_met_record(lv1_file):
+    df = lri.cargar_con_meteo(lv1_file)
+
+    assert df["Record"].tolist() == [2, 3, 5]
+    assert df["Tamb(K)"].tolist() == [295.0, 295.0, 294.95]
+    assert df["Rh(%)"].tolist() == [93.89, 93.89, 94.10]
+
+
+def test_unir_meteo_leaves_gaps_outside_tolerance(lv1_file):
+    tablas = lri.demultiplexar(lv1_file)
+
+    df = lri.unir_meteo(tablas[50], tablas[40], tolerancia="30s")
+
+    assert df["Tamb(K)"].isna().tolist() == [True, True, False]
+
+
+def test_ingesta_masiva_processes_new_files_and_skips_unchanged(tmp_path):
+    entrada = tmp_path / "crudos"
+    salida = tmp_path / "procesados"
+    entrada.mkdir()
+    for fecha in ("2023-04-04", "2023-04-05"):
+        (entrada / f"{fecha}_00-04-09_lv1.csv").write_text(LV1_TEXT, encoding="utf-8")
+
+    reporte = lri.ingesta_masiva(str(entrada), str(salida), workers=2)
+
+    assert [r["fecha"] for r in reporte] == ["2023-04-04", "2023-04-05"]
+    assert [r["filas"] for r in reporte] == [3, 3]
+    assert not any(r["omitido"] for r in reporte)
+    assert pd.read_csv(salida / "2023-04-05.csv")["Record"].tolist() == [2, 3, 5]
+
+    (entrada / "2023-04-05_00-04-09_lv1.csv").write_text(LV1_TEXT + LV1_TEXT.splitlines(True)[-1], encoding="utf-8")
+    reporte = lri.ingesta_masiva(str(entrada), str(salida), workers=1)
+
+    assert [r["omitido"] for r in reporte] == [True, False]
+    assert reporte[1]["filas"] == 4
+
+
+def test_ingesta_masiva_reports_broken_files(tmp_path):
+    entrada = tmp_path / "crudos"
+    entrada.mkdir()
+    (entrada / "2023-04-04_00-04-09_lv1.csv").write_text("sin datos\n", encoding="utf-8")
+
+    reporte = lri.ingesta_masiva(str(entrada), str(tmp_path / "procesados"), workers=1)
+
+    assert "error" in reporte[0]
+    assert lri.cargar_manifiesto(str(tmp_path / "procesados")) == {}
+
+
+def test_ingesta_masiva_can_write_parquet_store(tmp_path):
+    pytest.importorskip("pyarrow")
+    from src.data.processed_store import read_days
+
+    entrada = tmp_path / "crudos"
+    entrada.mkdir()
+    (entrada / "2023-04-04_00-04-09_lv1.csv").write_text(LV1_TEXT, encoding="utf-8")
+    salida = tmp_path / "procesados"
+
+    lri.ingesta_masiva(str(entrada), str(salida), workers=1)
+    reporte = lri.ingesta_masiva(str(entrada), str(salida), workers=1, formato="parquet")
+
+    assert reporte[0]["omitido"] is False
+    assert reporte[0]["salida"].endswith("2023-04-04.parquet")
+    assert read_days(salida, channels=[22.234])["Ch  22.234"].tolist() == pytest.approx([135.348, 60.065, 135.626])
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.data import processed_store as store
+from src.models.radiometry import SyntheticRadiometerGenerator
+
+
+def make_day(record_offset=0):
+    template = SyntheticRadiometerGenerator.create_default_template(n_rows=12, n_channels=4)
+    template["Record"] += record_offset
+    return template
+
+
+def test_write_day_stores_channels_as_float32_and_round_trips(tmp_path):
+    day = make_day()
+
+    path = store.write_day(day, "2023-04-04", tmp_path)
+
+    loaded = pd.read_parquet(path)
+    assert path.name == "2023-04-04.parquet"
+    assert list(loaded.columns) == list(day.columns)
+    assert loaded["Ch  22.000"].dtype == np.float32
+    assert loaded["Az(deg)"].dtype == np.float64
+    np.testing.assert_allclose(loaded.iloc[:, 6:], day.iloc[:, 6:], rtol=1e-6)
+    assert store.available_dates(tmp_path) == ["2023-04-04"]
+
+
+def test_read_days_prunes_dates_channels_and_directions(tmp_path):
+    store.write_day(make_day(), "2023-04-04", tmp_path)
+    store.write_day(make_day(record_offset=100), "2023-04-05", tmp_path)
+
+    df = store.read_days(
+        tmp_path,
+        dates=["2023-04-05"],
+        channels=[22.0, "Ch  30.000"],
+        directions=[(0.0, 19.8), (90.0, 160.2)],
+    )
+
+    assert list(df.columns) == store.METADATA_COLUMNS + ["Ch  22.000", "Ch  30.000"]
+    assert (df["Record"] >= 100).all()
+    assert set(zip(df["Az(deg)"], df["El(deg)"])) == {(0.0, 19.8), (90.0, 160.2)}
+
+
+def test_read_days_loads_everything_by_default(tmp_path):
+    store.write_day(make_day(), "2023-04-04", tmp_path)
+    store.write_day(make_day(record_offset=100), "2023-04-05", tmp_path)
+
+    df = store.read_days(tmp_path)
+
+    assert len(df) == 24
+    assert df["Record"].tolist()[:2] == [2, 3]
+    assert df["Record"].tolist()[-1] == 113
+
+
+def test_convert_csv_dir_and_load_template_read_parquet(tmp_path):
+    make_day().to_csv(tmp_path / "2023-04-04.csv", index=False)
+
+    written = store.convert_csv_dir(tmp_path, tmp_path / "store")
+
+    template = SyntheticRadiometerGenerator.load_template(str(written[0]))
+    assert template.shape == (12, 10)
+
+
+def test_read_days_without_data_raises(tmp_path):
+    with pytest.raises(ValueError):
+        store.read_days(tmp_path)
+
+
+def test_read_days_names_missing_channels(tmp_path):
+    store.write_day(make_day(), "2023-04-04", tmp_path)
+
+    with pytest.raises(ValueError, match="Ch  58.800"):
+        store.read_days(tmp_path, channels=[22.0, 58.8])
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -44,6 +45,41 @@ def test_generate_dataframes_changes_channel_values_without_changing_shape():
     assert not generated.filter(regex=r"^Ch").equals(template.filter(regex=r"^Ch"))
 
 
+def test_iter_dataframes_matches_generate_dataframes():
+    template = SyntheticRadiometerGenerator.create_default_template(n_rows=6, n_channels=3)
+    generator_one = SyntheticRadiometerGenerator(template, noise_std=0.5, seed=7)
+    generator_two = SyntheticRadiometerGenerator(template, noise_std=0.5, seed=7)
+
+    streamed = list(generator_one.iter_dataframes(3))
+    materialized = generator_two.generate_dataframes(3)
+
+    for streamed_df, materialized_df in zip(streamed, materialized):
+        pd.testing.assert_frame_equal(streamed_df, materialized_df)
+
+
+def test_generate_tensor_returns_float32_cube_with_shared_metadata():
+    template = SyntheticRadiometerGenerator.create_default_template(n_rows=6, n_channels=3)
+    generator = SyntheticRadiometerGenerator(template, noise_std=0.5, seed=7)
+
+    cube = generator.generate_tensor(4)
+
+    assert cube.tb.shape == (4, 6, 3)
+    assert cube.tb.dtype == np.float32
+    assert list(cube.metadata.columns) == ["Record", "Date/Time", "50", "Az(deg)", "El(deg)"]
+
+
+def test_generate_tensor_matches_generate_dataframes_in_float64():
+    template = SyntheticRadiometerGenerator.create_default_template(n_rows=6, n_channels=3)
+    generator_one = SyntheticRadiometerGenerator(template, noise_std=0.5, seed=7)
+    generator_two = SyntheticRadiometerGenerator(template, noise_std=0.5, seed=7)
+
+    cube = generator_one.generate_tensor(3, dtype=np.float64)
+    materialized = generator_two.generate_dataframes(3)
+
+    for i, materialized_df in enumerate(materialized):
+        pd.testing.assert_frame_equal(cube.to_dataframe(i), materialized_df)
+
+
 def test_generate_synthetic_dataset_returns_requested_number_of_dataframes():
     dataframes = generate_synthetic_dataset(n_dataframes=2, noise_std=0.1, seed=123)
 
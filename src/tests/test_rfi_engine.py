@@ -0,0 +1,131 @@
+from dataclasses import replace
+
+import numpy as np
+
+from src.models import rfi_engine
+from src.models.rfi_engine import cached_frequency_shape_matrix, frequency_shape_matrix, synthesize_rfi
+from src.models.rfi_generator import RFISourceTable, sample_rfi_source, sample_rfi_table
+from src.models.signal_mixer import angular_coupling, frequency_shape, time_envelope
+
+
+def sampled_sources(n_sources, seed=7):
+    rng = np.random.default_rng(seed)
+    return [sample_rfi_source(rng, "test") for _ in range(n_sources)]
+
+
+def test_frequency_shape_matrix_matches_scalar_shapes():
+    sources = sampled_sources(6)
+    freqs = np.linspace(22.0, 30.0, 21)
+    table = RFISourceTable.from_dicts(sources)
+
+    matrix = frequency_shape_matrix(
+        freqs,
+        table.center_ghz,
+        table.bandwidth_ghz,
+        table.spectral_shape_code,
+    )
+
+    expected = np.array(
+        [
+            frequency_shape(
+                freqs, s["center_ghz"], s["bandwidth_ghz"], s["spectral_shape"]
+            )
+            for s in sources
+        ]
+    )
+    np.testing.assert_allclose(matrix, expected)
+
+
+def test_synthesize_rfi_matches_per_source_accumulation():
+    sources = sampled_sources(12)
+    freqs = np.linspace(22.0, 30.0, 8)
+    az = np.tile([0.0, 45.0, 90.0, 135.0], 10)
+    el = np.tile([19.8, 90.0, 160.2, 90.0], 10)
+
+    total, details = synthesize_rfi(
+        freqs, az, el, RFISourceTable.from_dicts(sources), np.random.default_rng(3),
+        return_per_source=True,
+    )
+
+    rng = np.random.default_rng(3)
+    expected = np.zeros((len(az), len(freqs)))
+    for s in sources:
+        t_env = time_envelope(
+            len(az), s["avg_power_K"], s["peak_power_K"], s["modulation"], rng
+        )
+        f_shape = frequency_shape(
+            freqs, s["center_ghz"], s["bandwidth_ghz"], s["spectral_shape"]
+        )
+        coupling = np.array(
+            [
+                angular_coupling(a, e, s["az_deg"], s["el_deg"], s["sigma_deg"])
+                for a, e in zip(az, el)
+            ]
+        )
+        expected += t_env[:, None] * f_shape[None, :] * coupling[:, None]
+
+    np.testing.assert_allclose(total, expected)
+    assert details["per_source"].shape == (12, len(az), len(freqs))
+    np.testing.assert_allclose(details["per_source"].sum(axis=0), total)
+
+
+def test_synthesize_rfi_omits_per_source_by_default():
+    _, details = synthesize_rfi(
+        np.array([22.0, 23.0]),
+        np.zeros(3),
+        np.zeros(3),
+        RFISourceTable.from_dicts(sampled_sources(2)),
+        np.random.default_rng(0),
+    )
+
+    assert "per_source" not in details
+    assert details["coupling"].shape == (2, 3)
+
+
+def test_cached_frequency_shape_matrix_reuses_matrix_per_grid_and_sources():
+    rfi_engine.clear_shape_cache()
+    table = sample_rfi_table(np.random.default_rng(1), 6, ["satellite"])
+    freqs = np.linspace(22.0, 30.0, 21)
+
+    first = cached_frequency_shape_matrix(freqs, table)
+    again = cached_frequency_shape_matrix(freqs.copy(), table)
+    other_grid = cached_frequency_shape_matrix(freqs[:10], table)
+    table.center_ghz = table.center_ghz + 0.5
+    moved = cached_frequency_shape_matrix(freqs, table)
+
+    assert again is first
+    assert not first.flags.writeable
+    np.testing.assert_allclose(other_grid, first[:, :10])
+    np.testing.assert_allclose(
+        moved,
+        frequency_shape_matrix(freqs, table.center_ghz, table.bandwidth_ghz, table.spectral_shape_code),
+    )
+
+
+def test_cached_frequency_shape_matrix_evicts_least_recently_used(monkeypatch):
+    rfi_engine.clear_shape_cache()
+    freqs = np.linspace(22.0, 30.0, 8)
+    tables = [sample_rfi_table(np.random.default_rng(seed), 4, ["ground"]) for seed in range(3)]
+    # room for two 4 x 8 float64 matrices
+    monkeypatch.setattr(rfi_engine, "SHAPE_CACHE_MAX_BYTES", 2 * 4 * 8 * 8)
+
+    first = cached_frequency_shape_matrix(freqs, tables[0])
+    second = cached_frequency_shape_matrix(freqs, tables[1])
+    assert cached_frequency_shape_matrix(freqs, tables[0]) is first
+    cached_frequency_shape_matrix(freqs, tables[2])
+
+    assert cached_frequency_shape_matrix(freqs, tables[0]) is first
+    assert cached_frequency_shape_matrix(freqs, tables[1]) is not second
+    assert len(rfi_engine._SHAPE_CACHE) == 2
+
+
+def test_cached_frequency_shape_matrix_shares_entry_for_same_spectra():
+    rfi_engine.clear_shape_cache()
+    table = sample_rfi_table(np.random.default_rng(1), 4, ["satellite"])
+    freqs = np.linspace(22.0, 30.0, 8)
+    first = cached_frequency_shape_matrix(freqs, table)
+
+    louder = replace(table, peak_power_K=table.peak_power_K * 2, az_deg=table.az_deg + 10)
+
+    assert cached_frequency_shape_matrix(freqs, louder) is first
+    assert len(rfi_engine._SHAPE_CACHE) == 1
@@ -2,10 +2,13 @@ import numpy as np
 import pytest
 
 from src.models.rfi_generator import (
+    MODULATIONS,
+    RFISourceTable,
     add_rfi,
     angular_coupling,
     frequency_shape,
     sample_rfi_source,
+    sample_rfi_table,
     time_envelope,
 )
 
@@ -81,6 +84,34 @@ def test_sample_rfi_source_is_reproducible_with_seed():
     assert source_one["source_class"] == "satellite"
 
 
+def test_sample_rfi_table_draws_columns_within_source_ranges():
+    table = sample_rfi_table(np.random.default_rng(42), 1000, ["satellite", "aircraft"])
+
+    assert len(table) == 1000
+    assert table.classes == ("satellite", "aircraft")
+    assert set(np.unique(table.source_class)) == {0, 1}
+    assert table.center_ghz.min() >= 22 and table.center_ghz.max() < 30
+    assert table.el_deg.min() >= 0 and table.el_deg.max() < 90
+    assert set(table.modulation.tolist()) == set(MODULATIONS)
+
+
+def test_sample_rfi_table_is_reproducible_with_seed():
+    table_one = sample_rfi_table(np.random.default_rng(7), 5, ["satellite"])
+    table_two = sample_rfi_table(np.random.default_rng(7), 5, ["satellite"])
+
+    assert table_one.to_dicts() == table_two.to_dicts()
+
+
+def test_rfi_source_table_round_trips_through_dicts():
+    rng = np.random.default_rng(3)
+    sources = [sample_rfi_source(rng, c) for c in ["satellite", "ground", "satellite"]]
+
+    table = RFISourceTable.from_dicts(sources)
+
+    assert table.classes == ("satellite", "ground")
+    assert table.to_dicts() == sources
+
+
 def test_add_rfi_returns_contaminated_data_and_metadata():
     rng = np.random.default_rng(123)
     data = np.zeros((3, 4))
@@ -0,0 +1,154 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models import rich_rfi
+from src.models.radiometry import SyntheticRadiometerGenerator
+
+
+def test_import_does_not_load_gui_libraries():
+    code = (
+        "import sys, src.models.rich_rfi; "
+        "print(any(m in sys.modules for m in ('tkinter', 'matplotlib')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("n_bursts", [1, 10, 200, 10_000])
+def test_place_bursts_never_overlaps(n_bursts):
+    rng = np.random.default_rng(3)
+
+    starts = rich_rfi._place_bursts(1000, 5, n_bursts, rng)
+
+    assert len(starts) == min(n_bursts, 199)
+    assert np.all(np.diff(starts) >= 5)
+    assert starts.min() >= 0 and starts.max() < 1000 - 5
+
+
+def test_bursty_envelope_reaches_high_duty_cycle():
+    rng = np.random.default_rng(0)
+
+    envelope, _ = rich_rfi.build_temporal_envelope(
+        t_len=2000, dt_seconds=1.0, duty_cycle=0.9, pulse_width_s=5.0, repetition_rate_hz=0.1,
+        average_power_K=30.0, peak_power_K=80.0, modulation_scheme="bursty", rng=rng
+    )
+
+    assert np.mean(envelope > 0) >= 0.9
+
+
+def test_build_pulse_trains_batch_hits_each_target():
+    rng = np.random.default_rng(1)
+
+    envelope = rich_rfi.build_pulse_trains(
+        1000, [2, 5, 10], [10, 10, 20], [100, 800, 500], [30.0, 30.0, 30.0], [80.0, 80.0, 80.0], rng
+    )
+
+    assert envelope.shape == (3, 1000)
+    assert (envelope > 0).sum(axis=1).tolist() == [100, 800, 500]
+    assert envelope.max() <= 80.0
+
+
+def test_build_pulse_trains_is_periodic_when_target_matches():
+    # seed 1 draws phase 4, so all ten pulses fit and no padding is needed
+    rng = np.random.default_rng(1)
+
+    envelope = rich_rfi.build_pulse_trains(100, 3, 10, 30, 30.0, 80.0, rng)[0]
+
+    on = np.flatnonzero(envelope > 0)
+    starts = on[np.diff(np.concatenate(([-2], on))) > 1]
+    assert len(on) == 30
+    assert np.all(np.diff(starts) == 10)
+    # one amplitude per pulse
+    assert len(np.unique(envelope[on])) == len(starts)
+
+
+SOURCE_KEYS = {
+    "source_class", "center_ghz", "bandwidth_mhz", "bandwidth_ghz", "spectral_shape", "duty_cycle",
+    "pulse_width_s", "repetition_rate_hz", "modulation_scheme", "peak_power_K", "average_power_K",
+    "psd_like_K_per_ghz", "rfi_az_deg", "rfi_el_deg", "angular_sigma_deg", "distance_km",
+    "antenna_gain_factor", "propagation_path", "polarization_type", "polarization_factor",
+    "emission_type", "licensed", "compliance", "protected_band_overlap",
+}
+
+
+@pytest.mark.parametrize("source_class", rich_rfi.RFI_SOURCE_CLASSES)
+def test_sample_rfi_source_follows_class_table(source_class):
+    rng = np.random.default_rng(0)
+    spec = rich_rfi.RFI_CLASS_TABLE[source_class]
+
+    source = rich_rfi.sample_rfi_source(rng, source_class)
+
+    assert set(source) == SOURCE_KEYS
+    assert source["source_class"] == source_class
+    assert source["modulation_scheme"] in spec["modulation_scheme"]
+    assert source["bandwidth_mhz"] in spec["bandwidth_mhz"]
+    _, _, _, lo, hi = spec["center_ghz"]
+    assert lo <= source["center_ghz"] <= hi
+    assert source["average_power_K"] <= source["peak_power_K"]
+
+
+def test_sample_rfi_sources_draws_mixed_classes_in_one_table():
+    rng = np.random.default_rng(0)
+
+    table = rich_rfi.sample_rfi_sources(rng, 50_000, class_weights={"5G": 3.0, "Radar Systems": 1.0})
+    df = table.to_dataframe()
+
+    assert len(table) == 50_000
+    assert df["source_class"].dtype == "category"
+    share = df["source_class"].value_counts(normalize=True)
+    assert abs(share["5G"] - 0.75) < 0.01
+    radar = df[df["source_class"] == "Radar Systems"]
+    assert set(radar["emission_type"]) == {"intentional"}
+    assert abs((radar["modulation_scheme"] == "pulsed").mean() - 0.45) < 0.02
+    assert np.all(table["licensed"])
+
+
+def test_sample_rfi_sources_rejects_unknown_class_weights():
+    with pytest.raises(ValueError):
+        rich_rfi.sample_rfi_sources(np.random.default_rng(0), 10, class_weights={"Satellite": 1.0})
+
+
+def test_add_rich_rfi_to_dataframe_adds_every_source():
+    df = SyntheticRadiometerGenerator.create_default_template(n_rows=200)
+    clean = df.copy()
+    freq_cols = [col for col in df.columns if col.startswith("Ch ")]
+    rng = np.random.default_rng(4)
+    sources = rich_rfi.sample_rfi_sources(rng, 8)
+
+    df, infos = rich_rfi.add_rich_rfi_to_dataframe(df, sources, rng)
+
+    assert len(infos) == 8
+    assert {"power", "avg_coupling", "actual_duty_cycle"} <= set(infos[0])
+    added = df[freq_cols].to_numpy() - clean[freq_cols].to_numpy()
+    assert np.all(added >= 0) and added.max() > 0
+    assert df.drop(columns=freq_cols).equals(clean.drop(columns=freq_cols))
+
+
+def test_add_rich_rfi_to_dataframe_matches_single_source_model():
+    # One source at a fixed pointing gives the same RFI as add_rfi_to_df
+    df = SyntheticRadiometerGenerator.create_default_template(n_rows=120)
+    df["Az(deg)"] = 30.0
+    df["El(deg)"] = 45.0
+    freq_cols = [col for col in df.columns if col.startswith("Ch ")]
+    freqs = np.array([float(col.split()[1]) for col in freq_cols])
+    table = rich_rfi.sample_rfi_sources(np.random.default_rng(2), 1, source_class="Radar Systems")
+
+    expected, _ = rich_rfi.add_rfi_to_df(
+        df, freq_cols, freqs, table.row(0), 30.0, 45.0, np.random.default_rng(9)
+    )
+    result, _ = rich_rfi.add_rich_rfi_to_dataframe(df.copy(), table, np.random.default_rng(9))
+
+    np.testing.assert_allclose(result[freq_cols].to_numpy(), expected[freq_cols].to_numpy())
+
+
+def test_add_rich_rfi_to_dataframe_requires_channels():
+    df = pd.DataFrame({"Az(deg)": [0.0], "El(deg)": [90.0]})
+    rng = np.random.default_rng(0)
+
+    with pytest.raises(ValueError):
+        rich_rfi.add_rich_rfi_to_dataframe(df, rich_rfi.sample_rfi_sources(rng, 1), rng)
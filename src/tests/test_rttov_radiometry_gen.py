@@ -0,0 +1,236 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.models import RTTOV_radiometry_gen as rttov
+
+
+SCAN_POSITIONS = [(0.0, 20.0), (0.0, 90.0), (45.0, 160.0)]
+
+
+def scalar_states(n_hours=24, seed=3):
+    rng = random.Random(seed)
+    states = []
+    for hour in range(n_hours):
+        t = datetime(2024, 1, 1, hour, 17)
+        met = rttov.build_surface_met(t, rng)
+        states.append(rttov.build_atmosphere_state(met, t, rng))
+    return states
+
+
+def as_arrays(states):
+    return rttov.AtmosphereArrays(
+        surface_temp_k=np.array([s.surface_temp_k for s in states]),
+        vapor_scale=np.array([s.vapor_scale for s in states]),
+        liquid_scale=np.array([s.liquid_scale for s in states]),
+        lapse_rate_k_per_km=np.array([s.lapse_rate_k_per_km for s in states]),
+        inversion_strength_k=np.array([s.inversion_strength_k for s in states]),
+    )
+
+
+def test_clear_sky_tb_array_matches_scalar_reference():
+    states = scalar_states()
+    elevations = [20.0, 45.0, 90.0, 160.0]
+
+    array_tb = rttov.clear_sky_tb_array(rttov.ALL_CHANNELS_GHZ, as_arrays(states), elevations)
+
+    scalar_tb = np.array(
+        [
+            [[rttov.clear_sky_tb(f, s, e) for f in rttov.ALL_CHANNELS_GHZ] for e in elevations]
+            for s in states
+        ]
+    )
+    assert array_tb.shape == (24, 4, len(rttov.ALL_CHANNELS_GHZ))
+    np.testing.assert_allclose(array_tb, scalar_tb, rtol=1e-12)
+
+
+def test_synthetic_tb_adds_noise_to_clear_sky_value():
+    state = scalar_states(n_hours=1)[0]
+
+    tb = rttov.synthetic_tb(23.834, state, 90.0, random.Random(1))
+
+    expected = rttov.clear_sky_tb(23.834, state, 90.0) + random.Random(1).gauss(0.0, 0.18)
+    assert tb == pytest.approx(expected)
+
+
+def test_simulate_level1_arrays_covers_same_time_steps_as_csv_loop():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    arrays = rttov.simulate_level1_arrays(start, 0.5, 7, SCAN_POSITIONS, seed=1)
+
+    n_loop = 0
+    current = start
+    while current < start + timedelta(hours=0.5):
+        n_loop += 1
+        current += timedelta(seconds=7)
+    assert arrays.tb_k.shape == (n_loop, 3, len(rttov.ALL_CHANNELS_GHZ))
+    assert arrays.times[1] - arrays.times[0] == np.timedelta64(7, "s")
+    assert arrays.tb_k.min() >= 2.7 and arrays.tb_k.max() <= 400.0
+
+
+def test_simulate_level1_arrays_is_reproducible_and_chunk_independent():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    one = rttov.simulate_level1_arrays(start, 1.0, 60, SCAN_POSITIONS, seed=5)
+    two = rttov.simulate_level1_arrays(start, 1.0, 60, SCAN_POSITIONS, seed=5, chunk_steps=7)
+
+    np.testing.assert_array_equal(one.tb_k, two.tb_k)
+    np.testing.assert_array_equal(one.met.tamb_c, two.met.tamb_c)
+
+
+def small_arrays():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return rttov.simulate_level1_arrays(start, 0.25, 60, SCAN_POSITIONS, seed=2)
+
+
+def test_write_level1_arrays_csv_keeps_schema_and_record_layout(tmp_path):
+    pd = pytest.importorskip("pandas")
+    arrays = small_arrays()
+    path = tmp_path / "lv1.csv"
+
+    rttov.write_level1_arrays_csv(path, arrays, chunk_seconds=300)
+
+    df = pd.read_csv(path)
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+    assert list(df.columns) == rttov.LEVEL1_COLUMNS
+    assert len(df) == n_time * (1 + n_scan * n_chan)
+    assert df["record_no"].tolist() == list(range(1, len(df) + 1))
+    assert df["record_type"].iloc[0] == 41
+    assert df["datetime_utc"].iloc[0] == "01/01/2024 00:00:00"
+
+    tb = df[df["record_type"] == 51]
+    np.testing.assert_allclose(
+        tb["tb_k"].to_numpy().reshape(arrays.tb_k.shape), arrays.tb_k, atol=5e-5
+    )
+    assert tb["channel_mhz"].iloc[0] == rttov.channel_to_mhz(rttov.ALL_CHANNELS_GHZ[0])
+    assert tb["azimuth_deg"].iloc[n_chan] == SCAN_POSITIONS[1][0]
+    assert tb["elevation_deg"].iloc[n_chan] == SCAN_POSITIONS[1][1]
+
+
+def test_write_level1_arrays_csv_is_chunk_independent(tmp_path):
+    arrays = small_arrays()
+
+    rttov.write_level1_arrays_csv(tmp_path / "a.csv", arrays, chunk_seconds=60)
+    rttov.write_level1_arrays_csv(tmp_path / "b.csv", arrays)
+
+    assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+
+
+def test_write_level1_npz_round_trips_arrays(tmp_path):
+    arrays = small_arrays()
+
+    rttov.write_level1(tmp_path / "lv1.npz", arrays)
+
+    with np.load(tmp_path / "lv1.npz") as data:
+        np.testing.assert_array_equal(data["tb_k"], arrays.tb_k)
+        np.testing.assert_array_equal(data["times"], arrays.times)
+        np.testing.assert_array_equal(data["rain_flag"], arrays.met.rain_flag)
+
+
+def test_write_level1_parquet_matches_csv_table(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    arrays = small_arrays()
+
+    rttov.write_level1(tmp_path / "lv1.parquet", arrays)
+    rttov.write_level1(tmp_path / "lv1.csv", arrays)
+
+    parquet = pd.read_parquet(tmp_path / "lv1.parquet")
+    csv = pd.read_csv(tmp_path / "lv1.csv")
+    assert list(parquet.columns) == rttov.LEVEL1_COLUMNS
+    assert len(parquet) == len(csv)
+    np.testing.assert_array_equal(parquet["record_type"], csv["record_type"])
+    np.testing.assert_allclose(parquet["tb_k"], csv["tb_k"], atol=5e-5)
+    assert parquet["channel_mhz"].isna().sum() == arrays.tb_k.shape[0]
+
+
+def test_write_level1_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        rttov.write_level1(tmp_path / "lv1.txt", small_arrays())
+
+
+def test_level1_wide_dataframe_has_radiometer_layout():
+    pytest.importorskip("pandas")
+    arrays = small_arrays()
+    n_time, n_scan, n_chan = arrays.tb_k.shape
+
+    df = rttov.level1_wide_dataframe(arrays)
+
+    assert list(df.columns[:6]) == rttov.WIDE_COLUMNS
+    assert df.columns[6] == "Ch  22.234"
+    assert df.shape == (n_time * n_scan, 6 + n_chan)
+    assert df["Date/Time"].iloc[0] == "01/01/24 00:00:00"
+    assert (df["50"] == 51).all()
+    assert df["Az(deg)"].iloc[n_scan + 1] == SCAN_POSITIONS[1][0]
+    assert df["El(deg)"].iloc[n_scan + 1] == SCAN_POSITIONS[1][1]
+    np.testing.assert_allclose(df["TkBB(K)"].iloc[0], arrays.met.tamb_c[0] + 273.15)
+    np.testing.assert_array_equal(df.iloc[:, 6:].to_numpy(), arrays.tb_k.reshape(-1, n_chan))
+
+
+def test_level1_wide_dataframe_feeds_mix_signals():
+    pytest.importorskip("pandas")
+    from src.models.signal_mixer import generate_rfi_table, mix_signals
+
+    df = rttov.level1_wide_dataframe(small_arrays())
+    rng = np.random.default_rng(0)
+
+    mixed, infos = mix_signals(df, generate_rfi_table(3, ["wifi"], rng), rng)
+
+    assert mixed.shape == df.shape
+    assert not np.allclose(mixed.iloc[:, 6:].to_numpy(), df.iloc[:, 6:].to_numpy())
+    assert len(infos[0]) == 3
+
+
+def test_write_level1_wide_csv_matches_dataframe(tmp_path):
+    pd = pytest.importorskip("pandas")
+    arrays = small_arrays()
+
+    rttov.write_level1(tmp_path / "wide.csv", arrays, layout="wide")
+    rttov.write_level1_wide_csv(tmp_path / "chunked.csv", arrays, chunk_seconds=60)
+
+    csv = pd.read_csv(tmp_path / "wide.csv", dtype={"Date/Time": str})
+    expected = rttov.level1_wide_dataframe(arrays)
+    assert list(csv.columns) == list(expected.columns)
+    assert csv["Date/Time"].tolist() == expected["Date/Time"].tolist()
+    np.testing.assert_allclose(csv.iloc[:, 6:], expected.iloc[:, 6:], atol=5e-5)
+    assert (tmp_path / "wide.csv").read_bytes() == (tmp_path / "chunked.csv").read_bytes()
+
+
+def test_wide_csv_is_much_smaller_than_long_csv(tmp_path):
+    arrays = small_arrays()
+
+    rttov.write_level1(tmp_path / "long.csv", arrays)
+    rttov.write_level1(tmp_path / "wide.csv", arrays, layout="wide")
+
+    assert (tmp_path / "wide.csv").stat().st_size * 4 < (tmp_path / "long.csv").stat().st_size
+
+
+def test_generate_level1_dataframe_follows_config_and_seed():
+    pytest.importorskip("pandas")
+    cfg = {
+        "hours": 0.5,
+        "step_seconds": 300,
+        "start_utc": "2024-01-01T00:00:00",
+        "scan_positions": [[45.0, 20.0]],
+        "channels_ghz": [22.234, 51.248],
+    }
+
+    df = rttov.generate_level1_dataframe(cfg, np.random.SeedSequence(3))
+    again = rttov.generate_level1_dataframe(cfg, np.random.SeedSequence(3))
+
+    assert list(df.columns[6:]) == ["Ch  22.234", "Ch  51.248"]
+    assert len(df) == 6
+    assert (df["Az(deg)"] == 45.0).all()
+    assert df["Date/Time"].iloc[1] == "01/01/24 00:05:00"
+    np.testing.assert_array_equal(df.to_numpy(), again.to_numpy())
+
+
+def test_main_takes_arguments_instead_of_sys_argv(tmp_path):
+    output = tmp_path / "lv1.npz"
+
+    rttov.main(["--output", str(output), "--hours", "0.1", "--start-utc", "2024-01-01T00:00:00"])
+
+    with np.load(output) as data:
+        assert data["tb_k"].shape == (6, len(rttov.DEFAULT_SCAN_POSITIONS), len(rttov.ALL_CHANNELS_GHZ))
@@ -7,7 +7,11 @@ import pytest
 from src.export.export_data import save_data, save_file
 from src.models.signal_mixer import (
     add_rfi_to_dataframe,
+    angular_coupling,
+    angular_coupling_matrix,
     generate_rfi_sources,
+    generate_rfi_table,
+    iter_mixed,
     mix_signals,
 )
 
@@ -52,6 +56,28 @@ def test_generate_rfi_sources_returns_requested_count():
     )
 
 
+def test_angular_coupling_matrix_matches_scalar_coupling():
+    pointing_az = np.array([0.0, 45.0, 90.0, 135.0])
+    pointing_el = np.array([19.8, 90.0, 160.2, 19.8])
+    source_az = np.array([10.0, 100.0])
+    source_el = np.array([30.0, 150.0])
+    sigma = np.array([5.0, 0.1])
+
+    matrix = angular_coupling_matrix(pointing_az, pointing_el, source_az, source_el, sigma)
+
+    expected = np.array(
+        [
+            [
+                angular_coupling(az, el, s_az, s_el, s_sigma)
+                for az, el in zip(pointing_az, pointing_el)
+            ]
+            for s_az, s_el, s_sigma in zip(source_az, source_el, sigma)
+        ]
+    )
+    assert matrix.shape == (2, 4)
+    np.testing.assert_allclose(matrix, expected)
+
+
 def test_add_rfi_to_dataframe_updates_channel_values_and_metadata():
     rng = np.random.default_rng(123)
     df = sample_dataframe()
@@ -76,6 +102,21 @@ def test_add_rfi_to_dataframe_rejects_data_without_frequency_channels():
         add_rfi_to_dataframe(df, [sample_source()], np.random.default_rng(123))
 
 
+def test_mix_signals_accepts_columnar_source_table():
+    table = generate_rfi_table(4, ["satellite"], np.random.default_rng(5))
+    df = pd.concat([sample_dataframe()] * 20, ignore_index=True)
+
+    mixed_from_table, infos_from_table = mix_signals(
+        df, table, np.random.default_rng(9)
+    )
+    mixed_from_dicts, infos_from_dicts = mix_signals(
+        df, table.to_dicts(), np.random.default_rng(9)
+    )
+
+    pd.testing.assert_frame_equal(mixed_from_table, mixed_from_dicts)
+    assert infos_from_table == infos_from_dicts
+
+
 def test_mix_signals_preserves_single_dataframe_return_shape():
     mixed_df, infos = mix_signals(
         sample_dataframe(),
@@ -88,6 +129,18 @@ def test_mix_signals_preserves_single_dataframe_return_shape():
     assert len(infos[0]) == 1
 
 
+def test_iter_mixed_yields_clean_and_contaminated_pairs_lazily():
+    frames = (sample_dataframe() for _ in range(2))
+
+    mixed = iter_mixed(frames, [sample_source()], np.random.default_rng(123))
+    clean, contaminated, infos = next(mixed)
+
+    pd.testing.assert_frame_equal(clean, sample_dataframe())
+    assert contaminated["Ch 23.000"].min() > 100.0
+    assert len(infos) == 1
+    assert len(list(mixed)) == 1
+
+
 def test_save_data_writes_string_dataframe_and_json(tmp_path):
     text_path = save_data("hello", tmp_path / "text.txt")
     csv_path = save_data(sample_dataframe(), tmp_path / "data.csv")
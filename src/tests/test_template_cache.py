@@ -0,0 +1,104 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from src.models.radiometry import SyntheticRadiometerGenerator
+from src.models.template_cache import CachedTemplate, load_cached_template, template_key
+
+
+def write_template(tmp_path, name="template.csv"):
+    path = tmp_path / name
+    SyntheticRadiometerGenerator.create_default_template(n_rows=10, n_channels=5).to_csv(path, index=False)
+    return path
+
+
+def test_load_cached_template_converts_once_and_memory_maps(tmp_path):
+    path = write_template(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    first = load_cached_template(path, cache_dir)
+    tb_file = cache_dir / f"{template_key(path)}.tb.npy"
+    mtime = tb_file.stat().st_mtime_ns
+    second = load_cached_template(path, cache_dir)
+
+    assert isinstance(second.tb, np.memmap)
+    assert not second.tb.flags.writeable
+    assert tb_file.stat().st_mtime_ns == mtime
+    pd.testing.assert_frame_equal(first.to_dataframe(), pd.read_csv(path))
+
+
+def test_template_key_follows_content_not_name(tmp_path):
+    a = write_template(tmp_path, "a.csv")
+    b = write_template(tmp_path, "b.csv")
+
+    assert template_key(a) == template_key(b)
+
+    b.write_text(b.read_text() + "\n")
+    assert template_key(a) != template_key(b)
+
+
+def test_cached_template_pickles_without_the_matrix(tmp_path):
+    cached = load_cached_template(write_template(tmp_path), tmp_path / "cache")
+
+    restored = pickle.loads(pickle.dumps(cached))
+
+    assert "tb" not in cached.__getstate__()
+    assert isinstance(restored.tb, np.memmap)
+    np.testing.assert_array_equal(restored.tb, cached.tb)
+
+
+def test_generator_gives_same_output_from_cached_template(tmp_path):
+    path = write_template(tmp_path)
+    cached = load_cached_template(path, tmp_path / "cache")
+    template = pd.read_csv(path)
+
+    from_frame = SyntheticRadiometerGenerator(template, noise_std=1.0, seed=3)
+    from_cache = SyntheticRadiometerGenerator(cached, noise_std=1.0, seed=3)
+
+    for a, b in zip(from_frame.generate_dataframes(2), from_cache.generate_dataframes(2)):
+        pd.testing.assert_frame_equal(a, b)
+
+    cube_frame = SyntheticRadiometerGenerator(template, noise_std=1.0, seed=4).generate_tensor(3, np.float64)
+    cube_cache = SyntheticRadiometerGenerator(cached, noise_std=1.0, seed=4).generate_tensor(3, np.float64)
+    np.testing.assert_array_equal(cube_frame.tb, cube_cache.tb)
+    pd.testing.assert_frame_equal(cube_frame.to_dataframe(2), cube_cache.to_dataframe(2))
+    assert isinstance(cached, CachedTemplate)
+
+
+def test_generator_never_copies_cached_template(tmp_path, monkeypatch):
+    cached = load_cached_template(write_template(tmp_path), tmp_path / "cache")
+
+    def copy_whole_template(self):
+        raise AssertionError("template matrix was copied")
+
+    monkeypatch.setattr(CachedTemplate, "to_dataframe", copy_whole_template)
+
+    frames = SyntheticRadiometerGenerator(cached, noise_std=1.0, seed=3).generate_dataframes(2)
+
+    assert len(frames) == 2
+
+
+def test_unreadable_cache_entry_is_rebuilt(tmp_path):
+    path = write_template(tmp_path)
+    cache_dir = tmp_path / "cache"
+    load_cached_template(path, cache_dir)
+
+    (cache_dir / f"{template_key(path)}.meta.npz").write_bytes(b"not an npz file")
+    rebuilt = load_cached_template(path, cache_dir)
+
+    assert not list(cache_dir.glob("*.pkl"))
+    pd.testing.assert_frame_equal(rebuilt.to_dataframe(), pd.read_csv(path))
+
+
+def test_cached_template_keeps_missing_strings_and_absolute_path(tmp_path, monkeypatch):
+    template = SyntheticRadiometerGenerator.create_default_template(n_rows=6, n_channels=3)
+    template.loc[2, "Date/Time"] = None
+    path = tmp_path / "gaps.csv"
+    template.to_csv(path, index=False)
+    monkeypatch.chdir(tmp_path)
+
+    cached = load_cached_template(path, "relative_cache")
+
+    assert cached.tb_path.is_absolute()
+    pd.testing.assert_frame_equal(cached.to_dataframe(), pd.read_csv(path))